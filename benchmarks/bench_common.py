@@ -0,0 +1,297 @@
+import atexit
+import json
+import logging
+import os
+import platform
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+
+from commons.funcs_common import get_cdcbench_version
+from commons.mgr_logger import LoggerManager
+
+from datetime import datetime
+from sqlalchemy import create_engine, event, Column, Integer, MetaData, Sequence, String, Table
+from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.types import TypeDecorator
+
+
+# 결과 파일 경로는 실행한 위치 기준으로 사용
+_invocation_dir = os.getcwd()
+
+# Working Directory를 cdcbench로 변경 (data, definitions 디렉토리를 상대경로로 사용)
+os.chdir(os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+
+# Log 파일 등 벤치마크 수행 중 생성되는 파일은 임시 디렉토리에 생성하고 종료시 삭제
+work_dir = tempfile.mkdtemp(prefix="cdcbench_")
+atexit.register(shutil.rmtree, work_dir, ignore_errors=True)
+
+LoggerManager.set_logs_dir(os.path.join(work_dir, "logs"))
+LoggerManager.set_log_level(logging.ERROR)
+LoggerManager.set_sql_log_level(logging.ERROR)
+LoggerManager.set_pool_log_level(logging.ERROR)
+
+
+class OfflineConnection:
+    """
+    DB 연결 없이 MapperManager를 사용하기 위한 Connection 대용 Class
+    """
+
+    def __init__(self, dbms_type, engine=None):
+        """
+        :param dbms_type: Mapper를 생성할 DBMS Type
+        :param engine: Session에 연결할 engine Object (None일 경우 연결하지 않음)
+        """
+
+        self.dbms_type = dbms_type
+        self.schema_name = ""
+        self.engine = engine
+        self.db_session = scoped_session(sessionmaker(autocommit=False, bind=engine))
+
+
+class DbTimer:
+    """
+    SQLite DBAPI 호출 (execute, fetch, commit, rollback)에 소요된 시간과 횟수를 누적.
+    전체 수행시간에서 DB 소요시간을 제외하여 CDCBENCH 자체 (Client) 소요시간을 계산하는 데 사용.
+    Connection Pool 반환시 수행되는 Rollback (reset on return)은 시간에만 포함하고 Rollback 횟수에서 제외함
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.db_time = 0.0
+            self.executions = 0
+            self.commits = 0
+            self.rollbacks = 0
+
+    def add(self, elapsed_time, execution=False, commit=False, rollback=False):
+        with self._lock:
+            self.db_time += elapsed_time
+            self.executions += 1 if execution else 0
+            self.commits += 1 if commit else 0
+            self.rollbacks += 1 if rollback else 0
+
+    def snapshot(self):
+        """
+        :return: {DB 소요시간, Statement 수행 횟수, Commit 횟수, Rollback 횟수}
+        """
+        with self._lock:
+            return {"db_time": self.db_time, "executions": self.executions, "commits": self.commits,
+                    "rollbacks": self.rollbacks}
+
+
+db_timer = DbTimer()
+
+
+def _timed(func, execution=False, commit=False, rollback=False):
+
+    def wrapper(*args, **kwargs):
+        start_time = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            db_timer.add(time.perf_counter() - start_time, execution, commit, rollback)
+
+    return wrapper
+
+
+class _TimedCursor(sqlite3.Cursor):
+
+    execute = _timed(sqlite3.Cursor.execute, execution=True)
+    executemany = _timed(sqlite3.Cursor.executemany, execution=True)
+    fetchone = _timed(sqlite3.Cursor.fetchone)
+    fetchmany = _timed(sqlite3.Cursor.fetchmany)
+    fetchall = _timed(sqlite3.Cursor.fetchall)
+
+
+class _TimedConnection(sqlite3.Connection):
+
+    commit = _timed(sqlite3.Connection.commit, commit=True)
+
+    _rollback = _timed(sqlite3.Connection.rollback, rollback=True)
+    _pool_reset = _timed(sqlite3.Connection.rollback)
+
+    # Connection Pool의 reset 이벤트에서 설정되며, 다음 Rollback을 Pool 반환시의 Rollback으로 처리
+    pool_resetting = False
+
+    def rollback(self):
+        if self.pool_resetting:
+            self.pool_resetting = False
+            return self._pool_reset()
+        return self._rollback()
+
+    def cursor(self, factory=_TimedCursor):
+        return super().cursor(factory)
+
+
+class SqliteConnection(OfflineConnection):
+    """
+    SQLite File DB를 실제 DBMS 대신 사용하는 Connection 대용 Class (ConnectionManager와 동일한 속성 제공).
+    Mapper와 데이터는 dbms_type 기준으로 생성하며, DBAPI 호출 시간은 db_timer에 누적됨
+    """
+
+    def __init__(self, dbms_type, database_path):
+        """
+        :param dbms_type: Mapper 및 데이터를 생성할 DBMS Type
+        :param database_path: SQLite DB File 경로
+        """
+
+        def _connect():
+            connection = sqlite3.connect(database_path, factory=_TimedConnection, check_same_thread=False,
+                                         timeout=60)
+            # 조회 중인 Connection이 있어도 다른 Connection에서 변경할 수 있도록 WAL 모드 사용
+            connection.execute("PRAGMA journal_mode=WAL")
+            return connection
+
+        # 실제 DBMS와 동일하게 QueuePool 사용
+        super().__init__(dbms_type, create_engine(f"sqlite:///{database_path}", creator=_connect,
+                                                  poolclass=QueuePool))
+
+        event.listen(self.engine, "reset", _mark_pool_reset)
+
+        self.conn_info = {"dbms_type": dbms_type}
+        self.user_name = ""
+
+
+def _mark_pool_reset(dbapi_connection, connection_record):
+    """
+    Connection Pool 반환시 수행되는 Rollback은 CDCBENCH가 수행한 Transaction이 아니므로 Rollback 횟수에서 제외하도록 표시
+    """
+    connection_record.connection.pool_resetting = True
+
+
+class _SqliteValue(TypeDecorator):
+    """
+    SQLite DBAPI가 지원하지 않는 값 (Decimal, datetime, timedelta 등)을 문자열로 변환하여 저장
+    """
+
+    impl = String
+
+    def process_bind_param(self, value, dialect):
+        if value is None or isinstance(value, (str, bytes, int, float)):
+            return value
+        return str(value)
+
+
+class _SqliteNumber(_SqliteValue):
+
+    impl = Integer
+
+
+def adapt_tables(tables, metadata=None):
+    """
+    DBMS별 Data Type으로 정의된 Table을 SQLite에서 생성/사용할 수 있는 Table로 변환.
+    Sequence 컬럼은 SQLite의 INTEGER PRIMARY KEY AUTOINCREMENT로 변환하며, 컬럼 이름과 순서는 유지함
+    :param tables: Table Object List
+    :param metadata: 변환된 Table을 등록할 MetaData (None일 경우 새로 생성)
+    :return: {Table 이름(대문자): 변환된 Table Object}
+    """
+
+    if metadata is None:
+        metadata = MetaData()
+
+    adapted_tables = {}
+
+    for table in tables:
+
+        columns = []
+        for column in table.columns:
+            if isinstance(column.default, Sequence):
+                columns.append(Column(column.name, Integer, Sequence(column.default.name),
+                                      primary_key=column.primary_key, autoincrement=True))
+            else:
+                data_type = _SqliteNumber() if isinstance(column.type, Integer) else _SqliteValue()
+                columns.append(Column(column.name, data_type, primary_key=column.primary_key,
+                                      nullable=column.nullable, autoincrement=False))
+
+        # Sequence와 동일하게 삭제된 Key를 재사용하지 않도록 AUTOINCREMENT 사용
+        adapted_tables[table.name.upper()] = Table(table.name, metadata, *columns, sqlite_autoincrement=any(
+            isinstance(column.default, Sequence) for column in table.columns))
+
+    return adapted_tables
+
+
+def get_value_size(value):
+    """
+    생성된 값의 크기 (byte)를 계산. 문자열은 UTF-8 인코딩 기준, 그 외 scalar 값은 문자열 표현 기준으로 계산
+    :param value: 생성된 값
+    :return: 값의 크기 (byte)
+    """
+
+    if value is None:
+        return 0
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    elif isinstance(value, str):
+        return len(value.encode("utf-8"))
+    else:
+        return len(str(value))
+
+
+def get_rows_size(list_of_row_data):
+    """
+    :param list_of_row_data: Row data List
+    :return: 전체 Row data의 크기 (byte)
+    """
+    return sum(get_value_size(value) for row_data in list_of_row_data for value in row_data.values())
+
+
+def measure(func, repeat):
+    """
+    func를 repeat 번 수행하여 가장 빠른 수행시간과 그 때의 반환값을 조회
+    :param func: 측정할 함수
+    :param repeat: 반복 횟수
+    :return: (최소 수행시간 (Sec.), 반환값)
+    """
+
+    best_time = None
+    best_result = None
+
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        result = func()
+        elapsed_time = time.perf_counter() - start_time
+
+        if best_time is None or elapsed_time < best_time:
+            best_time = elapsed_time
+            best_result = result
+
+    return best_time, best_result
+
+
+def write_results(benchmark_name, parameters, results, output):
+    """
+    벤치마크 결과를 JSON 형식으로 출력
+    :param benchmark_name: 벤치마크 이름
+    :param parameters: 벤치마크 수행 인자 Dictionary
+    :param results: 결과 List
+    :param output: 결과 파일 경로 (None일 경우 표준 출력)
+    """
+
+    report = {
+        "benchmark": benchmark_name,
+        "version": get_cdcbench_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": f"{datetime.now():%Y-%m-%d %H:%M:%S}",
+        "parameters": parameters,
+        "results": results
+    }
+
+    if output is None:
+        print(json.dumps(report, indent=4, default=str))
+    else:
+        output = os.path.join(_invocation_dir, output)
+        output_dir = os.path.dirname(output)
+        if output_dir and not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=4, default=str)
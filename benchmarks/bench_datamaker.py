@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+FuncsDataMaker의 Table별 데이터 생성 속도 측정 (DB 연결 불필요)
+
+Sample Table은 Table별 data file (string.dat 등)로, User Table은 동일한 Table 정의를 사용자 정의 테이블로 간주하여
+user.dat로 데이터를 생성하며, rows/sec 및 bytes/sec를 JSON 형식으로 출력함
+
+ex) python benchmarks/bench_datamaker.py --rows 10000 --output reports/bench_datamaker.json
+"""
+
+from bench_common import OfflineConnection, get_rows_size, measure, write_results
+
+from commons.constants import ORACLE, MYSQL, SQLSERVER, POSTGRESQL, INSERT_TEST, UPDATE_TEST, DELETE_TEST, \
+                              sample_tables
+from commons.funcs_datamaker import data_file_name, FuncsDataMaker
+from commons.mgr_mappers import MapperManager
+
+import argparse
+
+
+# SQLAlchemy Mapper를 생성할 수 있는 DBMS만 측정 가능
+bench_dbms = [ORACLE, MYSQL, SQLSERVER, POSTGRESQL]
+
+# UPDATE_TEST, DELETE_TEST 테이블의 데이터는 initializer에서 생성하므로 제외
+bench_tables = [table_name for table_name in sample_tables if table_name not in [UPDATE_TEST, DELETE_TEST]]
+
+SAMPLE = "sample"
+USER = "user"
+
+
+def get_tables(dbms_type, table_names):
+    """
+    DBMS의 Table 정의 파일로 Table Object를 생성
+    :param dbms_type: DBMS Type
+    :param table_names: 측정할 Table 이름 List
+    :return: DBMS에 정의된 Table의 Table Object List
+    """
+
+    mapper = MapperManager(OfflineConnection(dbms_type)).get_mappers()
+
+    return [table for table in sorted(mapper.metadata.tables.values(), key=lambda table: table.name)
+            if table.name.upper() in table_names]
+
+
+def bench_table(dbms_type, table, mode, rows, commit_unit, repeat):
+    """
+    Table 하나의 데이터 생성 속도를 측정
+    :param dbms_type: DBMS Type
+    :param table: Table Object
+    :param mode: sample (Table별 data file 사용) / user (user.dat 사용)
+    :param rows: 생성할 Row 수
+    :param commit_unit: 한 번에 생성할 Row 수 (generate_batch 단위)
+    :param repeat: 반복 횟수 (가장 빠른 결과를 사용)
+    :return: 측정 결과 Dictionary
+    """
+
+    # Sequence 컬럼은 insert 대상이 아니므로 제외 (cdcbench와 동일)
+    columns = [column for column in table.columns if column.default is None]
+
+    if mode == SAMPLE:
+        data_maker = FuncsDataMaker(data_file_name[table.name.split("_")[0].upper()])
+        separate_col_val = 1 if table.name.upper() == INSERT_TEST else None
+
+        def _generate_batch(number_of_data):
+            return data_maker.generate_batch(table, columns, number_of_data, separate_col_val, dbms_type)
+    else:
+        data_maker = FuncsDataMaker(data_file_name["USER"])
+
+        def _generate_batch(number_of_data):
+            return data_maker.get_column_generator_plan(columns, dbms_type).generate_batch(number_of_data)
+
+    def _generate():
+        list_of_row_data = []
+        remaining_data = rows
+        while remaining_data > 0:
+            batch = _generate_batch(min(commit_unit, remaining_data))
+            list_of_row_data.extend(batch)
+            remaining_data -= len(batch)
+        return list_of_row_data
+
+    # 최초 수행시 생성되는 generator plan, LOB file cache 등의 영향을 제외
+    _generate_batch(1)
+
+    elapsed_time, list_of_row_data = measure(_generate, repeat)
+    total_bytes = get_rows_size(list_of_row_data)
+
+    return {
+        "dbms_type": dbms_type,
+        "table": table.name.upper(),
+        "mode": mode,
+        "rows": len(list_of_row_data),
+        "columns": len(columns),
+        "bytes": total_bytes,
+        "seconds": round(elapsed_time, 6),
+        "rows_per_sec": round(len(list_of_row_data) / elapsed_time, 2) if elapsed_time > 0 else None,
+        "bytes_per_sec": round(total_bytes / elapsed_time, 2) if elapsed_time > 0 else None
+    }
+
+
+def main():
+
+    parser = argparse.ArgumentParser(prog="bench_datamaker", description="Measures data generation throughput.")
+
+    parser.add_argument("--dbms", nargs="+", choices=bench_dbms, type=str.upper, default=bench_dbms,
+                        help="DBMS types whose table definitions are used (default: all)")
+    parser.add_argument("--tables", nargs="+", choices=bench_tables, type=str.upper, default=bench_tables,
+                        help="Table names to measure (default: all tables defined for the DBMS)")
+    parser.add_argument("--mode", nargs="+", choices=[SAMPLE, USER], type=str.lower, default=[SAMPLE, USER],
+                        help="sample: table-specific data file / user: user.dat (default: both)")
+    parser.add_argument("--rows", type=int, default=10000, help="Number of rows generated per table (default: 10000)")
+    parser.add_argument("--commit", type=int, default=1000,
+                        help="Number of rows generated at once (default: 1000)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Number of repetitions, the fastest is reported (default: 3)")
+    parser.add_argument("--output", help="JSON result file path (default: stdout)")
+
+    args = parser.parse_args()
+
+    if args.rows < 1 or args.commit < 1 or args.repeat < 1:
+        parser.error("--rows, --commit and --repeat arguments must be at least 1")
+
+    results = []
+
+    for dbms_type in args.dbms:
+        for table in get_tables(dbms_type, args.tables):
+            for mode in args.mode:
+                results.append(bench_table(dbms_type, table, mode, args.rows, args.commit, args.repeat))
+
+    write_results("datamaker", {"dbms": args.dbms, "tables": args.tables, "mode": args.mode, "rows": args.rows,
+                                "commit": args.commit, "repeat": args.repeat}, results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+cdcbench/ranbench DML 수행 경로별 CDCBENCH 자체 (Client) 소요시간 측정
+
+실제 DBMS 대신 SQLite File DB에 Table 정의 파일로 Sample Table을 생성하고, 각 DML 수행 경로를 데이터 수/Commit 단위별로
+수행하여 전체 수행시간 중 DB (SQLite DBAPI 호출) 소요시간을 제외한 Row당 Client 소요시간을 JSON 형식으로 출력함
+
+ex) python benchmarks/bench_dml.py --sizes 1000 10000 --commits 100 1000 --output reports/bench_dml.json
+"""
+
+from bench_common import SqliteConnection, adapt_tables, db_timer, work_dir, write_results
+
+from commons.constants import ORACLE, MYSQL, SQLSERVER, POSTGRESQL, INSERT_TEST, STRING_TEST, NUMERIC_TEST, \
+                              DATETIME_TEST, BINARY_TEST, LOB_TEST
+from commons.funcs_datamaker import data_file_name, FuncsDataMaker
+from commons.funcs_dml import FuncsDml
+from commons import funcs_ranbench
+from commons.funcs_ranbench import FuncRanBench, CommitPolicy
+from commons.mgr_mappers import MapperManager
+
+from datetime import datetime
+from functools import partial
+from sqlalchemy import MetaData
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.sql import select, func
+
+import argparse
+import os
+import time
+
+
+# SQLAlchemy Mapper를 생성할 수 있는 DBMS만 사용 가능
+bench_dbms = [ORACLE, MYSQL, SQLSERVER, POSTGRESQL]
+
+# cdcbench DML 수행 경로
+dml_cases = ["single_insert", "multi_insert", "update", "separated_update", "range_update",
+             "delete", "separated_delete", "range_delete"]
+
+# ranbench 수행 방식
+ranbench_cases = ["ranbench_record", "ranbench_dml_count", "ranbench_time"]
+
+# 데이터를 미리 생성해야 하는 수행 경로
+_data_required_cases = ["update", "separated_update", "range_update", "delete", "separated_delete", "range_delete"]
+
+# Commit 단위와 무관하게 하나의 Transaction으로 수행되는 수행 경로
+_single_tx_cases = ["update", "delete"]
+
+ranbench_tables = [STRING_TEST, NUMERIC_TEST, DATETIME_TEST, BINARY_TEST, LOB_TEST]
+
+
+class DmlBenchmark:
+
+    def __init__(self, conn, tables):
+        """
+        :param conn: SqliteConnection instance
+        :param tables: {Table 이름(대문자): SQLite용 Table Object}
+        """
+
+        self.conn = conn
+        self.tables = tables
+        self.dml = FuncsDml(conn)
+        self._mapped_classes = {}
+
+    def _get_data_maker(self, table):
+        return FuncsDataMaker(data_file_name[table.name.split("_")[0].upper()])
+
+    @staticmethod
+    def _get_columns(table):
+        return [column for column in table.columns if column.default is None]
+
+    def _get_mapped_class(self, table):
+        """
+        single_insert에서 사용할 ORM Class를 생성 (cdcbench와 동일한 형태)
+        """
+
+        if table.name not in self._mapped_classes:
+
+            class Table(declarative_base(metadata=MetaData())):
+                __table__ = table
+                column_names = list(column.name for column in table.columns)
+
+                def __init__(self, **kwargs):
+                    data = kwargs["data"]
+                    for column_name in data.keys():
+                        setattr(self, self.column_names[self.column_names.index(column_name)], data[column_name])
+
+            self._mapped_classes[table.name] = Table
+
+        return self._mapped_classes[table.name]
+
+    def reset_table(self, table):
+        self.conn.engine.execute(table.delete())
+
+    def load_data(self, table, number_of_data):
+        """
+        측정 대상이 아닌 사전 데이터를 생성
+        :return: (최소 Key, 최대 Key)
+        """
+
+        self.dml.multi_insert(table, self._get_columns(table), number_of_data, 10000, self._get_data_maker(table),
+                              False, True, False, queue_depth=0)
+
+        key_column = table.columns[table.columns.keys()[0]]
+
+        return self.conn.engine.execute(select([func.min(key_column), func.max(key_column)])).fetchone()
+
+    def prepare_dml(self, case, table, size, commit_unit):
+        """
+        cdcbench DML 수행 경로를 측정할 수 있도록 데이터를 준비
+        :return: 측정할 함수 (수행 후 처리한 Record 수를 반환)
+        """
+
+        self.reset_table(table)
+
+        columns = self._get_columns(table)
+        data_maker = self._get_data_maker(table)
+        key_column = table.columns[table.columns.keys()[0]]
+
+        if case in _data_required_cases:
+            start_key, end_key = self.load_data(table, size)
+            where_clause = f"{start_key} <= {key_column.name} AND {key_column.name} <= {end_key}"
+
+        if case == "single_insert":
+            execute = partial(self.dml.single_insert, self._get_mapped_class(table), columns, size, commit_unit,
+                              data_maker, False, True, False)
+        elif case == "multi_insert":
+            execute = partial(self.dml.multi_insert, table, columns, size, commit_unit, data_maker, False, True, False)
+        elif case == "update":
+            execute = partial(self.dml.update, table, columns, where_clause, data_maker, False, True, False)
+        elif case == "separated_update":
+            execute = partial(self.dml.separated_update, table, columns, where_clause, key_column, data_maker, False,
+                              True, False, commit_unit, total_estimate=size)
+        elif case == "range_update":
+            execute = partial(self.dml.range_update, table, columns, key_column, start_key, end_key, data_maker,
+                              False, True, False, commit_unit)
+        elif case == "delete":
+            execute = partial(self.dml.delete, table, where_clause, False, True)
+        elif case == "separated_delete":
+            execute = partial(self.dml.separated_delete, table, where_clause, key_column, False, True, commit_unit,
+                              total_estimate=size)
+        else:
+            execute = partial(self.dml.range_delete, table, key_column, start_key, end_key, False, True, commit_unit)
+
+        def _run():
+            execute()
+            return size
+
+        return _run
+
+    def prepare_ranbench(self, case, tables, size, commit_unit, record_range, dml, run_time):
+        """
+        ranbench 수행 방식을 측정할 수 있도록 Table별 size 건의 데이터를 준비
+        :return: 측정할 함수 (수행 후 처리한 Record 수를 반환)
+        """
+
+        for table in tables:
+            self.reset_table(table)
+            self.load_data(table, size)
+
+        data_makers = {table.name.split("_")[0].upper(): self._get_data_maker(table) for table in tables}
+        commit_policy = CommitPolicy(every_rows=commit_unit)
+        ranbench = FuncRanBench(self.conn)
+
+        if case == "ranbench_record":
+            def _run():
+                return ranbench.run_record_random(size, record_range, 0, tables, dml, data_makers, False,
+                                                  datetime.now(), True, commit_policy=commit_policy)
+        elif case == "ranbench_dml_count":
+            # 발생할 Record 수가 size와 비슷하도록 DML 수를 결정
+            dml_count = max(1, round(size * 2 / (record_range[0] + record_range[-1])))
+
+            def _run():
+                return ranbench.run_dml_count_random(dml_count, record_range, 0, tables, dml, data_makers, False,
+                                                     datetime.now(), True, commit_policy=commit_policy)
+        else:
+            def _run():
+                return ranbench.run_time_random(run_time, record_range, 0, tables, dml, data_makers, False,
+                                                datetime.now(), True, commit_policy=commit_policy)
+
+        return lambda: _run()["total_record"]
+
+
+def run_case(prepare, repeat):
+    """
+    prepare로 준비한 함수를 수행하여 전체/DB/Client 소요시간을 측정 (repeat 번 반복하여 가장 빠른 결과를 사용)
+    :param prepare: 측정할 함수를 반환하는 준비 함수
+    :param repeat: 반복 횟수
+    :return: 측정 결과 Dictionary
+    """
+
+    best_result = None
+
+    for _ in range(repeat):
+
+        run = prepare()
+
+        db_timer.reset()
+        start_time = time.perf_counter()
+        rows = run()
+        elapsed_time = time.perf_counter() - start_time
+        db_stats = db_timer.snapshot()
+
+        if best_result is None or elapsed_time < best_result["seconds"]:
+            client_time = max(elapsed_time - db_stats["db_time"], 0.0)
+            best_result = {
+                "rows": rows,
+                "seconds": elapsed_time,
+                "db_seconds": db_stats["db_time"],
+                "client_seconds": client_time,
+                "client_ratio": client_time / elapsed_time if elapsed_time > 0 else None,
+                "client_us_per_row": client_time / rows * 1000000 if rows else None,
+                "rows_per_sec": rows / elapsed_time if elapsed_time > 0 else None,
+                "executions": db_stats["executions"],
+                "commits": db_stats["commits"],
+                "rollbacks": db_stats["rollbacks"]
+            }
+
+    return {key: round(value, 6) if isinstance(value, float) else value for key, value in best_result.items()}
+
+
+def main():
+
+    parser = argparse.ArgumentParser(prog="bench_dml", description="Measures client-side overhead of DML paths "
+                                                                   "against a SQLite stand-in database.")
+
+    parser.add_argument("--dbms", choices=bench_dbms, type=str.upper, default=POSTGRESQL,
+                        help="DBMS type whose table definitions and data conversion are used (default: POSTGRESQL)")
+    parser.add_argument("--cases", nargs="+", choices=dml_cases + ranbench_cases, type=str.lower,
+                        default=dml_cases + ranbench_cases, help="DML paths to measure (default: all)")
+    parser.add_argument("--table", type=str.upper, default=INSERT_TEST,
+                        help=f"Table used for cdcbench DML paths (default: {INSERT_TEST})")
+    parser.add_argument("--ranbench-tables", nargs="+", choices=ranbench_tables, type=str.upper,
+                        default=ranbench_tables, help="Tables used for ranbench (default: all)")
+    parser.add_argument("--ranbench-dml", nargs="+", choices=["INSERT", "UPDATE", "DELETE"], type=str.upper,
+                        default=["INSERT", "UPDATE", "DELETE"], help="DML types used for ranbench (default: all)")
+    parser.add_argument("--range", nargs="+", type=int, default=[1, 10],
+                        help="Record range per ranbench DML (default: 1 10)")
+    parser.add_argument("--run-time", type=int, default=5, help="Running time of ranbench_time (default: 5 sec)")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[1000, 10000],
+                        help="Number of rows processed per run (default: 1000 10000)")
+    parser.add_argument("--commits", nargs="+", type=int, default=[100, 1000],
+                        help="Commit units (default: 100 1000)")
+    parser.add_argument("--repeat", type=int, default=1,
+                        help="Number of repetitions, the fastest is reported (default: 1)")
+    parser.add_argument("--database", help="SQLite database file path (default: temporary file)")
+    parser.add_argument("--output", help="JSON result file path (default: stdout)")
+
+    args = parser.parse_args()
+
+    if min(args.sizes) < 1 or min(args.commits) < 1 or args.repeat < 1 or args.run_time < 1:
+        parser.error("--sizes, --commits, --repeat and --run-time arguments must be at least 1")
+    elif len(args.range) > 2 or args.range[0] < 1 or args.range[0] > args.range[-1]:
+        parser.error("--range argument must be one or two increasing positive numbers")
+
+    # ranbench Report는 임시 디렉토리에 생성 (종료시 삭제)
+    funcs_ranbench._report_dir = os.path.join(work_dir, "reports")
+
+    if args.database is None:
+        database_path = os.path.join(work_dir, "bench.db")
+    else:
+        database_path = os.path.abspath(args.database)
+        if os.path.exists(database_path):
+            os.remove(database_path)
+
+    conn = SqliteConnection(args.dbms, database_path)
+    mapper = MapperManager(conn).get_mappers()
+    tables = adapt_tables(mapper.metadata.tables.values())
+    if args.table not in tables:
+        parser.error(f"Table does not exist in the {args.dbms} table definitions. [ {args.table} ]")
+    for table in tables.values():
+        table.create(conn.engine)
+
+    benchmark = DmlBenchmark(conn, tables)
+    table = tables[args.table]
+    rb_tables = [tables[table_name] for table_name in args.ranbench_tables]
+
+    results = []
+
+    for case in args.cases:
+
+        for size in args.sizes if case != "ranbench_time" else [None]:
+
+            for commit_unit in args.commits if case not in _single_tx_cases else [None]:
+
+                if case in dml_cases:
+                    result = run_case(lambda: benchmark.prepare_dml(case, table, size, commit_unit), args.repeat)
+                    table_names = [table.name.upper()]
+                else:
+                    result = run_case(lambda: benchmark.prepare_ranbench(case, rb_tables, size or args.sizes[0],
+                                                                         commit_unit, args.range,
+                                                                         args.ranbench_dml, args.run_time),
+                                      args.repeat)
+                    table_names = [rb_table.name.upper() for rb_table in rb_tables]
+
+                results.append({"case": case, "tables": table_names, "size": size, "commit_unit": commit_unit,
+                                **result})
+
+    write_results("dml", {"dbms": args.dbms, "cases": args.cases, "table": args.table,
+                          "ranbench_tables": args.ranbench_tables, "ranbench_dml": args.ranbench_dml,
+                          "range": args.range, "run_time": args.run_time, "sizes": args.sizes,
+                          "commits": args.commits, "repeat": args.repeat}, results, args.output)
+
+
+if __name__ == "__main__":
+    main()
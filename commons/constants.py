@@ -33,6 +33,17 @@ BOTH = "BOTH"
 
 default_config_name = "default.conf"
 
+# LOB File Cache 기본 크기 (MB)
+DEFAULT_LOB_CACHE_SIZE = 256
+
+# Connection Pool 기본 설정 (SQLAlchemy QueuePool 기본값과 동일. POOL_RECYCLE -1은 미사용)
+DEFAULT_POOL_SIZE = 5
+DEFAULT_MAX_OVERFLOW = 10
+DEFAULT_POOL_RECYCLE = -1
+
+# Insert 시 미리 생성해 둘 Commit 단위 데이터 수 기본값
+DEFAULT_QUEUE_DEPTH = 2
+
 tqdm_ncols = 70
 tqdm_bar_format = "  {desc}[{n}/{total}] {bar} [{percentage:3.0f}%]{postfix}"
 tqdm_time_bar_format = "  {desc}[{n:.2f}/{total_fmt}] {bar} [{percentage:3.0f}%]{postfix}"
@@ -0,0 +1,271 @@
+from commons.constants import ORACLE, SQLSERVER, POSTGRESQL
+from commons.funcs_stmtcache import StatementCache
+from commons.mgr_logger import LoggerManager
+
+from datetime import date, datetime, time, timedelta
+from sqlalchemy import Sequence, text
+from sqlalchemy.exc import DBAPIError
+
+import io
+import math
+
+
+class BulkLoader:
+    """
+    SQLAlchemy의 executemany로 데이터를 Insert하는 기본 Bulk Loader.
+    DBMS별 Native Bulk Load 방식은 하위 클래스에서 구현
+    """
+
+    def __init__(self, statement_cache=None):
+        """
+        :param statement_cache: Insert 문을 재사용할 StatementCache instance (None일 경우 별도로 생성)
+        """
+
+        self.logger = LoggerManager.get_logger(__name__)
+        self.statement_cache = statement_cache if statement_cache is not None else StatementCache()
+
+    def load(self, connection, table, list_of_row_data):
+        """
+        Row data List를 table에 Insert (Transaction 처리는 호출하는 쪽에서 수행)
+        :param connection: SQLAlchemy Connection
+        :param table: Table Object
+        :param list_of_row_data: Row data List
+        :return: None
+        """
+
+        self.execute(connection, self.prepare(connection, table, list_of_row_data))
+
+    def prepare(self, connection, table, list_of_row_data):
+        """
+        Insert 문과 Parameter를 생성 (Statement 생성 단계와 수행 단계의 시간을 나누어 측정할 경우 load 대신 사용)
+        :param connection: SQLAlchemy Connection
+        :param table: Table Object
+        :param list_of_row_data: Row data List
+        :return: execute에 전달할 준비 결과 (Row data가 없을 경우 None)
+        """
+
+        if not list_of_row_data:
+            return None
+
+        return self.statement_cache.get_insert(table), list_of_row_data
+
+    def execute(self, connection, prepared):
+        """
+        prepare 결과로 Insert를 수행
+        :param connection: SQLAlchemy Connection
+        :param prepared: prepare 결과
+        :return: None
+        """
+
+        if prepared is not None:
+            statement, params = prepared
+            connection.execute(statement, params)
+
+
+class _DbapiBulkLoader(BulkLoader):
+    """
+    DBAPI Cursor를 직접 사용하는 Bulk Loader의 공통 처리.
+    Statement 컴파일, Bind Processor 적용, DBAPI 예외의 SQLAlchemy 예외 변환을 담당
+    """
+
+    def __init__(self, statement_cache=None):
+
+        super().__init__(statement_cache)
+        self.sql_logger = LoggerManager.get_sa_unsupported_dbms_sql_logger("bulk_load")
+
+    def prepare(self, connection, table, list_of_row_data):
+
+        if not list_of_row_data:
+            return None
+
+        column_names = list(list_of_row_data[0].keys())
+        statement, params = self._prepare(connection, table, column_names, list_of_row_data)
+
+        return statement, params, table, column_names
+
+    def execute(self, connection, prepared):
+
+        if prepared is None:
+            return
+
+        statement, params, table, column_names = prepared
+        dialect = connection.dialect
+
+        self.sql_logger.info(statement)
+
+        cursor = connection.connection.cursor()
+
+        try:
+            self._execute(cursor, statement, params, table, column_names, dialect)
+        except dialect.dbapi.Error as dbapi_err:
+            raise DBAPIError.instance(statement, params[0], dbapi_err, dialect.dbapi.Error)
+        finally:
+            cursor.close()
+
+    def _prepare(self, connection, table, column_names, list_of_row_data):
+        """
+        SQLAlchemy executemany와 동일하게 Insert 문을 컴파일하고, Bind Processor를 적용한 Parameter를 생성
+        (Sequence 컬럼은 Insert 문에 nextval로 포함됨)
+        :return: Insert SQL, Parameter List
+        """
+
+        compiled = self.statement_cache.get_compiled(self.statement_cache.get_insert(table), connection.dialect,
+                                                     column_names)
+
+        # Insert 문의 Bind Parameter 이름은 컬럼 이름과 같음
+        bind_names = compiled.positiontup if compiled.positional else column_names
+        processors = _get_bind_processors([table.columns[bind_name] for bind_name in bind_names], connection.dialect)
+
+        params = []
+        for row_data in list_of_row_data:
+            values = [processor(row_data[bind_name]) if processor is not None else row_data[bind_name]
+                      for bind_name, processor in zip(bind_names, processors)]
+            params.append(tuple(values) if compiled.positional else dict(zip(bind_names, values)))
+
+        return compiled.string, params
+
+    def _execute(self, cursor, statement, params, table, column_names, dialect):
+        cursor.executemany(statement, params)
+
+
+class PostgresqlBulkLoader(_DbapiBulkLoader):
+    """
+    psycopg2의 COPY FROM STDIN (CSV)으로 데이터를 적재
+    """
+
+    def _prepare(self, connection, table, column_names, list_of_row_data):
+
+        preparer = connection.dialect.identifier_preparer
+
+        # COPY는 Sequence를 호출하지 않으므로 Sequence 컬럼 값을 미리 할당받아 추가
+        sequence_columns = [column for column in table.columns
+                            if column.name not in column_names and isinstance(column.default, Sequence)]
+
+        sequence_values = []
+        for column in sequence_columns:
+            sequence_stmt = self.statement_cache.get(
+                (table, "NEXTVAL", column.name),
+                lambda: text(f"SELECT nextval('{preparer.format_sequence(column.default)}') "
+                             f"FROM generate_series(1, :row_count)")
+            )
+            sequence_values.append(connection.execute(sequence_stmt, row_count=len(list_of_row_data)).fetchall())
+
+        columns = [table.columns[column_name] for column_name in column_names]
+        processors = _get_bind_processors(columns, connection.dialect)
+
+        params = []
+        for idx, row_data in enumerate(list_of_row_data):
+            row = [processor(row_data[column_name]) if processor is not None else row_data[column_name]
+                   for column_name, processor in zip(column_names, processors)]
+            row.extend(values[idx][0] for values in sequence_values)
+            params.append(row)
+
+        statement = f"COPY {preparer.format_table(table)} " \
+                    f"({', '.join(preparer.format_column(column) for column in columns + sequence_columns)}) " \
+                    f"FROM STDIN WITH (FORMAT csv)"
+
+        return statement, params
+
+    def _execute(self, cursor, statement, params, table, column_names, dialect):
+
+        copy_buffer = io.StringIO()
+        for row in params:
+            copy_buffer.write(",".join(_get_copy_csv_value(value) for value in row))
+            copy_buffer.write("\n")
+        copy_buffer.seek(0)
+
+        cursor.copy_expert(statement, copy_buffer)
+
+
+class OracleBulkLoader(_DbapiBulkLoader):
+    """
+    cx_Oracle의 executemany (Array Binding)로 데이터를 적재
+    """
+
+    def _execute(self, cursor, statement, params, table, column_names, dialect):
+
+        # LOB/LONG 계열 컬럼은 Bind Type을 미리 지정해야 4000 byte 이상의 데이터를 array binding 할 수 있음
+        lob_type_names = ["CLOB", "NCLOB", "BLOB", "LONG_STRING", "LONG_BINARY"]
+        lob_types = [getattr(dialect.dbapi, type_name) for type_name in lob_type_names
+                     if hasattr(dialect.dbapi, type_name)]
+
+        input_sizes = {}
+        for column_name in column_names:
+            dbapi_type = table.columns[column_name].type.dialect_impl(dialect).get_dbapi_type(dialect.dbapi)
+            if dbapi_type in lob_types:
+                input_sizes[column_name] = dbapi_type
+
+        if input_sizes:
+            cursor.setinputsizes(**input_sizes)
+
+        cursor.executemany(statement, params)
+
+
+class SqlserverBulkLoader(_DbapiBulkLoader):
+    """
+    pyodbc의 fast_executemany로 데이터를 적재
+    """
+
+    def _execute(self, cursor, statement, params, table, column_names, dialect):
+
+        cursor.fast_executemany = True
+        cursor.executemany(statement, params)
+
+
+def get_bulk_loader(dbms_type, bulk_load=True, statement_cache=None):
+    """
+    DBMS별 Bulk Loader 생성
+    :param dbms_type: DBMS type
+    :param bulk_load: False일 경우 SQLAlchemy executemany를 사용하는 기본 Bulk Loader를 반환
+                      (MySQL은 기본 executemany가 Multi-row VALUES로 수행되므로 항상 기본 Bulk Loader를 사용)
+    :param statement_cache: Insert 문을 재사용할 StatementCache instance (None일 경우 Bulk Loader별로 생성)
+    :return: BulkLoader instance
+    """
+
+    if bulk_load:
+        if dbms_type == POSTGRESQL:
+            return PostgresqlBulkLoader(statement_cache)
+        elif dbms_type == ORACLE:
+            return OracleBulkLoader(statement_cache)
+        elif dbms_type == SQLSERVER:
+            return SqlserverBulkLoader(statement_cache)
+
+    return BulkLoader(statement_cache)
+
+
+def _get_bind_processors(columns, dialect):
+    """
+    컬럼별 Bind Processor를 조회 (SQLAlchemy가 executemany 수행시 적용하는 값 변환과 동일)
+    :param columns: Column List
+    :param dialect: SQLAlchemy Dialect
+    :return: 컬럼 순서의 Bind Processor List (변환이 필요 없는 컬럼은 None)
+    """
+    return [column.type.dialect_impl(dialect).bind_processor(dialect) for column in columns]
+
+
+def _get_copy_csv_value(value):
+    """
+    COPY (FORMAT csv) 입력 형식으로 값을 변환. NULL은 따옴표 없는 빈 값으로 표현함
+    :param value: 컬럼 값
+    :return: CSV 필드 문자열
+    """
+
+    if value is None:
+        return ""
+    elif isinstance(value, bool):
+        return "t" if value else "f"
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        return f"\"\\x{bytes(value).hex()}\""
+    elif isinstance(value, timedelta):
+        return f"\"{value.days} days {value.seconds} seconds {value.microseconds} microseconds\""
+    elif isinstance(value, (datetime, date, time)):
+        return f"\"{value.isoformat()}\""
+    elif isinstance(value, float):
+        # PostgreSQL의 float 입력 형식 (NaN, Infinity, -Infinity)
+        if math.isnan(value):
+            return "NaN"
+        elif math.isinf(value):
+            return "Infinity" if value > 0 else "-Infinity"
+        return repr(value)
+    else:
+        return "\"{}\"".format(str(value).replace("\"", "\"\""))
@@ -181,6 +181,7 @@ def _view_option_info(args):
                                                       "Objects & Data": True})
         option_dict["Key Option"] = get_true_option({"Primary Key": args.primary, "Unique Key": args.unique,
                                                      "Non Key": args.non_key})
+        option_dict["Bulk Load"] = "Y" if args.bulk_load else "N"
 
     for x, y in zip(option_dict.keys(), option_dict.values()):
         option_tab.add_row([x, y])
@@ -2,11 +2,14 @@ from commons.constants import *
 from commons.funcs_common import print_error_msg
 from commons.mgr_mappers import TYPE
 
+from collections import OrderedDict
 from datetime import timedelta
 
+import mmap
 import random
 import re
 import os
+import threading
 import yaml
 
 data_file_name = {
@@ -24,13 +27,165 @@ data_file_name = {
 }
 
 
+# memoryview를 bytes와 동일하게 bind 할 수 있는 DBMS (psycopg2). 그 외 DBMS는 bytes로 변환하여 전달
+_memoryview_bind_dbms = [POSTGRESQL]
+
+
+class LobFileCache:
+    """
+    LOB File 내용을 File 단위로 보관하는 Process 공용 Cache.
+    max_bytes를 초과하면 가장 오래 사용하지 않은 File부터 제거(LRU)하며, Cache에 담을 수 없는 큰 File은 매번 읽음.
+    use_mmap 사용시 Cache에 담을 수 없는 큰 binary File을 mmap으로 열어두고 재사용함
+    (mmap은 OS Page Cache를 사용하므로 max_bytes에 포함하지 않으며, text는 str로 변환해야 하므로 mmap을 사용하지 않음)
+    """
+
+    def __init__(self, max_bytes, use_mmap=False):
+
+        self.max_bytes = max_bytes
+        self.use_mmap = use_mmap
+
+        self._contents = OrderedDict()
+        self._sizes = {}
+        self._total_bytes = 0
+        self._mmaps = {}
+        self._mapped_contents = {}
+        self._lock = threading.Lock()
+
+    def get(self, file_path, is_text, share_buffer=False):
+        """
+        File 내용을 Cache에서 조회하며, 없을 경우 File을 읽어 Cache에 보관 (File은 lock 밖에서 읽음)
+        :param file_path: File 경로
+        :param is_text: True일 경우 UTF-8 str, False일 경우 bytes로 반환
+        :param share_buffer: mmap으로 연 File을 복사하지 않고 memoryview로 반환할지 여부
+        :return: File Content
+        """
+
+        with self._lock:
+            if file_path in self._contents:
+                self._contents.move_to_end(file_path)
+                return self._contents[file_path]
+
+            mapped_content = self._mapped_contents.get(file_path)
+
+        if mapped_content is None:
+            file_size = os.path.getsize(file_path)
+
+            if file_size > self.max_bytes:
+                if not self.use_mmap or is_text or file_size == 0:
+                    return self._read(file_path, is_text)
+
+                mapped_content = self._map(file_path)
+
+        if mapped_content is not None:
+            return mapped_content if share_buffer else bytes(mapped_content)
+
+        content = self._read(file_path, is_text)
+
+        with self._lock:
+            if file_path not in self._contents:
+                self._contents[file_path] = content
+                self._sizes[file_path] = file_size
+                self._total_bytes += file_size
+
+                while self._total_bytes > self.max_bytes:
+                    evicted_path, _ = self._contents.popitem(last=False)
+                    self._total_bytes -= self._sizes.pop(evicted_path)
+
+        return content
+
+    def clear(self):
+        """
+        Cache 및 mmap 정리
+        """
+
+        with self._lock:
+            self._contents.clear()
+            self._sizes.clear()
+            self._total_bytes = 0
+
+            # memoryview가 남아있으면 mmap을 close 할 수 없으므로 먼저 release
+            for content in self._mapped_contents.values():
+                content.release()
+            self._mapped_contents.clear()
+
+            for mapped_file in self._mmaps.values():
+                mapped_file.close()
+            self._mmaps.clear()
+
+    def _map(self, file_path):
+        """
+        File을 mmap으로 열어 memoryview를 보관 (다른 Thread가 먼저 연 경우 해당 memoryview를 사용)
+        :return: File 전체의 memoryview
+        """
+
+        with self._lock:
+            if file_path not in self._mapped_contents:
+                with open(file_path, "rb") as f:
+                    self._mmaps[file_path] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                self._mapped_contents[file_path] = memoryview(self._mmaps[file_path])
+
+            return self._mapped_contents[file_path]
+
+    @staticmethod
+    def _read(file_path, is_text):
+        if is_text:
+            with open(file_path, "r", encoding="utf-8") as f:
+                return f.read()
+        else:
+            with open(file_path, "rb") as f:
+                return f.read()
+
+
+def group(data_type):
+    return f"GROUP.{data_type}"
+
+
+class GROUP:
+    """
+    user.dat의 Data Type Group Key
+    """
+
+    CHAR = group("CHAR")
+    VARCHAR = group("VARCHAR")
+
+    NUMBER = group("NUMBER")
+    BIT = group("BIT")
+    TINYINT = group("TINYINT")
+    SMALLINT = group("SMALLINT")
+    MEDIUMINT = group("MEDIUMINT")
+    INT = group("INT")
+    BIGINT = group("BIGINT")
+    DECIMAL = group("DECIMAL")
+    FLOAT = group("FLOAT")
+    DOUBLE = group("DOUBLE")
+    MONEY = group("MONEY")
+
+    TIME = group("TIME")
+    DATE = group("DATE")
+    DATETIME = group("DATETIME")
+    TIMESTAMP = group("TIMESTAMP")
+    INTERVAL_YEAR_MONTH = group("INTERVAL_YEAR_MONTH")
+    INTERVAL_DAY_SECOND = group("INTERVAL_DAY_SECOND")
+    DATETIMEOFFSET = group("DATETIMEOFFSET")
+
+    CLOB = group("CLOB")
+    BLOB = group("BLOB")
+
+    ROWID = group("ROWID")
+
+
 class FuncsDataMaker:
 
     __data_dir = "data"
+    __lob_cache = LobFileCache(DEFAULT_LOB_CACHE_SIZE * 1024 * 1024)
     __lob_data_dir = "lob_files"
 
     def __init__(self, file_name):
 
+        self.file_name = file_name
+        self._column_generator_plans = {}
+        self._sample_table_generators = {}
+
         try:
             with open(os.path.join(self.__data_dir, file_name), "r", encoding="utf-8") as f:
                 self.file_data = yaml.safe_load(f)
@@ -42,14 +197,25 @@ class FuncsDataMaker:
             print_error_msg(f"Invalid YAML format of data file [ {yerr.args[1].name} ]."
                             f"line {yerr.args[1].line+1}, column {yerr.args[1].column+1}")
 
+    @classmethod
+    def set_lob_cache(cls, cache_size, use_mmap):
+        """
+        LOB File Cache 설정
+        :param cache_size: Cache 최대 크기 (MB, 0일 경우 Cache 미사용)
+        :param use_mmap: Cache 크기를 초과하는 File의 mmap 사용 여부
+        """
+        cls.__lob_cache.clear()
+        cls.__lob_cache = LobFileCache(cache_size * 1024 * 1024, use_mmap)
+
     def get_file_data(self):
         return self.file_data
 
     @classmethod
-    def _read_lob_file(cls, file_name):
+    def _read_lob_file(cls, file_name, dbms_type=None):
         """
         File을 Open하여 내용을 읽음
         :param file_name: File Name
+        :param dbms_type: DBMS type (memoryview를 bind 할 수 없는 DBMS는 bytes로 반환)
         :return: File Content
         """
 
@@ -60,12 +226,8 @@ class FuncsDataMaker:
             file_extension = file_name.split(".")[1]
 
             # File 확장자에 따라 읽는 방식을 구분
-            if file_extension == "txt":
-                with open(os.path.join(cls.__data_dir, cls.__lob_data_dir, file_name), "r", encoding="utf-8") as f:
-                    return f.read()
-            else:
-                with open(os.path.join(cls.__data_dir, cls.__lob_data_dir, file_name), "rb") as f:
-                    return f.read()
+            return cls.__lob_cache.get(os.path.join(cls.__data_dir, cls.__lob_data_dir, file_name),
+                                       file_extension == "txt", dbms_type in _memoryview_bind_dbms)
 
         except IndexError:
             print_error_msg(f"Invalid LOB file name [ {file_name} ]. Check file name in data file.")
@@ -90,7 +252,7 @@ class FuncsDataMaker:
         else:
             return None
 
-    def _lob_data_select(self, key):
+    def _lob_data_select(self, key, dbms_type=None):
 
         try:
             sample_data_count = len(self.file_data[key])
@@ -99,121 +261,105 @@ class FuncsDataMaker:
 
         if sample_data_count > 0:
             lob_file_name = self.file_data[key][random.randrange(sample_data_count)]
-            return self._read_lob_file(lob_file_name)
+            return self._read_lob_file(lob_file_name, dbms_type)
         else:
             return None
 
-    def get_sample_table_data(self, table_name, columns, separate_col_val=None, dbms_type=None):
+    def _basic_data_generator(self, key):
         """
-        Sample table의 Row 단위 Sample data를 생성
-        :param table_name: Table name
-        :param columns: 작업 대상 column list
-        :param separate_col_val: INSERT_TEST 테이블의 경우 row separate_col 값
-        :param dbms_type: DBMS type
-        :return: Row data
+        Data file의 key에 해당하는 값 목록에서 임의의 값을 n개 선택하는 generator를 생성
+        :param key: Data file key (Column name or Group name)
+        :return: n을 인자로 받아 n개의 값 List를 반환하는 함수
         """
 
-        row_data = {}
-
-        # INSERT_TEST, UPDATE_TEST, DELETE_TEST 테이블 데이터 생성
-        if table_name.upper() in [INSERT_TEST, UPDATE_TEST]:
-
-            for column in columns:
-
-                column_name_upper = column.name.upper()
-                if column_name_upper == "T_ID":
-                    continue
-                elif column_name_upper == "SEPARATE_COL":
-                    column_data = separate_col_val
-                else:
-                    column_data = self._basic_data_select(column_name_upper)
-
-                row_data[column.name] = column_data
-
-        # STRING_TEST 테이블 데이터 생성
-        elif table_name.upper() == STRING_TEST:
-
-            for column in columns:
-
-                column_name_upper = column.name.upper()
-                if column_name_upper == "T_ID":
-                    continue
-                # COL_TEXT 컬럼 데이터 처리
-                elif column_name_upper == "COL_TEXT":
-                    column_data = self._lob_data_select(column_name_upper)
-                else:
-                    column_data = self._basic_data_select(column_name_upper)
-
-                row_data[column.name] = column_data
-
-        # NUMERIC_TEST 테이블 데이터 생성
-        elif table_name.upper() == NUMERIC_TEST:
-
-            for column in columns:
+        sample_data = self.file_data[key]
 
-                column_name_upper = column.name.upper()
-                if column_name_upper == "T_ID":
-                    continue
-
-                row_data[column.name] = self._basic_data_select(column_name_upper)
-
-        # DATETIME_TEST 테이블 데이터 생성
-        elif table_name.upper() == DATETIME_TEST:
+        try:
+            sample_data_count = len(sample_data)
+        except TypeError:
+            sample_data_count = 0
 
-            for column in columns:
+        if sample_data_count > 0:
+            return _generator(lambda n: random.choices(sample_data, k=n), lambda: random.choice(sample_data))
+        else:
+            return _generator(lambda n: [None] * n, lambda: None)
 
-                column_name_upper = column.name.upper()
-                if column_name_upper == "T_ID":
-                    continue
+    def _lob_data_generator(self, key, dbms_type=None):
+        """
+        Data file의 key에 해당하는 LOB file 목록에서 임의의 file n개를 선택하여 내용을 읽는 generator를 생성
+        :param key: Data file key (Column name or Group name)
+        :param dbms_type: DBMS type
+        :return: n을 인자로 받아 n개의 LOB 데이터 List를 반환하는 함수
+        """
 
-                sample_data_count = len(self.file_data[column_name_upper])
+        file_name_generator = self._basic_data_generator(key)
 
-                if sample_data_count > 0:
-                    tmp_data = self.file_data[column_name_upper][random.randrange(sample_data_count)]
-                    if column_name_upper == "COL_INTER_YEAR_MONTH":
-                        column_data = f"{tmp_data[0]}-{tmp_data[1]}"
-                    elif column_name_upper == "COL_INTER_DAY_SEC":
-                        if dbms_type == SQLSERVER:
-                            column_data = f"{tmp_data[0]} {tmp_data[1]:02d}:{tmp_data[2]:02d}:" \
-                                              f"{tmp_data[3]:02d}.{tmp_data[4]:06d}"
-                        else:
-                            column_data = timedelta(days=tmp_data[0], hours=tmp_data[1], minutes=tmp_data[2],
-                                                    seconds=tmp_data[3], microseconds=tmp_data[4])
-                    else:
-                        column_data = tmp_data
-                else:
-                    column_data = None
+        return _generator(lambda n: [self._read_lob_file(file_name, dbms_type)
+                                     for file_name in file_name_generator(n)],
+                          lambda: self._read_lob_file(file_name_generator.one(), dbms_type))
 
-                row_data[column.name] = column_data
+    def _get_sample_column_generator(self, table_name_upper, column_name_upper, dbms_type):
+        """
+        Sample table column의 데이터 생성 방식을 결정 (INSERT_TEST, UPDATE_TEST 테이블의 SEPARATE_COL 컬럼 제외)
+        :param table_name_upper: Table name (대문자)
+        :param column_name_upper: Column name (대문자)
+        :param dbms_type: DBMS type
+        :return: n을 인자로 받아 n개의 값 List를 반환하는 함수
+        """
 
-        # BINARY_TEST 테이블 데이터 생성
-        elif table_name.upper() == BINARY_TEST:
+        # STRING_TEST 테이블의 COL_TEXT 컬럼, LOB_TEST 테이블
+        if (table_name_upper == STRING_TEST and column_name_upper == "COL_TEXT") or table_name_upper == LOB_TEST:
+            return self._lob_data_generator(column_name_upper, dbms_type)
+
+        # DATETIME_TEST 테이블
+        elif table_name_upper == DATETIME_TEST:
+            tmp_data_generator = self._basic_data_generator(column_name_upper)
+
+            if column_name_upper == "COL_INTER_YEAR_MONTH":
+                def convert(tmp_data):
+                    return f"{tmp_data[0]}-{tmp_data[1]}"
+            elif column_name_upper == "COL_INTER_DAY_SEC" and dbms_type == SQLSERVER:
+                def convert(tmp_data):
+                    return f"{tmp_data[0]} {tmp_data[1]:02d}:{tmp_data[2]:02d}:{tmp_data[3]:02d}.{tmp_data[4]:06d}"
+            elif column_name_upper == "COL_INTER_DAY_SEC":
+                def convert(tmp_data):
+                    return timedelta(days=tmp_data[0], hours=tmp_data[1], minutes=tmp_data[2],
+                                     seconds=tmp_data[3], microseconds=tmp_data[4])
+            else:
+                return tmp_data_generator
 
-            for column in columns:
+            return self._converted_generator(tmp_data_generator, convert)
 
-                column_name_upper = column.name.upper()
-                if column_name_upper == "T_ID":
-                    continue
-                elif column_name_upper == "COL_LONG_BINARY":
-                    column_data = os.urandom(random.randrange(1, 2001))
-                else:
-                    column_data = os.urandom(random.randrange(1, 1001))
+        # BINARY_TEST 테이블
+        elif table_name_upper == BINARY_TEST:
+            max_length = 2001 if column_name_upper == "COL_LONG_BINARY" else 1001
+            return _generator(lambda n: [os.urandom(random.randrange(1, max_length)) for _ in range(n)],
+                              lambda: os.urandom(random.randrange(1, max_length)))
 
-                row_data[column.name] = column_data
+        # 그 외 (INSERT_TEST, UPDATE_TEST, STRING_TEST, NUMERIC_TEST, ORACLE_TEST, SQLSERVER_TEST)
+        else:
+            return self._basic_data_generator(column_name_upper)
 
-        # LOB_TEST 테이블 데이터 생성
-        elif table_name.upper() == LOB_TEST:
+    def _get_sample_table_generators(self, table_name, columns, dbms_type):
+        """
+        Sample table의 작업 대상 column별 데이터 생성 방식을 결정하며, (table, column list, dbms type)별로 한 번만
+        결정하여 재사용. SEPARATE_COL 컬럼은 호출시마다 값이 달라지므로 generator 대신 None으로 표시
+        :param table_name: Table name
+        :param columns: 작업 대상 column list
+        :param dbms_type: DBMS type
+        :return: [(column name, generator or None, 값 1개를 생성하는 함수 or None), ...]
+        """
 
-            for column in columns:
+        plan_key = (table_name, tuple([column.name for column in columns]), dbms_type)
 
-                column_name_upper = column.name.upper()
-                if column_name_upper == "T_ID":
-                    continue
+        if plan_key in self._sample_table_generators:
+            return self._sample_table_generators[plan_key]
 
-                row_data[column.name] = self._lob_data_select(column_name_upper)
+        table_name_upper = table_name.upper()
+        column_generators = []
 
-        # ORACLE_TEST 테이블 데이터 생성
-        elif table_name.upper() == ORACLE_TEST:
+        # DELETE_TEST 테이블은 데이터를 생성하지 않음
+        if table_name_upper in sample_tables and table_name_upper != DELETE_TEST:
 
             for column in columns:
 
@@ -221,423 +367,440 @@ class FuncsDataMaker:
                 if column_name_upper == "T_ID":
                     continue
 
-                row_data[column.name] = self._basic_data_select(column_name_upper)
-
-        # SQLSERVER_TEST 테이블 데이터 생성
-        elif table_name.upper() == SQLSERVER_TEST:
-
-            for column in columns:
-
-                column_name_upper = column.name.upper()
-                if column_name_upper == "T_ID":
-                    continue
+                if table_name_upper in [INSERT_TEST, UPDATE_TEST] and column_name_upper == "SEPARATE_COL":
+                    column_generators.append((column.name, None, None))
+                else:
+                    generator = self._get_sample_column_generator(table_name_upper, column_name_upper, dbms_type)
+                    column_generators.append((column.name, generator, generator.one))
 
-                row_data[column.name] = self._basic_data_select(column_name_upper)
+        self._sample_table_generators[plan_key] = column_generators
 
-        return row_data
+        return column_generators
 
-    def get_user_table_random_data(self, columns, dbms_type):
+    def get_sample_table_data(self, table_name, columns, separate_col_val=None, dbms_type=None):
         """
-        사용자 정의 테이블의 Row 단위 sample data 생성
+        Sample table의 Row 단위 Sample data를 생성
+        :param table_name: Table name
         :param columns: 작업 대상 column list
+        :param separate_col_val: INSERT_TEST 테이블의 경우 row separate_col 값
         :param dbms_type: DBMS type
-        :return: row data
+        :return: Row data
         """
 
-        row_data = {}
-
-        def group(data_type):
-            return f"GROUP.{data_type}"
-
-        class GROUP:
+        return {column_name: separate_col_val if generate_one is None else generate_one() for column_name, _, generate_one
+                in self._get_sample_table_generators(table_name, columns, dbms_type)}
 
-            CHAR = group("CHAR")
-            VARCHAR = group("VARCHAR")
+    def generate_batch(self, table, columns, number_of_data, separate_col_val=None, dbms_type=None,
+                       use_user_defined_data=False):
+        """
+        number_of_data 건의 Row data를 한 번에 생성.
+        column별 데이터 생성 방식은 한 번만 결정하여 재사용하며, column 단위로 값을 생성한 후 row로 조합함
+        :param table: Table Object
+        :param columns: 작업 대상 column list
+        :param number_of_data: 생성할 Row 수
+        :param separate_col_val: INSERT_TEST 테이블의 경우 row separate_col 값
+        :param dbms_type: DBMS type
+        :param use_user_defined_data: User Defined Data File 사용 여부
+        :return: Row data List
+        """
 
-            NUMBER = group("NUMBER")
-            BIT = group("BIT")
-            TINYINT = group("TINYINT")
-            SMALLINT = group("SMALLINT")
-            MEDIUMINT = group("MEDIUMINT")
-            INT = group("INT")
-            BIGINT = group("BIGINT")
-            DECIMAL = group("DECIMAL")
-            FLOAT = group("FLOAT")
-            DOUBLE = group("DOUBLE")
-            MONEY = group("MONEY")
+        if table.name.upper() in sample_tables:
+            column_generators = [(column_name, (lambda n: [separate_col_val] * n) if generator is None else generator)
+                                 for column_name, generator, _
+                                 in self._get_sample_table_generators(table.name, columns, dbms_type)]
+        elif use_user_defined_data:
+            return [self.get_user_table_user_defined_data(columns, dbms_type) for _ in range(number_of_data)]
+        else:
+            return self.get_column_generator_plan(columns, dbms_type).generate_batch(number_of_data)
 
-            TIME = group("TIME")
-            DATE = group("DATE")
-            DATETIME = group("DATETIME")
-            TIMESTAMP = group("TIMESTAMP")
-            INTERVAL_YEAR_MONTH = group("INTERVAL_YEAR_MONTH")
-            INTERVAL_DAY_SECOND = group("INTERVAL_DAY_SECOND")
-            DATETIMEOFFSET = group("DATETIMEOFFSET")
+        return _combine_column_values(column_generators, number_of_data)
 
-            CLOB = group("CLOB")
-            BLOB = group("BLOB")
+    def _random_bytes_generator(self, max_length):
+        """
+        0 ~ max_length-1 길이의 임의의 binary 데이터를 n개 생성하는 generator를 생성
+        :param max_length: binary 데이터 최대 길이 (미포함)
+        :return: n을 인자로 받아 n개의 binary 데이터 List를 반환하는 함수
+        """
+        return _generator(lambda n: [os.urandom(random.randrange(max_length)) for _ in range(n)],
+                          lambda: os.urandom(random.randrange(max_length)))
 
-            ROWID = group("ROWID")
+    def _converted_generator(self, generator, convert):
+        """
+        generator가 생성한 값을 convert 함수로 변환하는 generator를 생성
+        :param generator: 원본 generator
+        :param convert: 값 변환 함수
+        :return: n을 인자로 받아 변환된 n개의 값 List를 반환하는 함수
+        """
+        def convert_one():
+            value = generator.one()
+            return None if value is None else convert(value)
 
-        for column in columns:
+        return _generator(lambda n: [None if value is None else convert(value) for value in generator(n)],
+                          convert_one)
 
-            if column.default is not None:
-                continue
+    def _get_user_column_generator(self, column, dbms_type):
+        """
+        사용자 정의 테이블 column의 data type에 따라 user.dat에서 데이터를 생성할 방식을 결정
+        :param column: Column Object
+        :param dbms_type: DBMS type
+        :return: n을 인자로 받아 n개의 값 List를 반환하는 함수 (미지원 data type의 경우 None 값을 생성)
+        """
 
-            data_type = column.type
-            data_type_name = data_type.__class__.__name__
+        data_type = column.type
+        data_type_name = data_type.__class__.__name__
 
-            if dbms_type == ORACLE:
-                # GROUP.CHAR
-                if data_type_name in [TYPE.CHAR, TYPE.NCHAR]:
-                    column_data = self._basic_data_select(GROUP.CHAR)
+        if dbms_type == ORACLE:
+            # GROUP.CHAR
+            if data_type_name in [TYPE.CHAR, TYPE.NCHAR]:
+                return self._basic_data_generator(GROUP.CHAR)
 
-                # GROUP.VARCHAR
-                elif data_type_name in [TYPE.VARCHAR2, TYPE.NVARCHAR]:
-                    column_data = self._basic_data_select(GROUP.VARCHAR)
-
-                # GROUP.NUMBER
-                elif data_type_name == TYPE.NUMBER:
-                    column_data = self._basic_data_select(GROUP.NUMBER)
-
-                # GROUP.FLOAT
-                elif data_type_name in [TYPE.BINARY_FLOAT, TYPE.FLOAT]:
-                    column_data = self._basic_data_select(GROUP.FLOAT)
-
-                # GROUP.DOUBLE
-                elif data_type_name == TYPE.BINARY_DOUBLE:
-                    column_data = self._basic_data_select(GROUP.DOUBLE)
-
-                # GROUP.DATETIME
-                elif data_type_name == TYPE.DATE:
-                    column_data = self._basic_data_select(GROUP.DATETIME)
-
-                # GROUP.TIMESTAMP
-                elif data_type_name == TYPE.TIMESTAMP:
-                    column_data = self._basic_data_select(GROUP.TIMESTAMP)
-
-                # GROUP.INTERVAL_YEAR_MONTH
-                elif data_type_name == TYPE.INTERVAL:
-                    if "year_precision" in data_type.__dict__:
-                        tmp_data = self._basic_data_select(GROUP.INTERVAL_YEAR_MONTH)
-                        column_data = f"{tmp_data[0]}-{tmp_data[1]}"
-                    else:
-                        tmp_data = self._basic_data_select(GROUP.INTERVAL_DAY_SECOND)
-                        column_data = timedelta(days=tmp_data[0], hours=tmp_data[1], minutes=tmp_data[2],
-                                                seconds=tmp_data[3], microseconds=tmp_data[4])
+            # GROUP.VARCHAR
+            elif data_type_name in [TYPE.VARCHAR2, TYPE.NVARCHAR]:
+                return self._basic_data_generator(GROUP.VARCHAR)
 
-                # TYPE.RAW
-                elif data_type_name == TYPE.RAW:
-                    column_data = os.urandom(random.randrange(int(data_type.length)))
+            # GROUP.NUMBER
+            elif data_type_name == TYPE.NUMBER:
+                return self._basic_data_generator(GROUP.NUMBER)
 
-                # TYPE.LONG_RAW
-                elif data_type_name == TYPE.LONG_RAW:
-                    column_data = os.urandom(random.randrange(2000))
+            # GROUP.FLOAT
+            elif data_type_name in [TYPE.BINARY_FLOAT, TYPE.FLOAT]:
+                return self._basic_data_generator(GROUP.FLOAT)
 
-                # GROUP.CLOB
-                elif data_type_name in [TYPE.CLOB, TYPE.NCLOB, TYPE.LONG]:
-                    column_data = self._lob_data_select(GROUP.CLOB)
+            # GROUP.DOUBLE
+            elif data_type_name == TYPE.BINARY_DOUBLE:
+                return self._basic_data_generator(GROUP.DOUBLE)
 
-                # GROUP.BLOB
-                elif data_type_name == TYPE.BLOB:
-                    column_data = self._lob_data_select(GROUP.BLOB)
+            # GROUP.DATETIME
+            elif data_type_name == TYPE.DATE:
+                return self._basic_data_generator(GROUP.DATETIME)
 
-                # GROUP.ROWID
-                elif data_type_name == TYPE.ROWID:
-                    column_data = self._basic_data_select(GROUP.ROWID)
+            # GROUP.TIMESTAMP
+            elif data_type_name == TYPE.TIMESTAMP:
+                return self._basic_data_generator(GROUP.TIMESTAMP)
 
-                # Unsupported Data Type
+            # GROUP.INTERVAL_YEAR_MONTH / GROUP.INTERVAL_DAY_SECOND
+            elif data_type_name == TYPE.INTERVAL:
+                if "year_precision" in data_type.__dict__:
+                    return self._converted_generator(self._basic_data_generator(GROUP.INTERVAL_YEAR_MONTH),
+                                                     lambda tmp_data: f"{tmp_data[0]}-{tmp_data[1]}")
                 else:
-                    column_data = None
-
-            elif dbms_type == MYSQL:
-                # GROUP.CHAR
-                if data_type_name in [TYPE.CHAR, TYPE.NCHAR, TYPE.TINYTEXT]:
-                    column_data = self._basic_data_select(GROUP.CHAR)
-
-                # GROUP.VARCHAR
-                elif data_type_name in [TYPE.VARCHAR, TYPE.NVARCHAR, TYPE.TEXT]:
-                    column_data = self._basic_data_select(GROUP.VARCHAR)
-
-                # GROUP.TINYINT
-                elif data_type_name == TYPE.TINYINT:
-                    column_data = self._basic_data_select(GROUP.TINYINT)
-
-                # GROUP.SMALLINT
-                elif data_type_name == TYPE.SMALLINT:
-                    column_data = self._basic_data_select(GROUP.SMALLINT)
-
-                # GROUP.MEDIUMINT
-                elif data_type_name == TYPE.MEDIUMINT:
-                    column_data = self._basic_data_select(GROUP.MEDIUMINT)
-
-                # GROUP.INT
-                elif data_type_name in [TYPE.INT, TYPE.INTEGER]:
-                    column_data = self._basic_data_select(GROUP.INT)
-
-                # GROUP.BIGINT
-                elif data_type_name == TYPE.BIGINT:
-                    column_data = self._basic_data_select(GROUP.BIGINT)
-
-                # GROUP.DECIMAL
-                elif data_type_name in [TYPE.DECIMAL, TYPE.NUMERIC]:
-                    column_data = self._basic_data_select(GROUP.DECIMAL)
-
-                # GROUP.FLOAT
-                elif data_type_name == TYPE.FLOAT:
-                    column_data = self._basic_data_select(GROUP.FLOAT)
-
-                # GROUP.DOUBLE
-                elif data_type_name == TYPE.DOUBLE:
-                    column_data = self._basic_data_select(GROUP.DOUBLE)
-
-                # GROUP.TIME
-                elif data_type_name == TYPE.TIME:
-                    column_data = self._basic_data_select(GROUP.TIME)
-
-                # GROUP.DATE
-                elif data_type_name in [TYPE.DATE, TYPE.YEAR]:
-                    tmp_data = self._basic_data_select(GROUP.DATE)
-                    if data_type_name == TYPE.YEAR:
-                        column_data = tmp_data.year
-                    else:
-                        column_data = tmp_data
-
-                # GROUP.DATETIME
-                elif data_type_name == TYPE.DATETIME:
-                    column_data = self._basic_data_select(GROUP.DATETIME)
-
-                # GROUP.TIMESTAMP
-                elif data_type_name == TYPE.TIMESTAMP:
-                    column_data = self._basic_data_select(GROUP.TIMESTAMP)
-
-                # TYPE.BINARY
-                elif data_type_name == TYPE.BINARY:
-                    if data_type.length is None:
-                        data_type.length = 1
-                    column_data = os.urandom(random.randrange(data_type.length))
-
-                # TYPE.VARBINARY
-                elif data_type_name == TYPE.VARBINARY:
-                    column_data = os.urandom(random.randrange(data_type.length))
-
-                # TYPE.TINYBLOB
-                elif data_type_name == TYPE.TINYBLOB:
-                    column_data = os.urandom(random.randrange(255))
-
-                # TYPE.BLOB
-                elif data_type_name == TYPE.BLOB:
-                    if data_type.length is None:
-                        data_type.length = 65535
-                    column_data = os.urandom(random.randrange(data_type.length))
-
+                    return self._converted_generator(self._basic_data_generator(GROUP.INTERVAL_DAY_SECOND),
+                                                     lambda tmp_data: timedelta(days=tmp_data[0], hours=tmp_data[1],
+                                                                                minutes=tmp_data[2],
+                                                                                seconds=tmp_data[3],
+                                                                                microseconds=tmp_data[4]))
+
+            # TYPE.RAW
+            elif data_type_name == TYPE.RAW:
+                return self._random_bytes_generator(int(data_type.length))
+
+            # TYPE.LONG_RAW
+            elif data_type_name == TYPE.LONG_RAW:
+                return self._random_bytes_generator(2000)
+
+            # GROUP.CLOB
+            elif data_type_name in [TYPE.CLOB, TYPE.NCLOB, TYPE.LONG]:
+                return self._lob_data_generator(GROUP.CLOB, dbms_type)
+
+            # GROUP.BLOB
+            elif data_type_name == TYPE.BLOB:
+                return self._lob_data_generator(GROUP.BLOB, dbms_type)
+
+            # GROUP.ROWID
+            elif data_type_name == TYPE.ROWID:
+                return self._basic_data_generator(GROUP.ROWID)
+
+        elif dbms_type == MYSQL:
+            # GROUP.CHAR
+            if data_type_name in [TYPE.CHAR, TYPE.NCHAR, TYPE.TINYTEXT]:
+                return self._basic_data_generator(GROUP.CHAR)
+
+            # GROUP.VARCHAR
+            elif data_type_name in [TYPE.VARCHAR, TYPE.NVARCHAR, TYPE.TEXT]:
+                return self._basic_data_generator(GROUP.VARCHAR)
+
+            # GROUP.TINYINT
+            elif data_type_name == TYPE.TINYINT:
+                return self._basic_data_generator(GROUP.TINYINT)
+
+            # GROUP.SMALLINT
+            elif data_type_name == TYPE.SMALLINT:
+                return self._basic_data_generator(GROUP.SMALLINT)
+
+            # GROUP.MEDIUMINT
+            elif data_type_name == TYPE.MEDIUMINT:
+                return self._basic_data_generator(GROUP.MEDIUMINT)
+
+            # GROUP.INT
+            elif data_type_name in [TYPE.INT, TYPE.INTEGER]:
+                return self._basic_data_generator(GROUP.INT)
+
+            # GROUP.BIGINT
+            elif data_type_name == TYPE.BIGINT:
+                return self._basic_data_generator(GROUP.BIGINT)
+
+            # GROUP.DECIMAL
+            elif data_type_name in [TYPE.DECIMAL, TYPE.NUMERIC]:
+                return self._basic_data_generator(GROUP.DECIMAL)
+
+            # GROUP.FLOAT
+            elif data_type_name == TYPE.FLOAT:
+                return self._basic_data_generator(GROUP.FLOAT)
+
+            # GROUP.DOUBLE
+            elif data_type_name == TYPE.DOUBLE:
+                return self._basic_data_generator(GROUP.DOUBLE)
+
+            # GROUP.TIME
+            elif data_type_name == TYPE.TIME:
+                return self._basic_data_generator(GROUP.TIME)
+
+            # GROUP.DATE
+            elif data_type_name == TYPE.DATE:
+                return self._basic_data_generator(GROUP.DATE)
+
+            elif data_type_name == TYPE.YEAR:
+                return self._converted_generator(self._basic_data_generator(GROUP.DATE),
+                                                 lambda tmp_data: tmp_data.year)
+
+            # GROUP.DATETIME
+            elif data_type_name == TYPE.DATETIME:
+                return self._basic_data_generator(GROUP.DATETIME)
+
+            # GROUP.TIMESTAMP
+            elif data_type_name == TYPE.TIMESTAMP:
+                return self._basic_data_generator(GROUP.TIMESTAMP)
+
+            # TYPE.BINARY
+            elif data_type_name == TYPE.BINARY:
+                if data_type.length is None:
+                    data_type.length = 1
+                return self._random_bytes_generator(data_type.length)
+
+            # TYPE.VARBINARY
+            elif data_type_name == TYPE.VARBINARY:
+                return self._random_bytes_generator(data_type.length)
+
+            # TYPE.TINYBLOB
+            elif data_type_name == TYPE.TINYBLOB:
+                return self._random_bytes_generator(255)
+
+            # TYPE.BLOB
+            elif data_type_name == TYPE.BLOB:
+                if data_type.length is None:
+                    data_type.length = 65535
+                return self._random_bytes_generator(data_type.length)
+
+            # GROUP.CLOB
+            elif data_type_name in [TYPE.MEDIUMTEXT, TYPE.LONGTEXT]:
+                return self._lob_data_generator(GROUP.CLOB, dbms_type)
+
+            # GROUP.BLOB
+            elif data_type_name in [TYPE.MEDIUMBLOB, TYPE.LONGBLOB]:
+                return self._lob_data_generator(GROUP.BLOB, dbms_type)
+
+        elif dbms_type == SQLSERVER:
+            # GROUP.CHAR
+            if data_type_name in [TYPE.CHAR, TYPE.NCHAR]:
+                return self._basic_data_generator(GROUP.CHAR)
+
+            # GROUP.VARCHAR / GROUP.CLOB
+            elif data_type_name in [TYPE.VARCHAR, TYPE.NVARCHAR]:
                 # GROUP.CLOB
-                elif data_type_name in [TYPE.MEDIUMTEXT, TYPE.LONGTEXT]:
-                    column_data = self._lob_data_select(GROUP.CLOB)
-
-                # GROUP.BLOB
-                elif data_type_name in [TYPE.MEDIUMBLOB, TYPE.LONGBLOB]:
-                    column_data = self._lob_data_select(GROUP.BLOB)
-
-                # Unsupported Data Type
+                if data_type.length == "MAX":
+                    return self._lob_data_generator(GROUP.CLOB, dbms_type)
+                # GROUP.VARCHAR
                 else:
-                    column_data = None
-
-            elif dbms_type == SQLSERVER:
-                # GROUP.CHAR
-                if data_type_name in [TYPE.CHAR, TYPE.NCHAR]:
-                    column_data = self._basic_data_select(GROUP.CHAR)
-
-                # GROUP.VARCHAR / GROUP.CLOB
-                elif data_type_name in [TYPE.VARCHAR, TYPE.NVARCHAR]:
-                    # GROUP.CLOB
-                    if data_type.length == "MAX":
-                        column_data = self._lob_data_select(GROUP.CLOB)
-                    # GROUP.VARCHAR
-                    else:
-                        column_data = self._basic_data_select(GROUP.VARCHAR)
+                    return self._basic_data_generator(GROUP.VARCHAR)
 
-                # GROUP.BIT
-                elif data_type_name == TYPE.BIT:
-                    column_data = self._basic_data_select(GROUP.BIT)
+            # GROUP.BIT
+            elif data_type_name == TYPE.BIT:
+                return self._basic_data_generator(GROUP.BIT)
 
-                # GROUP.TINYINT
-                elif data_type_name == TYPE.TINYINT:
-                    column_data = self._basic_data_select(GROUP.TINYINT)
+            # GROUP.TINYINT
+            elif data_type_name == TYPE.TINYINT:
+                return self._basic_data_generator(GROUP.TINYINT)
 
-                # GROUP.SMALLINT
-                elif data_type_name == TYPE.SMALLINT:
-                    column_data = self._basic_data_select(GROUP.SMALLINT)
+            # GROUP.SMALLINT
+            elif data_type_name == TYPE.SMALLINT:
+                return self._basic_data_generator(GROUP.SMALLINT)
 
-                # GROUP.INT
-                elif data_type_name in [TYPE.INT, TYPE.INTEGER]:
-                    column_data = self._basic_data_select(GROUP.INT)
+            # GROUP.INT
+            elif data_type_name in [TYPE.INT, TYPE.INTEGER]:
+                return self._basic_data_generator(GROUP.INT)
 
-                # GROUP.BIGINT
-                elif data_type_name == TYPE.BIGINT:
-                    column_data = self._basic_data_select(GROUP.BIGINT)
+            # GROUP.BIGINT
+            elif data_type_name == TYPE.BIGINT:
+                return self._basic_data_generator(GROUP.BIGINT)
 
-                # GROUP.DECIMAL
-                elif data_type_name in [TYPE.DECIMAL, TYPE.NUMERIC]:
-                    column_data = self._basic_data_select(GROUP.DECIMAL)
+            # GROUP.DECIMAL
+            elif data_type_name in [TYPE.DECIMAL, TYPE.NUMERIC]:
+                return self._basic_data_generator(GROUP.DECIMAL)
 
-                # GROUP.FLOAT
-                elif data_type_name == TYPE.REAL:
-                    column_data = self._basic_data_select(GROUP.FLOAT)
+            # GROUP.FLOAT
+            elif data_type_name == TYPE.REAL:
+                return self._basic_data_generator(GROUP.FLOAT)
 
-                # GROUP.DOUBLE
-                elif data_type_name == TYPE.FLOAT:
-                    column_data = self._basic_data_select(GROUP.DOUBLE)
+            # GROUP.DOUBLE
+            elif data_type_name == TYPE.FLOAT:
+                return self._basic_data_generator(GROUP.DOUBLE)
 
-                # GROUP.MONEY
-                elif data_type_name in [TYPE.SMALLMONEY, TYPE.MONEY]:
-                    column_data = self._basic_data_select(GROUP.MONEY)
+            # GROUP.MONEY
+            elif data_type_name in [TYPE.SMALLMONEY, TYPE.MONEY]:
+                return self._basic_data_generator(GROUP.MONEY)
 
-                # GROUP.TIME
-                elif data_type_name == TYPE.TIME:
-                    column_data = self._basic_data_select(GROUP.TIME)
+            # GROUP.TIME
+            elif data_type_name == TYPE.TIME:
+                return self._basic_data_generator(GROUP.TIME)
 
-                # GROUP.DATE
-                elif data_type_name == TYPE.DATE:
-                    column_data = self._basic_data_select(GROUP.DATE)
+            # GROUP.DATE
+            elif data_type_name == TYPE.DATE:
+                return self._basic_data_generator(GROUP.DATE)
 
-                # GROUP.DATETIME
-                elif data_type_name == TYPE.SMALLDATETIME:
-                    column_data = self._basic_data_select(GROUP.DATETIME)
+            # GROUP.DATETIME
+            elif data_type_name == TYPE.SMALLDATETIME:
+                return self._basic_data_generator(GROUP.DATETIME)
 
-                # GROUP.TIMESTAMP
-                elif data_type_name in [TYPE.DATETIME, TYPE.DATETIME2]:
-                    column_data = self._basic_data_select(GROUP.TIMESTAMP)
+            # GROUP.TIMESTAMP
+            elif data_type_name in [TYPE.DATETIME, TYPE.DATETIME2]:
+                return self._basic_data_generator(GROUP.TIMESTAMP)
 
-                # GROUP.DATETIMEOFFSET:
-                elif data_type_name == TYPE.DATETIMEOFFSET:
-                    column_data = self._basic_data_select(GROUP.DATETIMEOFFSET)
+            # GROUP.DATETIMEOFFSET:
+            elif data_type_name == TYPE.DATETIMEOFFSET:
+                return self._basic_data_generator(GROUP.DATETIMEOFFSET)
 
-                # TYPE.BINARY
-                elif data_type_name == TYPE.BINARY:
-                    if data_type.length is None:
-                        data_type.length = 1
-                    column_data = os.urandom(random.randrange(data_type.length))
-
-                # TYPE.VARBINARY / GROUP.BLOB
-                elif data_type_name == TYPE.VARBINARY:
-                    # GROUP.BLOB
-                    if data_type.length == "MAX":
-                        column_data = self._lob_data_select(GROUP.BLOB)
-                    else:
-                        if data_type.length is None:
-                            data_type.length = 1
-                        column_data = os.urandom(random.randrange(data_type.length))
+            # TYPE.BINARY
+            elif data_type_name == TYPE.BINARY:
+                if data_type.length is None:
+                    data_type.length = 1
+                return self._random_bytes_generator(data_type.length)
 
-                # Unsupported Data Type
+            # TYPE.VARBINARY / GROUP.BLOB
+            elif data_type_name == TYPE.VARBINARY:
+                # GROUP.BLOB
+                if data_type.length == "MAX":
+                    return self._lob_data_generator(GROUP.BLOB, dbms_type)
                 else:
-                    column_data = None
+                    if data_type.length is None:
+                        data_type.length = 1
+                    return self._random_bytes_generator(data_type.length)
 
-            else:   # POSTGRESQL
+        else:   # POSTGRESQL
 
-                # GROUP.CHAR
-                if data_type_name == TYPE.CHAR:
-                    column_data = self._basic_data_select(GROUP.CHAR)
+            # GROUP.CHAR
+            if data_type_name == TYPE.CHAR:
+                return self._basic_data_generator(GROUP.CHAR)
 
-                # GROUP.VARCHAR
-                elif data_type_name == TYPE.VARCHAR:
-                    column_data = self._basic_data_select(GROUP.VARCHAR)
+            # GROUP.VARCHAR
+            elif data_type_name == TYPE.VARCHAR:
+                return self._basic_data_generator(GROUP.VARCHAR)
 
-                # GROUP.SMALLINT
-                elif data_type_name == TYPE.SMALLINT:
-                    column_data = self._basic_data_select(GROUP.SMALLINT)
+            # GROUP.SMALLINT
+            elif data_type_name == TYPE.SMALLINT:
+                return self._basic_data_generator(GROUP.SMALLINT)
 
-                # GROUP.INT
-                elif data_type_name in [TYPE.INT, TYPE.INTEGER]:
-                    column_data = self._basic_data_select(GROUP.INT)
+            # GROUP.INT
+            elif data_type_name in [TYPE.INT, TYPE.INTEGER]:
+                return self._basic_data_generator(GROUP.INT)
 
-                # GROUP.BIGINT
-                elif data_type_name == TYPE.BIGINT:
-                    column_data = self._basic_data_select(GROUP.BIGINT)
+            # GROUP.BIGINT
+            elif data_type_name == TYPE.BIGINT:
+                return self._basic_data_generator(GROUP.BIGINT)
 
-                # GROUP.DECIMAL
-                elif data_type_name in [TYPE.DECIMAL, TYPE.NUMERIC]:
-                    column_data = self._basic_data_select(GROUP.DECIMAL)
+            # GROUP.DECIMAL
+            elif data_type_name in [TYPE.DECIMAL, TYPE.NUMERIC]:
+                return self._basic_data_generator(GROUP.DECIMAL)
 
-                # GROUP.FLOAT
-                elif data_type_name == TYPE.REAL:
-                    column_data = self._basic_data_select(GROUP.FLOAT)
+            # GROUP.FLOAT
+            elif data_type_name == TYPE.REAL:
+                return self._basic_data_generator(GROUP.FLOAT)
 
-                # GROUP.DOUBLE
-                elif data_type_name == TYPE.DOUBLE_PRECISION_:
-                    column_data = self._basic_data_select(GROUP.DOUBLE)
+            # GROUP.DOUBLE
+            elif data_type_name == TYPE.DOUBLE_PRECISION_:
+                return self._basic_data_generator(GROUP.DOUBLE)
 
-                # GROUP.MONEY
-                elif data_type_name == TYPE.MONEY:
-                    column_data = self._basic_data_select(GROUP.MONEY)
+            # GROUP.MONEY
+            elif data_type_name == TYPE.MONEY:
+                return self._basic_data_generator(GROUP.MONEY)
 
-                # GROUP.TIME
-                elif data_type_name == TYPE.TIME:
-                    column_data = self._basic_data_select(GROUP.TIME)
+            # GROUP.TIME
+            elif data_type_name == TYPE.TIME:
+                return self._basic_data_generator(GROUP.TIME)
 
-                # GROUP.DATE
-                elif data_type_name == TYPE.DATE:
-                    column_data = self._basic_data_select(GROUP.DATE)
+            # GROUP.DATE
+            elif data_type_name == TYPE.DATE:
+                return self._basic_data_generator(GROUP.DATE)
 
-                # GROUP.TIMESTAMP
-                elif data_type_name == TYPE.TIMESTAMP:
-                    column_data = self._basic_data_select(GROUP.TIMESTAMP)
+            # GROUP.TIMESTAMP
+            elif data_type_name == TYPE.TIMESTAMP:
+                return self._basic_data_generator(GROUP.TIMESTAMP)
 
-                # GROUP.INTERVAL
-                elif data_type_name == TYPE.INTERVAL:
+            # GROUP.INTERVAL
+            elif data_type_name == TYPE.INTERVAL:
 
-                    if data_type.fields is None:
-                        data_type.fields = TYPE.interval_fields[random.randrange(len(TYPE.interval_fields))]
+                # fields가 지정되지 않은 경우 임의의 fields로 고정
+                if data_type.fields is None:
+                    data_type.fields = TYPE.interval_fields[random.randrange(len(TYPE.interval_fields))]
 
-                    if data_type.fields in ["YEAR", "MONTH", "YEAR TO MONTH"]:
-                        tmp_data = self._basic_data_select(GROUP.INTERVAL_YEAR_MONTH)
-                    else:
-                        tmp_data = self._basic_data_select(GROUP.INTERVAL_DAY_SECOND)
-
-                    if data_type.fields == "YEAR":
-                        column_data = f"{tmp_data[0]}"
-                    elif data_type.fields == "MONTH":
-                        column_data = f"{tmp_data[1]}"
-                    elif data_type.fields == "DAY":
-                        column_data = timedelta(days=tmp_data[0])
-                    elif data_type.fields == "HOUR":
-                        column_data = timedelta(hours=tmp_data[1])
-                    elif data_type.fields == "MINUTE":
-                        column_data = timedelta(minutes=tmp_data[2])
-                    elif data_type.fields == "SECOND":
-                        column_data = timedelta(seconds=tmp_data[3])
-                    elif data_type.fields == "YEAR TO MONTH":
-                        column_data = f"{tmp_data[0]}-{tmp_data[1]}"
-                    elif data_type.fields == "DAY TO HOUR":
-                        column_data = timedelta(days=tmp_data[0], hours=tmp_data[1])
-                    elif data_type.fields == "DAY TO MINUTE":
-                        column_data = timedelta(days=tmp_data[0], minutes=tmp_data[2])
-                    elif data_type.fields == "DAY TO SECOND":
-                        column_data = timedelta(days=tmp_data[0], seconds=tmp_data[3])
-                    elif data_type.fields == "HOUR TO MINUTE":
-                        column_data = timedelta(hours=tmp_data[1], minutes=tmp_data[2])
-                    elif data_type.fields == "HOUR TO SECOND":
-                        column_data = timedelta(hours=tmp_data[1], seconds=tmp_data[3])
-                    elif data_type.fields == "MINUTE TO SECOND":
-                        column_data = timedelta(minutes=tmp_data[2], seconds=tmp_data[3])
-                    else:
-                        column_data = None
+                if data_type.fields in ["YEAR", "MONTH", "YEAR TO MONTH"]:
+                    tmp_data_generator = self._basic_data_generator(GROUP.INTERVAL_YEAR_MONTH)
+                else:
+                    tmp_data_generator = self._basic_data_generator(GROUP.INTERVAL_DAY_SECOND)
+
+                interval_converts = {
+                    "YEAR": lambda tmp_data: f"{tmp_data[0]}",
+                    "MONTH": lambda tmp_data: f"{tmp_data[1]}",
+                    "DAY": lambda tmp_data: timedelta(days=tmp_data[0]),
+                    "HOUR": lambda tmp_data: timedelta(hours=tmp_data[1]),
+                    "MINUTE": lambda tmp_data: timedelta(minutes=tmp_data[2]),
+                    "SECOND": lambda tmp_data: timedelta(seconds=tmp_data[3]),
+                    "YEAR TO MONTH": lambda tmp_data: f"{tmp_data[0]}-{tmp_data[1]}",
+                    "DAY TO HOUR": lambda tmp_data: timedelta(days=tmp_data[0], hours=tmp_data[1]),
+                    "DAY TO MINUTE": lambda tmp_data: timedelta(days=tmp_data[0], minutes=tmp_data[2]),
+                    "DAY TO SECOND": lambda tmp_data: timedelta(days=tmp_data[0], seconds=tmp_data[3]),
+                    "HOUR TO MINUTE": lambda tmp_data: timedelta(hours=tmp_data[1], minutes=tmp_data[2]),
+                    "HOUR TO SECOND": lambda tmp_data: timedelta(hours=tmp_data[1], seconds=tmp_data[3]),
+                    "MINUTE TO SECOND": lambda tmp_data: timedelta(minutes=tmp_data[2], seconds=tmp_data[3])
+                }
+
+                if data_type.fields in interval_converts:
+                    return self._converted_generator(tmp_data_generator, interval_converts[data_type.fields])
+
+            # GROUP.CLOB
+            elif data_type_name == TYPE.TEXT:
+                return self._lob_data_generator(GROUP.CLOB, dbms_type)
+
+            # GROUP.BLOB
+            elif data_type_name == TYPE.BYTEA:
+                return self._lob_data_generator(GROUP.BLOB, dbms_type)
+
+        # Unsupported Data Type
+        return _generator(lambda n: [None] * n, lambda: None)
+
+    def get_column_generator_plan(self, columns, dbms_type):
+        """
+        작업 대상 column list에 대한 ColumnGeneratorPlan을 조회하며, 없을 경우 생성하여 재사용
+        :param columns: 작업 대상 column list
+        :param dbms_type: DBMS type
+        :return: ColumnGeneratorPlan instance
+        """
 
-                # GROUP.CLOB
-                elif data_type_name == TYPE.TEXT:
-                    column_data = self._lob_data_select(GROUP.CLOB)
+        plan_key = (tuple((column.table.name, column.name) for column in columns), dbms_type)
 
-                # GROUP.BLOB
-                elif data_type_name == TYPE.BYTEA:
-                    column_data = self._lob_data_select(GROUP.BLOB)
+        if plan_key not in self._column_generator_plans:
+            self._column_generator_plans[plan_key] = ColumnGeneratorPlan(self, columns, dbms_type)
 
-                # Unsupported Data Type
-                else:
-                    column_data = None
+        return self._column_generator_plans[plan_key]
 
-            row_data[column.name] = column_data
+    def get_user_table_random_data(self, columns, dbms_type):
+        """
+        사용자 정의 테이블의 Row 단위 sample data 생성
+        :param columns: 작업 대상 column list
+        :param dbms_type: DBMS type
+        :return: row data
+        """
 
-        return row_data
+        return self.get_column_generator_plan(columns, dbms_type).get_row_data()
 
     def get_user_table_user_defined_data(self, columns, dbms_type):
         """
@@ -693,7 +856,7 @@ class FuncsDataMaker:
                         column_data = os.urandom(random.randrange(min_length, max_length+1))
 
                     elif data_type_name in [TYPE.CLOB, TYPE.NCLOB, TYPE.BLOB, TYPE.LONG]:
-                        column_data = self._lob_data_select(column_name_upper)
+                        column_data = self._lob_data_select(column_name_upper, dbms_type)
 
                     else:
                         column_data = self._basic_data_select(column_name_upper)
@@ -706,7 +869,7 @@ class FuncsDataMaker:
                         column_data = os.urandom(random.randrange(min_length, max_length + 1))
 
                     elif data_type_name in [TYPE.MEDIUMTEXT, TYPE.LONGTEXT, TYPE.MEDIUMBLOB, TYPE.LONGBLOB]:
-                        column_data = self._lob_data_select(column_name_upper)
+                        column_data = self._lob_data_select(column_name_upper, dbms_type)
 
                     else:
                         column_data = self._basic_data_select(column_name_upper)
@@ -715,13 +878,13 @@ class FuncsDataMaker:
 
                     if data_type_name in [TYPE.VARCHAR, TYPE.NVARCHAR]:
                         if data_type.length == "MAX":
-                            column_data = self._lob_data_select(column_name_upper)
+                            column_data = self._lob_data_select(column_name_upper, dbms_type)
                         else:
                             column_data = self._basic_data_select(column_name_upper)
 
                     elif data_type_name in [TYPE.BINARY, TYPE.VARBINARY]:
                         if data_type_name == TYPE.VARBINARY and data_type.length == "MAX":
-                            column_data = self._lob_data_select(column_name_upper)
+                            column_data = self._lob_data_select(column_name_upper, dbms_type)
                         else:
                             column_data = self._basic_data_select(column_name_upper)
 
@@ -752,7 +915,7 @@ class FuncsDataMaker:
                             )
 
                     elif data_type_name in [TYPE.TEXT, TYPE.BYTEA]:
-                        column_data = self._lob_data_select(column_name_upper)
+                        column_data = self._lob_data_select(column_name_upper, dbms_type)
 
                     else:
                         column_data = self._basic_data_select(column_name_upper)
@@ -763,3 +926,62 @@ class FuncsDataMaker:
             row_data[column.name] = column_data
 
         return row_data
+
+
+class ColumnGeneratorPlan:
+    """
+    사용자 정의 테이블의 column별 데이터 생성 함수를 미리 결정해 둔 실행 계획.
+    (table, dbms_type)별로 한 번만 생성하며, row 생성시에는 data type 분기 없이 생성 함수만 호출함
+    """
+
+    def __init__(self, data_maker, columns, dbms_type):
+
+        self.dbms_type = dbms_type
+        self.column_generators = [(column.name, data_maker._get_user_column_generator(column, dbms_type))
+                                  for column in columns if column.default is None]
+        self.value_generators = [(column_name, generator.one) for column_name, generator in self.column_generators]
+
+    def get_row_data(self):
+        """
+        Row 단위 데이터 생성
+        :return: Row data
+        """
+        return {column_name: generate_one() for column_name, generate_one in self.value_generators}
+
+    def generate_batch(self, number_of_data):
+        """
+        number_of_data 건의 Row data를 column 단위로 생성
+        :param number_of_data: 생성할 Row 수
+        :return: Row data List
+        """
+        return _combine_column_values(self.column_generators, number_of_data)
+
+
+def _generator(generate, generate_one):
+    """
+    n개의 값을 생성하는 함수에 값 1개를 생성하는 함수 (one)를 연결.
+    Row 단위로 데이터를 생성하는 경우 n=1의 List 생성 비용 없이 값 1개를 생성하기 위해 사용
+    :param generate: n을 인자로 받아 n개의 값 List를 반환하는 함수
+    :param generate_one: 값 1개를 반환하는 함수
+    :return: generate (generate.one 으로 generate_one 호출)
+    """
+
+    generate.one = generate_one
+    return generate
+
+
+def _combine_column_values(column_generators, number_of_data):
+    """
+    column별로 생성한 값을 Row data List로 조합
+    :param column_generators: [(column name, generator), ...]
+    :param number_of_data: 생성할 Row 수
+    :return: Row data List
+    """
+
+    column_names = [column_name for column_name, _ in column_generators]
+    column_values = [generator(number_of_data) for _, generator in column_generators]
+
+    if not column_names:
+        return [{} for _ in range(number_of_data)]
+
+    return [dict(zip(column_names, row_values)) for row_values in zip(*column_values)]
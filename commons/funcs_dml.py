@@ -1,16 +1,34 @@
-from commons.constants import tqdm_bar_format, tqdm_ncols, tqdm_bench_postfix, INSERT_TEST, sample_tables
+from commons.constants import tqdm_bar_format, tqdm_ncols, tqdm_bench_postfix, INSERT_TEST, sample_tables, \
+    DEFAULT_QUEUE_DEPTH
 from commons.funcs_common import get_commit_msg, get_rollback_msg, exec_database_error, get_separate_col_val, \
                                  print_error_msg, exec_statement_error
+from commons.funcs_bulkload import get_bulk_loader
+from commons.funcs_datamaker import FuncsDataMaker
+from commons.funcs_latency import LatencyRecorder, GENERATE, BIND, COMMIT
+from commons.funcs_profiler import start_profile, stop_profile
+from commons.funcs_stmtcache import StatementCache
+from commons.mgr_connection import ConnectionManager
 from commons.mgr_logger import LoggerManager
 
-from sqlalchemy import text, func
+from sqlalchemy import text
 from sqlalchemy.exc import DatabaseError, StatementError
 from sqlalchemy.sql.expression import bindparam
 from tqdm import tqdm
 
+import math
+import multiprocessing
+import queue
+import random
+import threading
 import time
 
 
+_PROGRESS = "PROGRESS"
+_RESULT = "RESULT"
+
+_STREAM_CHUNK_SIZE = 10000
+
+
 class FuncsDml:
 
     def __init__(self, conn):
@@ -18,11 +36,17 @@ class FuncsDml:
         self.logger = LoggerManager.get_logger(__name__)
         self.log_level = LoggerManager.get_log_level()
 
+        self.conn_info = conn.conn_info
         self.engine = conn.engine
-        self.connection = conn.engine.connect()
+        # 반복 수행되는 Statement를 재사용하고, 컴파일 결과를 compiled_cache에 저장하여 재사용
+        self.statement_cache = StatementCache()
+        self.connection = self.statement_cache.connect(conn.engine)
         self.db_session = conn.db_session
         self.dbms_type = conn.dbms_type
 
+        # Statement 수행 및 Commit 소요시간 분포
+        self.latency = LatencyRecorder()
+
     def single_insert(self, table, selected_columns, number_of_data, commit_unit, data_maker, rollback, verbose,
                       use_user_defined_data):
         """
@@ -39,6 +63,7 @@ class FuncsDml:
         """
 
         start_time = time.time()
+        start_profile()
 
         try:
             table_name = table.__table__.name
@@ -47,6 +72,9 @@ class FuncsDml:
             else:
                 separate_col_val = None
 
+            # Commit 단위 데이터 생성 (ORM 객체 생성 포함) 시작 시점
+            batch_start_time = time.perf_counter()
+
             for i in tqdm(range(1, number_of_data+1), disable=verbose, ncols=tqdm_ncols, bar_format=tqdm_bar_format,
                           postfix=tqdm_bench_postfix(rollback)):
                 
@@ -61,24 +89,18 @@ class FuncsDml:
                 self.db_session.add(table(data=row_data))
 
                 if i % commit_unit == 0:
-                    if rollback:
-                        self.db_session.rollback()
-                        self.logger.debug(get_rollback_msg(separate_col_val))
-                    else:
-                        self.db_session.commit()
-                        self.logger.debug(get_commit_msg(separate_col_val))
+                    self.latency.add_phase_time(GENERATE, time.perf_counter() - batch_start_time)
+                    self._complete_session(rollback, separate_col_val, commit_unit)
                     if table_name == INSERT_TEST:
                         separate_col_val += 1
+                    batch_start_time = time.perf_counter()
 
             # 총 데이터 수가 커밋 단위로 나누어 떨어지지 않은 경우
             if number_of_data % commit_unit != 0:
-                if rollback:
-                    self.db_session.rollback()
-                    self.logger.debug(get_rollback_msg(separate_col_val))
-                else:
-                    self.db_session.commit()
-                    self.logger.debug(get_commit_msg(separate_col_val))
+                self.latency.add_phase_time(GENERATE, time.perf_counter() - batch_start_time)
+                self._complete_session(rollback, separate_col_val, number_of_data % commit_unit)
 
+            stop_profile()
             end_time = time.time()
 
             return {"start_time": start_time, "end_time": end_time}
@@ -89,16 +111,38 @@ class FuncsDml:
         except DatabaseError as dberr:
             exec_database_error(self.logger, self.log_level, dberr)
 
+    def _complete_session(self, rollback, end_count, number_of_data):
+        """
+        ORM Session에 추가된 데이터를 insert (flush) 한 후 Commit 또는 Rollback
+        :param rollback: Rollback 수행 여부
+        :param end_count: 로그에 남길 Commit 번호
+        :param number_of_data: Session에 추가된 데이터 수
+        """
+
+        self.latency.execute(self.db_session.flush, rows=number_of_data)
+
+        complete_start_time = time.perf_counter()
+        if rollback:
+            self.db_session.rollback()
+            self.logger.debug(get_rollback_msg(end_count))
+        else:
+            self.db_session.commit()
+            self.logger.debug(get_commit_msg(end_count))
+        self.latency.record(COMMIT, time.perf_counter() - complete_start_time)
+
     def _complete_tx(self, tx, rollback, end_count):
+        complete_start_time = time.perf_counter()
         if rollback is True:
             tx.rollback()
             self.logger.debug(get_rollback_msg(end_count))
         else:
             tx.commit()
             self.logger.debug(get_commit_msg(end_count))
+        self.latency.record(COMMIT, time.perf_counter() - complete_start_time)
 
     def multi_insert(self, table, selected_columns, number_of_data, commit_unit, data_maker, rollback, verbose,
-                     use_user_defined_data):
+                     use_user_defined_data, separate_col_val=None, progress_queue=None, bulk_load=False,
+                     queue_depth=DEFAULT_QUEUE_DEPTH):
         """
         Oracle Multi Insert
         :param table: Table Object
@@ -109,50 +153,61 @@ class FuncsDml:
         :param rollback: Rollback 수행 여부
         :param verbose: 작업 진행도 (Progress bar) 표시 여부
         :param use_user_defined_data: User Defined Data File 사용 여부
+        :param separate_col_val: INSERT_TEST 테이블의 SEPARATE_COL 시작값 (None일 경우 DB에서 조회)
+        :param progress_queue: worker process로 수행될 경우 commit 단위 진행도를 전달할 Queue
+        :param bulk_load: DBMS별 Native Bulk Load 사용 여부
+        :param queue_depth: 미리 생성해 둘 Commit 단위 데이터 수 (0일 경우 생성과 Insert를 순차적으로 수행)
         :return: {작업 시작시간, 작업 종료시간}
         """
 
-        list_of_row_data = []
         end_count = 1
+        bulk_loader = get_bulk_loader(self.dbms_type, bulk_load, self.statement_cache)
 
         start_time = time.time()
+        start_profile()
 
         try:
 
             # INSERT_TEST 테이블 separate_col_val 처리
             if table.name.upper() == INSERT_TEST:
-                separate_col_val = get_separate_col_val(self.engine, table, table.columns.keys()[3])
+                if separate_col_val is None:
+                    separate_col_val = get_separate_col_val(self.engine, table, table.columns.keys()[3])
             else:
                 separate_col_val = None
 
-            for i in tqdm(range(1, number_of_data+1), disable=verbose, ncols=tqdm_ncols, bar_format=tqdm_bar_format,
-                          postfix=tqdm_bench_postfix(rollback)):
+            progress_bar = tqdm(total=number_of_data, disable=verbose, ncols=tqdm_ncols, bar_format=tqdm_bar_format,
+                                postfix=tqdm_bench_postfix(rollback))
 
-                if table.name.upper() in sample_tables:
-                    row_data = data_maker.get_sample_table_data(table.name, selected_columns, separate_col_val,
-                                                                dbms_type=self.dbms_type)
-                elif use_user_defined_data:
-                    row_data = data_maker.get_user_table_user_defined_data(selected_columns, self.dbms_type)
-                else:
-                    row_data = data_maker.get_user_table_random_data(selected_columns, self.dbms_type)
+            row_data_stream = self._generate_batches(table, selected_columns, number_of_data, commit_unit,
+                                                     data_maker, use_user_defined_data, separate_col_val)
 
-                list_of_row_data.append(row_data)
+            # 현재 Commit 단위 데이터를 Insert하는 동안 다음 Commit 단위 데이터를 별도 Thread에서 생성
+            if queue_depth > 0:
+                row_data_stream = _pipeline_batches(row_data_stream, queue_depth)
+
+            try:
+                for list_of_row_data in row_data_stream:
 
-                if i % commit_unit == 0:
                     with self.connection.begin() as tx:
-                        self.connection.execute(table.insert(), list_of_row_data)
+                        bind_start_time = time.perf_counter()
+                        prepared = bulk_loader.prepare(self.connection, table, list_of_row_data)
+                        self.latency.add_phase_time(BIND, time.perf_counter() - bind_start_time)
+
+                        self.latency.execute(bulk_loader.execute, self.connection, prepared,
+                                             rows=len(list_of_row_data))
                         self._complete_tx(tx, rollback, end_count)
-                    if table.name.upper() == INSERT_TEST:
-                        separate_col_val += 1
+
+                    progress_bar.update(len(list_of_row_data))
+                    if progress_queue is not None:
+                        progress_queue.put((_PROGRESS, len(list_of_row_data)))
 
                     end_count += 1
-                    list_of_row_data.clear()
+            finally:
+                row_data_stream.close()
 
-            if number_of_data % commit_unit != 0:
-                with self.connection.begin() as tx:
-                    self.connection.execute(table.insert(), list_of_row_data)
-                    self._complete_tx(tx, rollback, end_count)
+            progress_bar.close()
 
+            stop_profile()
             end_time = time.time()
 
             return {"start_time": start_time, "end_time": end_time}
@@ -163,6 +218,126 @@ class FuncsDml:
         except DatabaseError as dberr:
             exec_database_error(self.logger, self.log_level, dberr)
 
+    def _generate_batches(self, table, selected_columns, number_of_data, commit_unit, data_maker,
+                          use_user_defined_data, separate_col_val):
+        """
+        number_of_data 만큼의 데이터를 Commit 단위로 생성
+        :return: Commit 단위 Row Data generator
+        """
+
+        remaining_data = number_of_data
+
+        while remaining_data > 0:
+
+            # Commit 단위만큼의 데이터를 한 번에 생성
+            generate_start_time = time.perf_counter()
+            list_of_row_data = data_maker.generate_batch(table, selected_columns, min(commit_unit, remaining_data),
+                                                         separate_col_val, self.dbms_type, use_user_defined_data)
+            self.latency.add_phase_time(GENERATE, time.perf_counter() - generate_start_time)
+
+            yield list_of_row_data
+
+            if separate_col_val is not None:
+                separate_col_val += 1
+
+            remaining_data -= len(list_of_row_data)
+
+    def parallel_insert(self, table, selected_columns, number_of_data, commit_unit, data_maker, rollback, verbose,
+                        use_user_defined_data, workers, bulk_load=False, queue_depth=DEFAULT_QUEUE_DEPTH,
+                        sampler=None, metrics=None):
+        """
+        number_of_data를 worker 수만큼 나누어 각 worker process에서 multi insert를 동시에 수행
+        :param table: Table Object
+        :param selected_columns: 데이터를 insert할 column list
+        :param number_of_data: insert할 데이터 수
+        :param commit_unit: Commit 단위
+        :param data_maker: DataMaker instance
+        :param rollback: Rollback 수행 여부
+        :param verbose: 작업 진행도 (Progress bar) 표시 여부
+        :param use_user_defined_data: User Defined Data File 사용 여부
+        :param workers: Worker process 수
+        :param bulk_load: DBMS별 Native Bulk Load 사용 여부
+        :param queue_depth: 미리 생성해 둘 Commit 단위 데이터 수 (0일 경우 생성과 Insert를 순차적으로 수행)
+        :param sampler: worker의 진행도를 측정 대상으로 등록할 ThroughputSampler instance
+        :param metrics: worker의 진행도를 노출할 MetricsRegistry instance
+        :return: {작업 시작시간, 작업 종료시간}
+        """
+
+        try:
+
+            # INSERT_TEST 테이블의 경우 worker별로 겹치지 않는 separate_col 범위를 할당
+            if table.name.upper() == INSERT_TEST:
+                separate_col_val = get_separate_col_val(self.engine, table, table.columns.keys()[3])
+            else:
+                separate_col_val = None
+
+        except DatabaseError as dberr:
+            exec_database_error(self.logger, self.log_level, dberr)
+
+        # Worker별 처리 데이터 수 (worker 수가 데이터 수보다 많을 경우 데이터가 없는 worker는 생성하지 않음)
+        share, remainder = divmod(number_of_data, workers)
+        worker_data_counts = [share + 1 if idx < remainder else share for idx in range(workers)]
+        worker_data_counts = [data_count for data_count in worker_data_counts if data_count > 0]
+
+        mp_context = multiprocessing.get_context("fork")
+        result_queue = mp_context.Queue()
+        processes = []
+
+        for data_count in worker_data_counts:
+            processes.append(mp_context.Process(target=_multi_insert_worker,
+                                                args=(self.conn_info, table, selected_columns, data_count, commit_unit,
+                                                      data_maker.file_name, rollback, use_user_defined_data,
+                                                      separate_col_val, result_queue, bulk_load, queue_depth)))
+            if separate_col_val is not None:
+                separate_col_val += math.ceil(data_count / commit_unit)
+
+        self.logger.info(f"Start {len(processes)} insert workers: {worker_data_counts}")
+
+        progress_bar = tqdm(total=number_of_data, disable=verbose, ncols=tqdm_ncols, bar_format=tqdm_bar_format,
+                            postfix=tqdm_bench_postfix(rollback))
+
+        worker_progress = _WorkerProgress()
+        if sampler is not None:
+            sampler.add_source(worker_progress)
+        if metrics is not None:
+            metrics.add_source(worker_progress, table.name, "INSERT")
+
+        for process in processes:
+            process.start()
+
+        worker_results = []
+
+        try:
+
+            while len(worker_results) < len(processes):
+                try:
+                    message_type, message = result_queue.get(timeout=1)
+                except queue.Empty:
+                    # 결과를 반환하지 않고 종료된 worker가 있을 경우 나머지 worker를 종료
+                    if any(process.exitcode not in [None, 0] for process in processes):
+                        for process in processes:
+                            process.terminate()
+                        print_error_msg("Insert worker process was terminated abnormally. Check the log file.")
+                    continue
+
+                if message_type == _PROGRESS:
+                    progress_bar.update(message)
+                    worker_progress.add(message)
+                else:
+                    worker_results.append(message)
+
+        finally:
+            progress_bar.close()
+            for process in processes:
+                process.join()
+
+        for idx, worker_result in enumerate(worker_results):
+            self.logger.debug(f"Insert worker #{idx + 1} result: {worker_result}")
+            self.latency.merge(worker_result["latency"])
+
+        return {"start_time": min(worker_result["start_time"] for worker_result in worker_results),
+                "end_time": max(worker_result["end_time"] for worker_result in worker_results)}
+
     def update(self, table, selected_columns, where_clause, data_maker, rollback, verbose, use_user_defined_data,
                nowhere=False):
         """
@@ -182,6 +357,8 @@ class FuncsDml:
 
         try:
 
+            bind_start_time = time.perf_counter()
+
             if nowhere:
                 update_stmt = table.update() \
                                    .values(dict((column.name, bindparam(column.name))
@@ -192,11 +369,16 @@ class FuncsDml:
                                                 for column in selected_columns)) \
                                    .where(text(where_clause))
 
+            self.latency.add_phase_time(BIND, time.perf_counter() - bind_start_time)
+
             start_time = time.time()
+            start_profile()
 
             for i in tqdm(range(1), disable=verbose, ncols=tqdm_ncols, bar_format=tqdm_bar_format,
                           postfix=tqdm_bench_postfix(rollback)):
 
+                generate_start_time = time.perf_counter()
+
                 if table.name.upper() in sample_tables:
                     row_data = data_maker.get_sample_table_data(table.name, selected_columns, dbms_type=self.dbms_type)
                 elif use_user_defined_data:
@@ -204,10 +386,13 @@ class FuncsDml:
                 else:
                     row_data = data_maker.get_user_table_random_data(selected_columns, self.dbms_type)
 
+                self.latency.add_phase_time(GENERATE, time.perf_counter() - generate_start_time)
+
                 with self.connection.begin() as tx:
-                    self.connection.execute(update_stmt, row_data)
+                    self.latency.execute(self.connection.execute, update_stmt, row_data)
                     self._complete_tx(tx, rollback, end_count)
 
+            stop_profile()
             end_time = time.time()
 
             return {"start_time": start_time, "end_time": end_time}
@@ -219,7 +404,8 @@ class FuncsDml:
             exec_database_error(self.logger, self.log_level, dberr)
 
     def separated_update(self, table, selected_columns, select_where, update_where_column, data_maker,
-                         rollback, verbose, use_user_defined_data, commit_unit=None):
+                         rollback, verbose, use_user_defined_data, commit_unit=None, key_list=None,
+                         total_estimate=None):
         """
         where 조건에 따라 update를 update_where_column 기준으로 순차적으로 나누어 수행함
         :param table: Table
@@ -231,6 +417,8 @@ class FuncsDml:
         :param verbose: 작업 진행도 (progress bar) 표시 여부
         :param use_user_defined_data: User Defined Data File 사용 여부
         :param commit_unit: commit 단위
+        :param key_list: update 대상 update_where_column 값 List (Key Registry 사용시 지정하며, 지정할 경우 대상 Row를 조회하지 않음)
+        :param total_estimate: progress bar에 표시할 update 대상 record 수 추정값 (Key 범위 등)
         :return: {작업 시작시간, 작업 종료시간}
         """
 
@@ -239,27 +427,30 @@ class FuncsDml:
 
         try:
 
-            select_where_clause = text(select_where)
+            if key_list is not None:
+                update_row_count = len(key_list)
+                update_rows = [(key,) for key in key_list]
 
-            # Update 대상 Row 조회
-            update_row_count_query = self.db_session.query(update_where_column.label(update_where_column.name))\
-                                                    .filter(select_where_clause)
+            else:
+                update_row_count = total_estimate
 
-            update_row_count = self.engine.execute(update_row_count_query.statement.with_only_columns(
-                                                    [func.count(update_where_column).label("ID_COUNT")])).scalar()
+                # Update 대상 Row를 Server-side Cursor로 나누어 조회
+                update_rows_query = self.db_session.query(update_where_column.label(update_where_column.name)) \
+                                                   .filter(text(select_where)) \
+                                                   .group_by(update_where_column.name) \
+                                                   .order_by(update_where_column.name)
 
-            # Update 대상 Row 조회
-            update_rows = self.db_session.query(update_where_column.label(update_where_column.name)) \
-                                         .filter(select_where_clause) \
-                                         .group_by(update_where_column.name) \
-                                         .order_by(update_where_column.name)
+                update_rows = _stream_rows(self.engine, update_rows_query.statement)
 
-            update_where_clause = update_where_column == bindparam(f"b_{update_where_column.name}")
-            update_stmt = table.update() \
-                               .values(dict((column.name, bindparam(column.name)) for column in selected_columns)) \
-                               .where(update_where_clause)
+            bind_start_time = time.perf_counter()
+            update_stmt = self.statement_cache.get_update(table, selected_columns, update_where_column)
+            self.latency.add_phase_time(BIND, time.perf_counter() - bind_start_time)
 
             start_time = time.time()
+            start_profile()
+
+            # Commit 단위 데이터 생성 (대상 Key 조회 포함) 시작 시점
+            batch_start_time = time.perf_counter()
 
             for i in tqdm(update_rows, total=update_row_count, disable=verbose, ncols=tqdm_ncols,
                           bar_format=tqdm_bar_format, postfix=tqdm_bench_postfix(rollback)):
@@ -277,29 +468,111 @@ class FuncsDml:
 
                 if commit_unit is not None:
                     if len(list_of_row_data) % commit_unit == 0:
+                        self.latency.add_phase_time(GENERATE, time.perf_counter() - batch_start_time)
+
                         with self.connection.begin() as tx:
-                            self.connection.execute(update_stmt, list_of_row_data)
+                            self.latency.execute(self.connection.execute, update_stmt, list_of_row_data,
+                                                 rows=len(list_of_row_data))
                             self._complete_tx(tx, rollback, end_count)
 
                         end_count += 1
                         list_of_row_data.clear()
+                        batch_start_time = time.perf_counter()
                     else:
                         continue
 
                 else:
+                    self.latency.add_phase_time(GENERATE, time.perf_counter() - batch_start_time)
+
                     with self.connection.begin() as tx:
-                        self.connection.execute(update_stmt, list_of_row_data)
+                        self.latency.execute(self.connection.execute, update_stmt, list_of_row_data,
+                                             rows=len(list_of_row_data))
                         self._complete_tx(tx, rollback, end_count)
 
                     end_count += 1
                     list_of_row_data.clear()
+                    batch_start_time = time.perf_counter()
 
             # Commit 단위별로 처리된 후 남은 Row 마저 Commit
-            if commit_unit is not None and update_row_count is not None and (update_row_count % commit_unit != 0):
+            if list_of_row_data:
+                self.latency.add_phase_time(GENERATE, time.perf_counter() - batch_start_time)
+
                 with self.connection.begin() as tx:
-                    self.connection.execute(update_stmt, list_of_row_data)
+                    self.latency.execute(self.connection.execute, update_stmt, list_of_row_data,
+                                         rows=len(list_of_row_data))
                     self._complete_tx(tx, rollback, end_count)
 
+            stop_profile()
+            end_time = time.time()
+
+            return {"start_time": start_time, "end_time": end_time}
+
+        except StatementError as staterr:
+            exec_statement_error(self.logger, self.log_level, staterr)
+
+        except DatabaseError as dberr:
+            exec_database_error(self.logger, self.log_level, dberr)
+
+    def range_update(self, table, selected_columns, key_column, start_key, end_key, data_maker, rollback, verbose,
+                     use_user_defined_data, commit_unit):
+        """
+        Key 범위를 commit 단위로 나누어, 나눈 범위마다 하나의 update 문 (WHERE Key BETWEEN x AND y)으로 수행함
+        :param table: Table
+        :param selected_columns: Update가 수행될 Column List
+        :param key_column: update 기준 Key column
+        :param start_key: 시작 Key 값
+        :param end_key: 종료 Key 값
+        :param data_maker: DataMaker instance
+        :param rollback: rollback 수행 여부
+        :param verbose: 작업 진행도 (progress bar) 표시 여부
+        :param use_user_defined_data: User Defined Data File 사용 여부
+        :param commit_unit: commit 단위 (update 문 하나가 대상으로 하는 Key 범위의 크기)
+        :return: {작업 시작시간, 작업 종료시간}
+        """
+
+        end_count = 1
+
+        try:
+
+            bind_start_time = time.perf_counter()
+            update_stmt = self.statement_cache.get_update(table, selected_columns, key_column, key_range=True)
+            self.latency.add_phase_time(BIND, time.perf_counter() - bind_start_time)
+
+            start_time = time.time()
+            start_profile()
+
+            progress_bar = tqdm(total=end_key - start_key + 1, disable=verbose, ncols=tqdm_ncols,
+                                bar_format=tqdm_bar_format, postfix=tqdm_bench_postfix(rollback))
+
+            for chunk_start_key in range(start_key, end_key + 1, commit_unit):
+
+                chunk_end_key = min(chunk_start_key + commit_unit - 1, end_key)
+
+                # 범위별로 새로운 데이터를 생성
+                generate_start_time = time.perf_counter()
+
+                if table.name.upper() in sample_tables:
+                    row_data = data_maker.get_sample_table_data(table.name, selected_columns, dbms_type=self.dbms_type)
+                elif use_user_defined_data:
+                    row_data = data_maker.get_user_table_user_defined_data(selected_columns, self.dbms_type)
+                else:
+                    row_data = data_maker.get_user_table_random_data(selected_columns, self.dbms_type)
+
+                self.latency.add_phase_time(GENERATE, time.perf_counter() - generate_start_time)
+
+                row_data["b_start_key"] = chunk_start_key
+                row_data["b_end_key"] = chunk_end_key
+
+                with self.connection.begin() as tx:
+                    self.latency.execute(self.connection.execute, update_stmt, row_data)
+                    self._complete_tx(tx, rollback, end_count)
+
+                end_count += 1
+                progress_bar.update(chunk_end_key - chunk_start_key + 1)
+
+            progress_bar.close()
+
+            stop_profile()
             end_time = time.time()
 
             return {"start_time": start_time, "end_time": end_time}
@@ -325,20 +598,26 @@ class FuncsDml:
 
         try:
 
+            bind_start_time = time.perf_counter()
+
             if nowhere:
                 delete_stmt = table.delete()
             else:
                 delete_stmt = table.delete().where(text(where_clause))
 
+            self.latency.add_phase_time(BIND, time.perf_counter() - bind_start_time)
+
             start_time = time.time()
+            start_profile()
 
             for i in tqdm(range(1), disable=verbose, ncols=tqdm_ncols, bar_format=tqdm_bar_format,
                           postfix=tqdm_bench_postfix(rollback)):
 
                 with self.connection.begin() as tx:
-                    self.connection.execute(delete_stmt)
+                    self.latency.execute(self.connection.execute, delete_stmt)
                     self._complete_tx(tx, rollback, end_count)
 
+            stop_profile()
             end_time = time.time()
 
             return {"start_time": start_time, "end_time": end_time}
@@ -346,7 +625,8 @@ class FuncsDml:
         except DatabaseError as dberr:
             exec_database_error(self.logger, self.log_level, dberr)
 
-    def separated_delete(self, table, where_clause, delete_where_column, rollback, verbose, commit_unit=None):
+    def separated_delete(self, table, where_clause, delete_where_column, rollback, verbose, commit_unit=None,
+                         key_list=None, total_estimate=None):
         """
         where 조건에 따라 delete를 delete_where_column 기준으로 순차적으로 나누어 수행함
         :param table: table
@@ -355,6 +635,8 @@ class FuncsDml:
         :param rollback: rollback 수행 여부
         :param verbose: 작업 진행도 (progress bar) 표시 여부
         :param commit_unit: commit 단위
+        :param key_list: delete 대상 delete_where_column 값 List (Key Registry 사용시 지정하며, 지정할 경우 대상 Row를 조회하지 않음)
+        :param total_estimate: progress bar에 표시할 delete 대상 record 수 추정값 (Key 범위 등)
         :return: {작업 시작시간, 작업 종료시간}
         """
 
@@ -363,24 +645,30 @@ class FuncsDml:
 
         try:
 
-            select_where_clause = text(where_clause)
+            if key_list is not None:
+                delete_row_count = len(key_list)
+                delete_rows = [(key,) for key in key_list]
 
-            delete_row_count_query = self.db_session.query(delete_where_column.label(delete_where_column.name)) \
-                                                    .filter(select_where_clause)
+            else:
+                delete_row_count = total_estimate
 
-            delete_row_count = self.engine.execute(delete_row_count_query.statement.with_only_columns(
-                                                    [func.count(delete_where_column).label("ID_COUNT")])).scalar()
+                # Delete 대상 Row를 Server-side Cursor로 나누어 조회
+                delete_rows_query = self.db_session.query(delete_where_column.label(delete_where_column.name)) \
+                                                   .filter(text(where_clause)) \
+                                                   .group_by(delete_where_column.name) \
+                                                   .order_by(delete_where_column.name)
 
-            # Delete 대상 Row 조회
-            delete_rows = self.db_session.query(delete_where_column.label(delete_where_column.name)) \
-                                         .filter(select_where_clause) \
-                                         .group_by(delete_where_column.name) \
-                                         .order_by(delete_where_column.name)
+                delete_rows = _stream_rows(self.engine, delete_rows_query.statement)
 
-            delete_where_clause = delete_where_column == bindparam(f"b_{delete_where_column.name}")
-            delete_stmt = table.delete().where(delete_where_clause)
+            bind_start_time = time.perf_counter()
+            delete_stmt = self.statement_cache.get_delete(table, delete_where_column)
+            self.latency.add_phase_time(BIND, time.perf_counter() - bind_start_time)
 
             start_time = time.time()
+            start_profile()
+
+            # Commit 단위 Bind Parameter 생성 (대상 Key 조회 포함) 시작 시점
+            batch_start_time = time.perf_counter()
 
             for i in tqdm(delete_rows, total=delete_row_count, disable=verbose, ncols=tqdm_ncols,
                           bar_format=tqdm_bar_format, postfix=tqdm_bench_postfix(rollback)):
@@ -389,30 +677,215 @@ class FuncsDml:
 
                 if commit_unit is not None:
                     if len(list_of_row_data) % commit_unit == 0:
+                        self.latency.add_phase_time(BIND, time.perf_counter() - batch_start_time)
+
                         with self.connection.begin() as tx:
-                            self.connection.execute(delete_stmt, list_of_row_data)
+                            self.latency.execute(self.connection.execute, delete_stmt, list_of_row_data,
+                                                 rows=len(list_of_row_data))
                             self._complete_tx(tx, rollback, end_count)
                         end_count += 1
                         list_of_row_data.clear()
+                        batch_start_time = time.perf_counter()
                     else:
                         continue
 
                 else:
+                    self.latency.add_phase_time(BIND, time.perf_counter() - batch_start_time)
+
                     with self.connection.begin() as tx:
-                        self.connection.execute(delete_stmt, list_of_row_data)
+                        self.latency.execute(self.connection.execute, delete_stmt, list_of_row_data,
+                                             rows=len(list_of_row_data))
                         self._complete_tx(tx, rollback, end_count)
                     end_count += 1
                     list_of_row_data.clear()
+                    batch_start_time = time.perf_counter()
 
             # Commit 단위별로 처리된 후 남은 Row 마저 Commit
-            if commit_unit is not None and delete_row_count is not None and (delete_row_count % commit_unit != 0):
+            if list_of_row_data:
+                self.latency.add_phase_time(BIND, time.perf_counter() - batch_start_time)
+
                 with self.connection.begin() as tx:
-                    self.connection.execute(delete_stmt, list_of_row_data)
+                    self.latency.execute(self.connection.execute, delete_stmt, list_of_row_data,
+                                         rows=len(list_of_row_data))
                     self._complete_tx(tx, rollback, end_count)
 
+            stop_profile()
             end_time = time.time()
 
             return {"start_time": start_time, "end_time": end_time}
 
         except DatabaseError as dberr:
             exec_database_error(self.logger, self.log_level, dberr)
+
+    def range_delete(self, table, key_column, start_key, end_key, rollback, verbose, commit_unit):
+        """
+        Key 범위를 commit 단위로 나누어, 나눈 범위마다 하나의 delete 문 (WHERE Key BETWEEN x AND y)으로 수행함
+        :param table: Table
+        :param key_column: delete 기준 Key column
+        :param start_key: 시작 Key 값
+        :param end_key: 종료 Key 값
+        :param rollback: rollback 수행 여부
+        :param verbose: 작업 진행도 (progress bar) 표시 여부
+        :param commit_unit: commit 단위 (delete 문 하나가 대상으로 하는 Key 범위의 크기)
+        :return: {작업 시작시간, 작업 종료시간}
+        """
+
+        end_count = 1
+
+        try:
+
+            bind_start_time = time.perf_counter()
+            delete_stmt = self.statement_cache.get_delete(table, key_column, key_range=True)
+            self.latency.add_phase_time(BIND, time.perf_counter() - bind_start_time)
+
+            start_time = time.time()
+            start_profile()
+
+            progress_bar = tqdm(total=end_key - start_key + 1, disable=verbose, ncols=tqdm_ncols,
+                                bar_format=tqdm_bar_format, postfix=tqdm_bench_postfix(rollback))
+
+            for chunk_start_key in range(start_key, end_key + 1, commit_unit):
+
+                chunk_end_key = min(chunk_start_key + commit_unit - 1, end_key)
+
+                with self.connection.begin() as tx:
+                    self.latency.execute(self.connection.execute, delete_stmt,
+                                         {"b_start_key": chunk_start_key, "b_end_key": chunk_end_key})
+                    self._complete_tx(tx, rollback, end_count)
+
+                end_count += 1
+                progress_bar.update(chunk_end_key - chunk_start_key + 1)
+
+            progress_bar.close()
+
+            stop_profile()
+            end_time = time.time()
+
+            return {"start_time": start_time, "end_time": end_time}
+
+        except DatabaseError as dberr:
+            exec_database_error(self.logger, self.log_level, dberr)
+
+
+class _WorkerProgress:
+    """
+    parallel_insert 수행시 worker process가 Commit 단위로 전달한 진행도를 누적하여 ThroughputSampler 등에 제공.
+    worker는 Commit 후에 진행도를 전달하므로 Commit되지 않은 Record 수는 알 수 없음 (0으로 기록)
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self.commits = 0
+        self._lock = threading.Lock()
+
+    def add(self, rows):
+        with self._lock:
+            self.rows += rows
+            self.commits += 1
+
+    def snapshot(self):
+        # worker는 Commit 단위마다 한 번의 insert (load)를 수행
+        with self._lock:
+            return {"rows": self.rows, "dml": self.commits, "commits": self.commits, "in_flight_rows": 0}
+
+
+def _stream_rows(engine, statement, chunk_size=_STREAM_CHUNK_SIZE):
+    """
+    Server-side Cursor (stream_results)로 조회 결과를 chunk_size 단위로 나누어 가져옴.
+    DML을 수행하는 Connection과 분리하기 위해 별도의 Connection을 사용
+    :param engine: engine Object
+    :param statement: 조회 SQL
+    :param chunk_size: 한 번에 가져올 Row 수
+    :return: Row generator
+    """
+
+    with engine.connect() as connection:
+
+        result = connection.execution_options(stream_results=True).execute(statement)
+
+        try:
+            while True:
+                rows = result.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            result.close()
+
+
+def _pipeline_batches(row_data_stream, queue_depth):
+    """
+    별도의 Thread에서 row_data_stream의 데이터를 미리 생성하여 최대 queue_depth 개까지 Queue에 쌓아두고 순서대로 반환.
+    생성 중 발생한 예외는 호출한 Thread에서 다시 발생시키며, 호출한 쪽에서 중단(close)할 경우 생성 Thread도 종료
+    :param row_data_stream: Commit 단위 Row Data generator
+    :param queue_depth: Queue에 쌓아둘 최대 Commit 단위 데이터 수
+    :return: Commit 단위 Row Data generator
+    """
+
+    batch_queue = queue.Queue(maxsize=queue_depth)
+    stop_event = threading.Event()
+    errors = []
+
+    def _put_batch(item):
+        while not stop_event.is_set():
+            try:
+                batch_queue.put(item, timeout=1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce():
+        try:
+            for list_of_row_data in row_data_stream:
+                if not _put_batch(list_of_row_data):
+                    return
+        except BaseException as err:
+            errors.append(err)
+        _put_batch(None)
+
+    producer = threading.Thread(target=_produce, name="BatchProducer", daemon=True)
+    producer.start()
+
+    try:
+        while True:
+            list_of_row_data = batch_queue.get()
+            if list_of_row_data is None:
+                break
+            yield list_of_row_data
+
+        if errors:
+            raise errors[0]
+    finally:
+        stop_event.set()
+        producer.join()
+
+
+def _multi_insert_worker(conn_info, table, selected_columns, number_of_data, commit_unit, file_name, rollback,
+                         use_user_defined_data, separate_col_val, result_queue, bulk_load, queue_depth):
+    """
+    parallel_insert의 worker process에서 수행되며, 독립된 Connection/DataMaker로 multi insert를 수행
+    :param conn_info: Connection 정보 (Config)
+    :param table: Table Object
+    :param selected_columns: 데이터를 insert할 column list
+    :param number_of_data: worker가 insert할 데이터 수
+    :param commit_unit: Commit 단위
+    :param file_name: DataMaker가 사용할 Data file name
+    :param rollback: Rollback 수행 여부
+    :param use_user_defined_data: User Defined Data File 사용 여부
+    :param separate_col_val: worker에 할당된 SEPARATE_COL 시작값
+    :param result_queue: 진행도 및 작업 결과를 전달할 Queue
+    :param bulk_load: DBMS별 Native Bulk Load 사용 여부
+    :param queue_depth: 미리 생성해 둘 Commit 단위 데이터 수
+    """
+
+    # fork된 process는 부모 process의 random state를 그대로 가지므로 worker마다 seed를 재설정
+    random.seed()
+
+    dml = FuncsDml(ConnectionManager(conn_info))
+    result = dml.multi_insert(table, selected_columns, number_of_data, commit_unit, FuncsDataMaker(file_name),
+                              rollback, True, use_user_defined_data, separate_col_val, result_queue, bulk_load,
+                              queue_depth)
+    result["latency"] = dml.latency
+
+    result_queue.put((_RESULT, result))
@@ -1,17 +1,21 @@
 from commons.constants import *
 from commons.funcs_common import get_object_name, print_complete_msg, exec_database_error, get_separate_col_val, \
                                  print_error_msg
+from commons.funcs_bulkload import get_bulk_loader
 from commons.funcs_datamaker import data_file_name, FuncsDataMaker
 from commons.mgr_logger import LoggerManager
 
+from concurrent.futures import ThreadPoolExecutor
 from sqlalchemy.exc import DatabaseError
 from sqlalchemy.schema import Table, PrimaryKeyConstraint, UniqueConstraint, DropConstraint
 from tqdm import tqdm
 
 import jaydebeapi
 import jpype
+import queue
 import random
 import re
+import threading
 
 
 class FuncsInitializer:
@@ -46,23 +50,66 @@ class FuncsInitializer:
             self.dest_info[TARGET]["user_name"] = kwargs["trg_conn"].user_name
             self.dest_info[TARGET]["desc"] = "Target Database "
 
-    def _table_check_sql(self, dest, table_name):
+    def _get_existing_tables(self, dest, cursor, table_names):
         """
         SA가 지원하지 않는 DBMS의 경우 SA와 유사하게 동작하기 위해 create/drop 수행 전에 table 존재 여부를 체크하며,
-        DBMS에 따라 row level의 sql을 생성
+        Table별로 조회하지 않고 한 번의 SQL로 대상 Table 전체의 존재 여부를 조회
         :param dest: dbms type을 얻기 위한 destination ( SOURCE or TARGET )
-        :param table_name: DBMS에서 해당 테이블을 조회하기 위한 table_name (dbms에 따라 대소문자 주의)
-        :return: Table Select SQL, binding 변수 (table_name, user_name)
+        :param cursor: SQL을 수행할 cursor
+        :param table_names: 조회할 table_name List (dbms에 따라 대소문자 주의)
+        :return: DBMS에 존재하는 table_name Set (table_names에 지정된 이름 기준)
         """
 
         if self.dest_info[dest]["dbms_type"] == CUBRID:
-            table_check_sql = f"SELECT class_name FROM db_class WHERE class_name = ? AND owner_name = ?"
-            bindings = (table_name.lower(), self.dest_info[dest]["user_name"].upper())
+            table_check_sql = "SELECT class_name FROM db_class WHERE owner_name = ? AND class_name IN ({})"
+            dbms_table_names = {table_name.lower(): table_name for table_name in table_names}
         else:
-            table_check_sql = "SELECT table_name FROM all_tables WHERE table_name = ? AND owner = ?"
-            bindings = (table_name.upper(), self.dest_info[dest]["user_name"].upper())
+            table_check_sql = "SELECT table_name FROM all_tables WHERE owner = ? AND table_name IN ({})"
+            dbms_table_names = {table_name.upper(): table_name for table_name in table_names}
 
-        return table_check_sql, bindings
+        if not dbms_table_names:
+            return set()
+
+        cursor.execute(table_check_sql.format(", ".join("?" * len(dbms_table_names))),
+                       [self.dest_info[dest]["user_name"].upper()] + list(dbms_table_names))
+
+        return set(dbms_table_names[row[0]] for row in cursor.fetchall() if row[0] in dbms_table_names)
+
+    def _concurrent_available(self):
+        """
+        SOURCE와 TARGET 작업의 동시 수행 가능 여부.
+        SA가 지원하지 않는 DBMS는 JVM을 공유하는 JDBC Connection을 사용하므로 순차적으로 수행함
+        :return: True or False
+        """
+
+        return self.dest_info[SOURCE]["dbms_type"] not in sa_unsupported_dbms \
+            and self.dest_info[TARGET]["dbms_type"] not in sa_unsupported_dbms
+
+    def _run_concurrently(self, run_func, verbose, feed_func=None):
+        """
+        SOURCE와 TARGET 작업을 각각의 Thread에서 동시에 수행하며, 작업 완료 후 Destination별 결과를 출력
+        :param run_func: (dest, position)을 인자로 받아 작업을 수행하고 출력 문구를 반환하는 함수
+        :param verbose: 진행 상황 출력 방식
+        :param feed_func: Thread 시작 후 Main Thread에서 수행할 함수 (Destination별 Future Dict를 인자로 받음)
+        :return: None
+        """
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = {dest: executor.submit(run_func, dest, position)
+                       for position, dest in enumerate([SOURCE, TARGET])}
+
+            if feed_func is not None:
+                feed_func(futures)
+
+            results = {dest: future.result() for dest, future in futures.items()}
+
+        if verbose:
+            print(f"    {results[SOURCE]} ", end="", flush=True)
+            print_complete_msg(False, verbose, separate=False)
+            print(f"    {results[TARGET]} ", end="", flush=True)
+            print_complete_msg(False, verbose, "\n")
+        else:
+            print()
 
     def create(self, dest, args):
         """
@@ -121,18 +168,15 @@ class FuncsInitializer:
 
                 Table(table.name, self.dest_info[dest]["mapper"].metadata, *table_uks, extend_existing=True)
 
-            def _run_create(dest):
+            def _set_table_keys(dest):
                 """
-                SA가 지원하는 DBMS에 사용하며, 실제 DB 상에 Create 작업을 수행
-                :param dest:
-                :return:
+                SA가 지원하는 DBMS에 사용하며, --non-key/--unique 옵션에 따라 Mapper의 Key 속성을 변경
+                :param dest: Create를 수행할 Destination ( SOURCE or TARGET )
+                :return: None
                 """
 
-                tables = self.dest_info[dest]["mapper"].metadata.sorted_tables
-                print(f"    {self.dest_info[dest]['desc']}[{len(tables)}] ", end="", flush=True)
-                for table in tqdm(tables, disable=args.verbose, ncols=tqdm_ncols, bar_format=tqdm_bar_format,
-                                  desc=f"  {self.dest_info[dest]['desc']}"):
-                    
+                for table in self.dest_info[dest]["mapper"].metadata.sorted_tables:
+
                     if args.non_key:
                         _drop_primary_key(dest, table)
                     elif args.unique:
@@ -149,8 +193,23 @@ class FuncsInitializer:
                     else:
                         _columns_nullable_set_false(table.primary_key.columns)
 
+            def _run_create(dest, position=None):
+                """
+                SA가 지원하는 DBMS에 사용하며, 실제 DB 상에 Create 작업을 수행
+                :param dest: Create를 수행할 Destination ( SOURCE or TARGET )
+                :param position: 동시 수행시 진행 상황 출력 위치 (순차 수행시 None)
+                :return: 진행 상황 출력 문구
+                """
+
+                tables = self.dest_info[dest]["mapper"].metadata.sorted_tables
+                if position is None:
+                    print(f"    {self.dest_info[dest]['desc']}[{len(tables)}] ", end="", flush=True)
+                for table in tqdm(tables, disable=args.verbose, ncols=tqdm_ncols, bar_format=tqdm_bar_format,
+                                  desc=f"  {self.dest_info[dest]['desc']}", position=position):
                     table.create(bind=self.dest_info[dest]["engine"], checkfirst=True)
 
+                return f"{self.dest_info[dest]['desc']}[{len(tables)}]"
+
             def _sa_unsupported_dbms_drop_primary_key(table_def):
                 """
                 SA가 미지원하는 DBMS의 경우 definition file에서 constraint 절을 match하여 공백으로 replace하는 방식으로 primary key를 제거
@@ -191,52 +250,58 @@ class FuncsInitializer:
                 :return: None
                 """
                 tables = self.dest_info[dest]["mapper"].tables
+                # Connection은 Destination별로 재사용되므로 close 하지 않음 (process 종료시 close)
                 conn = self.dest_info[dest]["conn"].sa_unsupported_get_connection()
+                cursor = conn.cursor()
 
                 print(f"    {self.dest_info[dest]['desc']}[{len(tables)}] ", end="", flush=True)
-                for table in tqdm(tables, disable=args.verbose, ncols=tqdm_ncols, bar_format=tqdm_bar_format,
-                                  desc=f"  {self.dest_info[dest]['desc']}"):
-                    cursor = conn.cursor()
 
-                    table_check_sql, bindings = self._table_check_sql(dest, table)
+                try:
+                    existing_tables = self._get_existing_tables(dest, cursor, tables)
 
-                    try:
-                        cursor.execute(table_check_sql, bindings)
-
-                        if cursor.fetchone() is None:
-                            if args.non_key:
-                                table_def = _sa_unsupported_dbms_drop_primary_key(tables[table])
-                            elif args.unique:
-                                table_def = _sa_unsupported_dbms_add_unique_key(table, tables[table])
-                            else:
-                                table_def = tables[table]
-                            create_table_sql = f"\nCREATE TABLE {table_def}\n\n"
-
-                            cursor.execute(create_table_sql)
-                            self.sa_unsupported_dbms_sql_logger.info(create_table_sql)
-                            self.sa_unsupported_dbms_sql_logger.info("COMMIT")
+                    for table in tqdm(tables, disable=args.verbose, ncols=tqdm_ncols, bar_format=tqdm_bar_format,
+                                      desc=f"  {self.dest_info[dest]['desc']}"):
+                        if table in existing_tables:
+                            continue
 
+                        if args.non_key:
+                            table_def = _sa_unsupported_dbms_drop_primary_key(tables[table])
+                        elif args.unique:
+                            table_def = _sa_unsupported_dbms_add_unique_key(table, tables[table])
                         else:
-                            continue
+                            table_def = tables[table]
+                        create_table_sql = f"\nCREATE TABLE {table_def}\n\n"
 
-                    except jaydebeapi.DatabaseError as dberr:
-                        exec_database_error(self.logger, self.log_level, dberr)
-                    except jpype.JException as java_err:
-                        print_error_msg(java_err.args[0])
+                        cursor.execute(create_table_sql)
+                        self.sa_unsupported_dbms_sql_logger.info(create_table_sql)
+                        self.sa_unsupported_dbms_sql_logger.info("COMMIT")
 
+                except jaydebeapi.DatabaseError as dberr:
+                    exec_database_error(self.logger, self.log_level, dberr)
+                except jpype.JException as java_err:
+                    print_error_msg(java_err.args[0])
+
+                finally:
                     cursor.close()
-                conn.close()
 
-            if dest == BOTH:
+            if dest == BOTH and self._concurrent_available():
+                # Source와 Target이 같은 DBMS일 경우 Mapper를 공유하므로 Key 속성 변경은 순차적으로 수행
+                _set_table_keys(SOURCE)
+                _set_table_keys(TARGET)
+                self._run_concurrently(_run_create, args.verbose)
+
+            elif dest == BOTH:
                 if self.dest_info[SOURCE]["dbms_type"] in sa_unsupported_dbms:
                     _run_sa_unsupported_dbms_create(SOURCE)
                 else:
+                    _set_table_keys(SOURCE)
                     _run_create(SOURCE)
                 print_complete_msg(False, args.verbose, separate=False)
 
                 if self.dest_info[TARGET]["dbms_type"] in sa_unsupported_dbms:
                     _run_sa_unsupported_dbms_create(TARGET)
                 else:
+                    _set_table_keys(TARGET)
                     _run_create(TARGET)
                 print_complete_msg(False, args.verbose, "\n")
 
@@ -244,6 +309,7 @@ class FuncsInitializer:
                 if self.dest_info[dest]["dbms_type"] in sa_unsupported_dbms:
                     _run_sa_unsupported_dbms_create(dest)
                 else:
+                    _set_table_keys(dest)
                     _run_create(dest)
                 print_complete_msg(False, args.verbose, "\n")
 
@@ -264,43 +330,46 @@ class FuncsInitializer:
 
         try:
 
-            def _run_drop(dest):
+            def _run_drop(dest, position=None):
                 tables = self.dest_info[dest]["mapper"].metadata.sorted_tables
-                print(f"    {self.dest_info[dest]['desc']}[{len(tables)}] ", end="", flush=True)
+                if position is None:
+                    print(f"    {self.dest_info[dest]['desc']}[{len(tables)}] ", end="", flush=True)
                 for table in tqdm(tables, disable=args.verbose, ncols=tqdm_ncols, bar_format=tqdm_bar_format,
-                                  desc=f"  {self.dest_info[dest]['desc']}"):
+                                  desc=f"  {self.dest_info[dest]['desc']}", position=position):
                     table.drop(bind=self.dest_info[dest]["engine"], checkfirst=True)
 
+                return f"{self.dest_info[dest]['desc']}[{len(tables)}]"
+
             def _run_sa_unsupported_dbms_drop(dest):
                 tables = self.dest_info[dest]["mapper"].tables
                 conn = self.dest_info[dest]["conn"].sa_unsupported_get_connection()
+                cursor = conn.cursor()
 
                 print(f"    {self.dest_info[dest]['desc']}[{len(tables)}] ", end="", flush=True)
-                for table in tqdm(tables, disable=args.verbose, ncols=tqdm_ncols, bar_format=tqdm_bar_format,
-                                  desc=f"  {self.dest_info[dest]['desc']}"):
-                    cursor = conn.cursor()
-
-                    table_check_sql, bindings = self._table_check_sql(dest, table)
-
-                    try:
-                        cursor.execute(table_check_sql, bindings)
 
-                        if cursor.fetchone() is not None:
-                            drop_table_sql = f"\nDROP TABLE {table.upper()}"
-                            cursor.execute(drop_table_sql)
-                            self.sa_unsupported_dbms_sql_logger.info(drop_table_sql)
-                            self.sa_unsupported_dbms_sql_logger.info("COMMIT")
+                try:
+                    existing_tables = self._get_existing_tables(dest, cursor, tables)
 
-                        else:
+                    for table in tqdm(tables, disable=args.verbose, ncols=tqdm_ncols, bar_format=tqdm_bar_format,
+                                      desc=f"  {self.dest_info[dest]['desc']}"):
+                        if table not in existing_tables:
                             continue
 
-                    except jaydebeapi.DatabaseError as dberr:
-                        exec_database_error(self.logger, self.log_level, dberr)
+                        drop_table_sql = f"\nDROP TABLE {table.upper()}"
+                        cursor.execute(drop_table_sql)
+                        self.sa_unsupported_dbms_sql_logger.info(drop_table_sql)
+                        self.sa_unsupported_dbms_sql_logger.info("COMMIT")
+
+                except jaydebeapi.DatabaseError as dberr:
+                    exec_database_error(self.logger, self.log_level, dberr)
 
+                finally:
                     cursor.close()
-                conn.close()
 
-            if dest == BOTH:
+            if dest == BOTH and self._concurrent_available():
+                self._run_concurrently(_run_drop, args.verbose)
+
+            elif dest == BOTH:
                 if self.dest_info[SOURCE]["dbms_type"] in sa_unsupported_dbms:
                     _run_sa_unsupported_dbms_drop(SOURCE)
                 else:
@@ -366,48 +435,131 @@ class FuncsInitializer:
                     column_names[3]: separate_col_val
                 }
 
-            def _get_list_of_row_data(column_names, separate_col_val):
+            def _generate_row_data(column_names, separate_col_val):
                 """
-                Insert할 전체 데이터를 생성
+                Insert할 데이터를 Commit 단위로 생성하는 generator. 전체 데이터를 메모리에 보관하지 않음
                 :param column_names: Table Column Names
                 :param separate_col_val: SEPARATE_COL 컬럼 시작값
-                :return: Insert할 전체 데이터 List
+                :return: Commit 단위 Row Data List
                 """
-                desc_str = "Make Sample Data"
-                print(f"    {desc_str} [{total_data}] ", end="", flush=True)
-
-                list_of_row_data = []
-                commit_unit_data = []
-                separate_col_val = separate_col_val
 
-                for u in tqdm(range(1, total_data + 1), disable=args.verbose, ncols=tqdm_ncols,
-                              desc=f"  {desc_str} ", bar_format=tqdm_bar_format):
-                    commit_unit_data.append(_get_initial_data(column_names, separate_col_val))
-                    if u % commit_unit == 0:
-                        list_of_row_data.append(commit_unit_data[:])
-                        separate_col_val += 1
-                        commit_unit_data.clear()
+                for start in range(0, total_data, commit_unit):
+                    yield [_get_initial_data(column_names, separate_col_val)
+                           for _ in range(min(commit_unit, total_data - start))]
+                    separate_col_val += 1
 
-                if total_data % commit_unit != 0:
-                    list_of_row_data.append(commit_unit_data)
-
-                print_complete_msg(False, args.verbose, separate=False)
+            def _rename_row_data(commit_unit_data, column_names):
+                """
+                Source와 Target의 DBMS가 다를 경우 Row Data의 Key를 Target Column Name으로 변경
+                :param commit_unit_data: Commit 단위 Row Data List
+                :param column_names: Target Table Column Names
+                :return: Target Column Name으로 변경된 Row Data List
+                """
 
-                return list_of_row_data
+                return [dict(zip(column_names[1:], row_data.values())) for row_data in commit_unit_data]
 
-            def _run_insert_init_data(dest, list_of_row_data):
+            def _run_insert_init_data(dests, row_data_stream, desc):
+                """
+                Commit 단위로 생성된 데이터를 각 Destination에 순서대로 Insert.
+                dests가 SOURCE, TARGET 모두일 경우 동일한 데이터를 양쪽에 Insert 함
+                :param dests: Insert를 수행할 Destination List
+                :param row_data_stream: Commit 단위 Row Data generator
+                :param desc: 진행 상황 출력 문구
+                :return: None
+                """
 
-                print(f"    Insert {self.dest_info[dest]['desc']}[{total_data}] ", end="", flush=True)
+                print(f"    Insert {desc}[{total_data}] ", end="", flush=True)
 
                 t = tqdm(total=total_data, disable=args.verbose, ncols=tqdm_ncols,
-                         desc=f"  Insert {self.dest_info[dest]['desc']}", bar_format=tqdm_bar_format)
+                         desc=f"  Insert {desc}", bar_format=tqdm_bar_format)
 
-                for commit_unit_data in list_of_row_data:
-                    self.dest_info[dest]["engine"].execute(self.dest_info[dest]["table"].insert(), commit_unit_data)
+                rename_flag = len(dests) > 1 and \
+                              self.dest_info[SOURCE]["dbms_type"] != self.dest_info[TARGET]["dbms_type"]
+
+                for commit_unit_data in row_data_stream:
+                    for dest in dests:
+                        if dest == TARGET and rename_flag:
+                            dest_row_data = _rename_row_data(commit_unit_data,
+                                                             self.dest_info[TARGET]["table"].columns.keys())
+                        else:
+                            dest_row_data = commit_unit_data
+                        with self.dest_info[dest]["engine"].begin() as connection:
+                            bulk_loaders[dest].load(connection, self.dest_info[dest]["table"], dest_row_data)
                     t.update(len(commit_unit_data))
 
                 t.close()
 
+            def _run_concurrent_insert_init_data(row_data_stream):
+                """
+                SOURCE와 TARGET에 각각의 Thread로 동시에 Insert.
+                Main Thread에서 생성한 Commit 단위 데이터를 Destination별 Queue에 동일하게 전달하며,
+                Queue 크기를 제한하여 느린 쪽을 기다리도록 함
+                :param row_data_stream: Commit 단위 Row Data generator
+                :return: None
+                """
+
+                batch_queues = {SOURCE: queue.Queue(maxsize=2), TARGET: queue.Queue(maxsize=2)}
+                stop_event = threading.Event()
+
+                rename_flag = self.dest_info[SOURCE]["dbms_type"] != self.dest_info[TARGET]["dbms_type"]
+                trg_column_names = self.dest_info[TARGET]["table"].columns.keys()
+
+                def _run_insert_dest(dest, position):
+
+                    desc = f"Insert {self.dest_info[dest]['desc']}"
+                    t = tqdm(total=total_data, disable=args.verbose, ncols=tqdm_ncols,
+                             desc=f"  {desc}", bar_format=tqdm_bar_format, position=position)
+
+                    try:
+                        while not stop_event.is_set():
+                            try:
+                                commit_unit_data = batch_queues[dest].get(timeout=1)
+                            except queue.Empty:
+                                continue
+
+                            if commit_unit_data is None:
+                                break
+
+                            with self.dest_info[dest]["engine"].begin() as connection:
+                                bulk_loaders[dest].load(connection, self.dest_info[dest]["table"], commit_unit_data)
+                            t.update(len(commit_unit_data))
+                    except BaseException:
+                        stop_event.set()
+                        raise
+                    finally:
+                        t.close()
+
+                    return f"{desc}[{total_data}]"
+
+                def _put_batch(dest, commit_unit_data, futures):
+                    while True:
+                        try:
+                            batch_queues[dest].put(commit_unit_data, timeout=1)
+                            return
+                        except queue.Full:
+                            if futures[dest].done():
+                                futures[dest].result()
+                                return
+
+                def _feed_row_data(futures):
+                    try:
+                        for commit_unit_data in row_data_stream:
+                            _put_batch(SOURCE, commit_unit_data, futures)
+                            _put_batch(TARGET, _rename_row_data(commit_unit_data, trg_column_names)
+                                       if rename_flag else commit_unit_data, futures)
+
+                        for dest in batch_queues:
+                            _put_batch(dest, None, futures)
+                    except BaseException:
+                        stop_event.set()
+                        raise
+
+                self._run_concurrently(_run_insert_dest, args.verbose, _feed_row_data)
+
+            # --bulk-load 옵션 사용시 DBMS별 Native Bulk Load로 Insert
+            bulk_loaders = {dest_key: get_bulk_loader(self.dest_info[dest_key]["dbms_type"], args.bulk_load)
+                            for dest_key in self.dest_info}
+
             if dest == BOTH:
 
                 self.dest_info[SOURCE]["table"] = self.dest_info[SOURCE]["mapper"].metadata.tables[
@@ -419,24 +571,16 @@ class FuncsInitializer:
                 ]
 
                 src_column_names = self.dest_info[SOURCE]["table"].columns.keys()
-                trg_column_names = self.dest_info[TARGET]["table"].columns.keys()
                 separate_col_val = get_separate_col_val(
                     self.dest_info[SOURCE]["engine"], self.dest_info[SOURCE]["table"], src_column_names[3]
                 )
 
-                list_of_row_data = _get_list_of_row_data(src_column_names, separate_col_val)
-
-                _run_insert_init_data(SOURCE, list_of_row_data)
-                print_complete_msg(False, args.verbose, separate=False)
-
-                if self.dest_info[SOURCE]["dbms_type"] != self.dest_info[TARGET]["dbms_type"]:
-                    for commit_unit_data in list_of_row_data:
-                        for row_data in commit_unit_data:
-                            for idx, column_name in enumerate(row_data):
-                                row_data[trg_column_names[idx + 1]] = row_data.pop(column_name)
-
-                _run_insert_init_data(TARGET, list_of_row_data)
-                print_complete_msg(False, args.verbose, "\n")
+                if self._concurrent_available():
+                    _run_concurrent_insert_init_data(_generate_row_data(src_column_names, separate_col_val))
+                else:
+                    _run_insert_init_data([SOURCE, TARGET], _generate_row_data(src_column_names, separate_col_val),
+                                          f"{self.dest_info[SOURCE]['desc']}& {self.dest_info[TARGET]['desc']}")
+                    print_complete_msg(False, args.verbose, "\n")
 
             else:
 
@@ -449,9 +593,8 @@ class FuncsInitializer:
                     self.dest_info[dest]["engine"], self.dest_info[dest]["table"], column_names[3]
                 )
 
-                list_of_row_data = _get_list_of_row_data(column_names, separate_col_val)
-
-                _run_insert_init_data(dest, list_of_row_data)
+                _run_insert_init_data([dest], _generate_row_data(column_names, separate_col_val),
+                                      self.dest_info[dest]["desc"])
 
                 print_complete_msg(False, args.verbose, "\n")
                 self.logger.info(f"{self.dest_info[dest]['desc']}'s \"{table_name}\" Table's "
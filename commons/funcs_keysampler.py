@@ -0,0 +1,716 @@
+from sqlalchemy.sql import select, func
+
+from bisect import bisect_left, bisect_right
+
+import array
+import glob
+import mmap
+import os
+import random
+import threading
+
+
+_key_registry_dir = os.path.join("cache", "keys")
+
+
+class KeyRegistry:
+    """
+    (Config, Table)별 Key 목록을 정렬된 64bit 정수 배열 파일로 저장하여, 다음 수행 시 Table 조회 없이 Key 목록을 사용할 수 있도록 함
+    """
+
+    def __init__(self, config_name, table_name):
+
+        self.file_path = os.path.join(_key_registry_dir, _registry_file_name(config_name, table_name))
+
+    def exists(self):
+        return os.path.exists(self.file_path)
+
+    def load(self):
+        """
+        저장된 Key 목록을 조회
+        :return: 정렬된 Key List. 저장된 Key 목록이 없을 경우 None
+        """
+
+        if not self.exists():
+            return None
+
+        keys = array.array("q")
+        with open(self.file_path, "rb") as f:
+            keys.frombytes(f.read())
+
+        return keys.tolist()
+
+    def save(self, keys):
+        """
+        Key 목록을 저장. 정수가 아닌 Key는 저장할 수 없으므로 저장된 Key 목록을 삭제함
+        :param keys: Key List
+        """
+
+        try:
+            sorted_keys = array.array("q", sorted(keys))
+        except (TypeError, OverflowError):
+            self.remove()
+            return
+
+        if not os.path.exists(_key_registry_dir):
+            os.makedirs(_key_registry_dir)
+
+        # 저장 중 중단되더라도 기존 파일이 손상되지 않도록 임시 파일에 저장 후 교체
+        temp_file_path = f"{self.file_path}.tmp"
+        with open(temp_file_path, "wb") as f:
+            sorted_keys.tofile(f)
+        os.replace(temp_file_path, self.file_path)
+
+    def append(self, keys):
+        """
+        저장된 최대 Key보다 큰 Key를 기존 Key 목록 뒤에 추가 (기존 Key 목록을 읽지 않음).
+        정수가 아닌 Key는 저장할 수 없으므로 저장된 Key 목록을 삭제함
+        :param keys: 저장된 최대 Key보다 큰 Key List
+        """
+
+        try:
+            sorted_keys = array.array("q", sorted(keys))
+        except (TypeError, OverflowError):
+            self.remove()
+            return
+
+        with open(self.file_path, "ab") as f:
+            sorted_keys.tofile(f)
+
+    def get_range_keys(self, start, end):
+        """
+        start <= Key <= end 범위의 Key를 조회. 정렬된 파일에서 이진 탐색으로 범위만 읽음 (전체 Key 목록을 불러오지 않음)
+        :param start: 시작 Key
+        :param end: 종료 Key
+        :return: 정렬된 Key List. 저장된 Key 목록이 없을 경우 None
+        """
+
+        if not self.exists():
+            return None
+
+        if os.path.getsize(self.file_path) == 0:
+            return []
+
+        with open(self.file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+            keys = memoryview(mapped_file).cast("q")
+            try:
+                return keys[bisect_left(keys, start):bisect_right(keys, end)].tolist()
+            finally:
+                keys.release()
+
+    def remove_range(self, start, end):
+        """
+        start <= Key <= end 범위의 Key를 저장된 Key 목록에서 제거 (범위 이후의 Key를 앞으로 옮긴 후 파일 크기를 줄임)
+        :param start: 시작 Key
+        :param end: 종료 Key
+        """
+
+        if not self.exists() or os.path.getsize(self.file_path) == 0:
+            return
+
+        item_size = array.array("q").itemsize
+
+        with open(self.file_path, "r+b") as f:
+
+            with mmap.mmap(f.fileno(), 0) as mapped_file:
+                keys = memoryview(mapped_file).cast("q")
+                try:
+                    start_position = bisect_left(keys, start)
+                    end_position = bisect_right(keys, end)
+                    key_count = len(keys)
+                finally:
+                    keys.release()
+
+                if start_position == end_position:
+                    return
+
+                mapped_file.move(start_position * item_size, end_position * item_size,
+                                 (key_count - end_position) * item_size)
+                mapped_file.flush()
+
+            f.truncate((key_count - end_position + start_position) * item_size)
+
+    def get_max_key(self):
+        """
+        :return: 저장된 최대 Key (정렬되어 저장되므로 마지막 Key). 저장된 Key가 없을 경우 None
+        """
+
+        keys = array.array("q")
+
+        with open(self.file_path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() < keys.itemsize:
+                return None
+            f.seek(-keys.itemsize, os.SEEK_END)
+            keys.frombytes(f.read(keys.itemsize))
+
+        return keys[0]
+
+    def remove(self):
+        if self.exists():
+            os.remove(self.file_path)
+
+    @staticmethod
+    def remove_all(config_name):
+        """
+        Config에 해당하는 모든 Table의 Key 목록을 삭제
+        :param config_name: Config 파일명
+        """
+        for file_path in glob.glob(os.path.join(_key_registry_dir, _registry_file_name(config_name, "*"))):
+            os.remove(file_path)
+
+
+class InsertedKeyRanges:
+    """
+    여러 Session이 같은 Table에 Insert 할 때, Commit된 Insert의 Key 범위를 Session 간에 공유.
+    다른 Session이 Insert한 Key는 Commit 이후에만 조회되므로, 조회한 최대 Key보다 작은 Key가 나중에 Commit될 수 있음.
+    Session은 Insert 시작 시점까지 조회된 최대 Key를 등록하고 Commit 시 공개하며, 다른 Session은 공개된 Key 이후 범위를
+    다시 조회하여 누락된 Key를 반영함
+    """
+
+    def __init__(self):
+
+        self.max_key = None
+
+        self._pending = {}
+        self._committed = []
+        self._offset = 0
+        self._cursors = {}
+        self._lock = threading.Lock()
+
+    def register(self, owner):
+        """
+        Commit된 Key 범위를 조회할 Index를 등록 (등록 이후 Commit된 범위부터 조회)
+        :param owner: LiveKeyIndex instance
+        """
+
+        with self._lock:
+            self._cursors[owner] = self._offset + len(self._committed)
+
+    def observe(self, key):
+        """
+        조회된 최대 Key를 갱신
+        :param key: Index에서 조회한 최대 Key
+        """
+
+        if key is None:
+            return
+
+        with self._lock:
+            if self.max_key is None or key > self.max_key:
+                self.max_key = key
+
+    def begin_insert(self, owner):
+        """
+        Transaction의 Insert 시작을 등록 (Insert 수행 전에 호출). 이후 할당되는 Key는 현재 조회된 최대 Key보다 큼
+        :param owner: Insert를 수행하는 Session의 LiveKeyIndex instance
+        """
+
+        with self._lock:
+            if owner not in self._pending:
+                self._pending[owner] = self.max_key
+
+    def get_insert_low_key(self, owner):
+        """
+        :param owner: LiveKeyIndex instance
+        :return: (진행 중인 Insert가 있는지 여부, Insert 시작 시점의 최대 Key)
+        """
+
+        with self._lock:
+            return owner in self._pending, self._pending.get(owner)
+
+    def end_insert(self, owner, commit):
+        """
+        Transaction 종료시 호출. Commit한 경우 Insert 시작 시점의 최대 Key를 다른 Session에 공개
+        :param owner: Insert를 수행한 Session의 LiveKeyIndex instance
+        :param commit: Commit 여부 (Rollback한 경우 Insert된 Key가 없으므로 공개하지 않음)
+        """
+
+        with self._lock:
+            if owner in self._pending:
+                low_key = self._pending.pop(owner)
+                if commit:
+                    self._committed.append((owner, low_key))
+
+    def get_committed_low_keys(self, owner):
+        """
+        마지막 조회 이후 다른 Session이 Commit한 Insert의 시작 Key 목록을 조회
+        :param owner: 조회하는 LiveKeyIndex instance
+        :return: (Commit된 Insert가 있는지 여부, 시작 Key 중 최소값. 시작 Key를 알 수 없는 경우 None)
+        """
+
+        with self._lock:
+            position = self._cursors[owner] - self._offset
+            committed = [low_key for committed_owner, low_key in self._committed[position:]
+                         if committed_owner is not owner]
+            self._cursors[owner] = self._offset + len(self._committed)
+
+            # 모든 Index가 조회한 범위는 제거
+            consumed = min(self._cursors.values()) - self._offset
+            if consumed > 0:
+                del self._committed[:consumed]
+                self._offset += consumed
+
+        if not committed:
+            return False, None
+        elif None in committed:
+            return True, None
+        else:
+            return True, min(committed)
+
+
+class LiveKeyIndex:
+    """
+    Table에 존재하는 Key 값을 메모리에 유지하며, UPDATE/DELETE 대상 Key를 Table 크기와 무관하게 추출.
+    최초 추출 시 한 번만 전체 Key를 조회하고, 이후 Insert된 Key는 마지막으로 조회한 Key보다 큰 범위만 조회하여 반영
+    (Key 값은 Sequence/Identity에 의해 증가하는 값이어야 함).
+    partition 지정시 Key를 Session 수로 나눈 나머지가 partition 번호와 같은 Key만 유지하여, Session 간에 같은 Record를
+    변경하지 않도록 함
+    """
+
+    def __init__(self, key_column, registry=None, refresh=False, partition=None, inserted_key_ranges=None):
+        """
+        :param key_column: Key Column
+        :param registry: KeyRegistry instance (None일 경우 Key Registry를 사용하지 않음)
+        :param refresh: Key Registry를 무시하고 Table에서 Key를 다시 조회할지 여부
+        :param partition: (partition 수, partition 번호). None일 경우 모든 Key를 유지
+        :param inserted_key_ranges: Session 간 공유하는 InsertedKeyRanges instance (None일 경우 별도로 생성)
+        """
+
+        self.key_column = key_column
+        self.registry = registry
+        self.refresh = refresh
+        self.partition = partition
+        self.inserted_key_ranges = inserted_key_ranges if inserted_key_ranges is not None else InsertedKeyRanges()
+
+        self._keys = []
+        self._positions = {}
+        self._max_key = None
+
+        self._loaded = False
+        self._synced = True
+
+        # 현재 Transaction에서 Index에 추가/제거된 Key (Rollback 시 되돌림)
+        self._tx_changed = False
+        self._tx_added = set()
+        self._tx_removed = []
+        self._tx_max_key = None
+        self._tx_low_key = None
+
+        # Rollback 이후 다시 조회할 시작 Key
+        self._resync = False
+        self._resync_low_key = None
+
+        self._lock = threading.Lock()
+
+        self.inserted_key_ranges.register(self)
+
+    @property
+    def loaded(self):
+        return self._loaded
+
+    def sample(self, connection, count, remove=False):
+        """
+        임의의 Key를 count 개 추출
+        :param connection: Key 조회에 사용할 Connection
+        :param count: 추출할 Key 수
+        :param remove: 추출한 Key를 Index에서 제거할지 여부 (DELETE 대상일 경우 True)
+        :return: Key List. 존재하는 Key가 count 보다 적을 경우 None
+        """
+
+        with self._lock:
+
+            self._sync(connection)
+
+            if len(self._keys) < count:
+                return None
+
+            if not remove:
+                return random.sample(self._keys, count)
+
+            self._begin_tx_change()
+
+            sampled_keys = []
+            for _ in range(count):
+                sampled_keys.append(self._remove_at(random.randrange(len(self._keys))))
+            self._tx_removed.extend(sampled_keys)
+
+            return sampled_keys
+
+    def get_range_keys(self, connection, start, end):
+        """
+        start <= Key <= end 범위의 Key를 정렬하여 반환.
+        Key Registry를 사용할 경우 Registry를 Table과 동기화한 후 저장된 파일에서 범위만 읽음 (전체 Key를 불러오지 않음)
+        :param connection: Key 조회에 사용할 Connection
+        :param start: 시작 Key
+        :param end: 종료 Key
+        :return: Key List. Key Registry에 저장할 수 없는 Key일 경우 None
+        """
+
+        if self.registry is not None:
+            self.save_inserted_keys(connection)
+            return self.registry.get_range_keys(start, end)
+
+        with self._lock:
+            self._sync(connection)
+            return sorted(key for key in self._keys if start <= key <= end)
+
+    def get_keys(self, connection):
+        """
+        :param connection: Key 조회에 사용할 Connection
+        :return: Index의 Key List와 조회한 최대 Key
+        """
+
+        with self._lock:
+            self._sync(connection)
+            return list(self._keys), self._max_key
+
+    def load(self, keys, max_key):
+        """
+        다른 Index에서 조회한 Key 목록으로 Index를 초기화 (partition에 해당하는 Key만 유지)
+        :param keys: Key List
+        :param max_key: keys를 조회한 Index의 최대 Key (이후 Insert된 Key는 이 Key보다 큰 범위만 조회)
+        """
+
+        with self._lock:
+            self._clear_tx()
+            self._keys = []
+            self._positions = {}
+            self._add_keys(self._get_partition_keys(keys))
+            self._max_key = max_key
+            self._loaded = True
+            self.refresh = False
+
+    def save_registry(self, connection):
+        """
+        Table의 전체 Key를 조회하여 Key Registry를 새로 저장
+        :param connection: Key 조회에 사용할 Connection
+        """
+
+        if self.registry is not None:
+            self.registry.save(row[0] for row in connection.execute(self._get_key_query()))
+
+    def save_inserted_keys(self, connection):
+        """
+        저장된 최대 Key보다 큰 Key (이후 Insert된 Key)만 조회하여 Key Registry에 추가 (전체 Key 목록을 불러오지 않음).
+        저장된 Key 목록이 없거나 Table이 재생성된 경우 Table의 전체 Key를 조회하여 새로 저장함
+        :param connection: Key 조회에 사용할 Connection
+        """
+
+        if self.registry is None:
+            return
+
+        if not self.registry.exists():
+            self.save_registry(connection)
+            return
+
+        registry_max_key = self.registry.get_max_key()
+
+        if registry_max_key is not None:
+            table_max_key = connection.execute(select([func.max(self.key_column)])).scalar()
+            if table_max_key is None or table_max_key < registry_max_key:
+                self.save_registry(connection)
+                return
+
+        query = select([self.key_column])
+        if registry_max_key is not None:
+            query = query.where(self.key_column > registry_max_key)
+
+        self.registry.append([row[0] for row in connection.execute(query)])
+
+    def remove_range_keys(self, start, end):
+        """
+        start <= Key <= end 범위의 Key를 Index와 Key Registry에서 제거 (범위의 Record를 모두 삭제한 경우 사용)
+        :param start: 시작 Key
+        :param end: 종료 Key
+        """
+
+        with self._lock:
+            for key in [key for key in self._keys if start <= key <= end]:
+                self._remove_at(self._positions[key])
+
+        if self.registry is not None:
+            self.registry.remove_range(start, end)
+
+    def notify_insert(self):
+        """
+        새로운 Key가 Insert 될 것임을 표시 (Insert 수행 전에 호출하며, 다음 추출 시 증가한 범위의 Key를 조회)
+        """
+        with self._lock:
+            self._synced = False
+        self.inserted_key_ranges.begin_insert(self)
+
+    def end_transaction(self, commit):
+        """
+        Transaction 종료를 알림. Commit된 Insert의 Key 범위를 다른 Session에 공개하며,
+        Rollback한 경우 해당 Transaction에서 Index에 추가/제거한 Key만 되돌림 (전체 Key를 다시 조회하지 않음)
+        :param commit: Commit 여부
+        """
+
+        with self._lock:
+            if not commit and self._tx_changed:
+                self._rollback_tx()
+            self._clear_tx()
+
+        self.inserted_key_ranges.end_insert(self, commit)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def _sync(self, connection):
+
+        if not self._loaded:
+            keys = self._load_registry(connection)
+
+            # 저장된 Key 목록이 없으면 Table에서 전체 Key를 조회
+            if keys is None:
+                keys = [row[0] for row in connection.execute(self._get_key_query())]
+                self._synced = True
+            # 저장된 Key 목록을 사용할 경우 이후 다른 작업으로 Insert된 Key를 아래에서 바로 조회
+            else:
+                keys = self._get_partition_keys(keys)
+                self._synced = False
+
+            self._clear_tx()
+            self._keys = []
+            self._positions = {}
+            self._max_key = None
+            self._add_keys(keys)
+            self._loaded = True
+            self.refresh = False
+
+            # 진행 중인 Transaction에서 Insert한 Key가 포함될 수 있으므로, Insert 시작 이후의 Key를 Transaction 변경으로 기록
+            inserting, insert_low_key = self.inserted_key_ranges.get_insert_low_key(self)
+            if inserting:
+                self._tx_changed = True
+                self._tx_max_key = insert_low_key
+                self._tx_low_key = insert_low_key
+                self._tx_added = set(key for key in keys if insert_low_key is None or key > insert_low_key)
+
+        # 다른 Session이 Commit한 Insert 중 이미 조회한 최대 Key보다 작은 Key가 있을 수 있으므로 시작 Key부터 다시 조회
+        committed, committed_low_key = self.inserted_key_ranges.get_committed_low_keys(self)
+
+        if not self._synced or committed or self._resync:
+            low_key = self._max_key
+            if committed:
+                low_key = _min_key(low_key, committed_low_key)
+            if self._resync:
+                low_key = _min_key(low_key, self._resync_low_key)
+
+            self._begin_tx_change()
+            self._tx_low_key = _min_key(self._tx_low_key, low_key)
+
+            query = self._get_key_query()
+            if low_key is not None:
+                query = query.where(self.key_column > low_key)
+            self._add_keys([row[0] for row in connection.execute(query)])
+            self._synced = True
+            self._resync = False
+
+        self.inserted_key_ranges.observe(self._max_key)
+
+    def _get_key_query(self):
+
+        query = select([self.key_column])
+
+        if self.partition is not None and self.partition[0] > 1:
+            query = query.where(self.key_column % self.partition[0] == self.partition[1])
+
+        return query
+
+    def _get_partition_keys(self, keys):
+
+        if self.partition is not None and self.partition[0] > 1:
+            return [key for key in keys if key % self.partition[0] == self.partition[1]]
+        else:
+            return keys
+
+    def _load_registry(self, connection):
+        """
+        Key Registry에 저장된 Key 목록을 조회.
+        Table의 최대 Key가 저장된 최대 Key보다 작을 경우 Table이 재생성된 것으로 판단하여 사용하지 않음
+        :return: Key List. 사용할 수 없을 경우 None
+        """
+
+        if self.registry is None or self.refresh:
+            return None
+
+        keys = self.registry.load()
+
+        if keys:
+            table_max_key = connection.execute(select([func.max(self.key_column)])).scalar()
+            if table_max_key is None or table_max_key < keys[-1]:
+                return None
+
+        return keys
+
+    def _add_keys(self, keys):
+
+        for key in keys:
+            if key not in self._positions:
+                self._positions[key] = len(self._keys)
+                self._keys.append(key)
+                if self._tx_changed:
+                    self._tx_added.add(key)
+            if self._max_key is None or key > self._max_key:
+                self._max_key = key
+
+    def _begin_tx_change(self):
+        """
+        Transaction 시작 이후 처음 Index를 변경할 때, 변경 전의 최대 Key를 기록
+        """
+
+        if not self._tx_changed:
+            self._tx_changed = True
+            self._tx_max_key = self._max_key
+            self._tx_low_key = self._max_key
+
+    def _rollback_tx(self):
+        """
+        Transaction에서 제거한 Key를 다시 추가하고 추가한 Key를 제거.
+        추가한 Key 중 다른 Session이 Commit한 Key가 있을 수 있으므로 다음 추출 시 조회한 시작 Key부터 다시 조회함
+        """
+
+        self._tx_changed = False
+        self._add_keys(self._tx_removed)
+
+        for key in self._tx_added:
+            if key in self._positions:
+                self._remove_at(self._positions[key])
+
+        self._max_key = self._tx_max_key
+        self._resync_low_key = _min_key(self._resync_low_key, self._tx_low_key) if self._resync else self._tx_low_key
+        self._resync = True
+
+    def _clear_tx(self):
+
+        self._tx_changed = False
+        self._tx_added = set()
+        self._tx_removed = []
+        self._tx_max_key = None
+        self._tx_low_key = None
+
+    def _remove_at(self, position):
+        """
+        마지막 Key와 위치를 바꾼 뒤 제거하여 O(1)로 Key를 제거
+        """
+
+        key = self._keys[position]
+        last_key = self._keys.pop()
+
+        if position < len(self._keys):
+            self._keys[position] = last_key
+            self._positions[last_key] = position
+
+        del self._positions[key]
+
+        return key
+
+
+class KeySampler:
+    """
+    Table별 LiveKeyIndex를 관리.
+    여러 Session이 함께 사용할 경우 Session별로 Key를 나누어 (partition) 서로 다른 Record를 UPDATE/DELETE 하도록 함
+    """
+
+    def __init__(self, config_name=None, refresh=False, partitions=1):
+        """
+        :param config_name: Key Registry를 구분할 Config 파일명 (None일 경우 Key Registry를 사용하지 않음)
+        :param refresh: Key Registry를 무시하고 Table에서 Key를 다시 조회할지 여부
+        :param partitions: Key를 나눌 Session 수
+        """
+
+        self.config_name = config_name
+        self.refresh = refresh
+        self.partitions = partitions
+
+        self._indexes = {}
+        self._inserted_key_ranges = {}
+        self._lock = threading.Lock()
+
+    def get_index(self, table, partition_no=0):
+        """
+        Table의 Session별 LiveKeyIndex를 반환 (Table의 첫 번째 컬럼을 Key로 사용)
+        :param table: Table Object
+        :param partition_no: Session의 partition 번호 (0 ~ partitions-1)
+        :return: LiveKeyIndex instance
+        """
+
+        with self._lock:
+            if (table.name, partition_no) not in self._indexes:
+                if table.name not in self._inserted_key_ranges:
+                    self._inserted_key_ranges[table.name] = InsertedKeyRanges()
+                self._indexes[(table.name, partition_no)] = LiveKeyIndex(
+                    _get_key_column(table), self._get_registry(table), self.refresh, (self.partitions, partition_no),
+                    self._inserted_key_ranges[table.name]
+                )
+            return self._indexes[(table.name, partition_no)]
+
+    def load(self, connection, tables):
+        """
+        Table별로 Key 목록을 한 번만 조회하여 모든 Session의 Index를 초기화 (Session 시작 전에 호출)
+        :param connection: Key 조회에 사용할 Connection
+        :param tables: Table Object List
+        """
+
+        for table in tables:
+            keys, max_key = LiveKeyIndex(_get_key_column(table), self._get_registry(table), self.refresh) \
+                .get_keys(connection)
+
+            for partition_no in range(self.partitions):
+                self.get_index(table, partition_no).load(keys, max_key)
+
+            self._inserted_key_ranges[table.name].observe(max_key)
+
+    def end_transaction(self, partition_no, commit):
+        """
+        Session의 Transaction 종료를 모든 Table의 Index에 알림
+        :param partition_no: Session의 partition 번호
+        :param commit: Commit 여부
+        """
+
+        for index in self._get_indexes(partition_no):
+            index.end_transaction(commit)
+
+    def save(self, connection):
+        """
+        모든 Table의 Index를 Key Registry에 저장 (Session별 Index의 Key를 합쳐서 저장).
+        마지막 추출 이후 Insert된 Key가 누락되지 않도록 저장 전에 각 Index를 Table과 동기화함
+        :param connection: Key 조회에 사용할 Connection
+        """
+
+        table_indexes = {}
+        for (table_name, _), index in self._get_index_items():
+            table_indexes.setdefault(table_name, []).append(index)
+
+        for indexes in table_indexes.values():
+            if indexes[0].registry is None or len(indexes) < self.partitions \
+               or not all(index.loaded for index in indexes):
+                continue
+            indexes[0].registry.save([key for index in indexes for key in index.get_keys(connection)[0]])
+
+    def _get_registry(self, table):
+        return KeyRegistry(self.config_name, table.name) if self.config_name is not None else None
+
+    def _get_index_items(self):
+        with self._lock:
+            return list(self._indexes.items())
+
+    def _get_indexes(self, partition_no=None):
+        return [index for (_, index_partition_no), index in self._get_index_items()
+                if partition_no is None or index_partition_no == partition_no]
+
+
+def _min_key(*keys):
+    """
+    조회 시작 Key 중 작은 값을 반환 (None은 처음부터 조회함을 의미하므로 None을 반환)
+    """
+    return None if None in keys else min(keys)
+
+
+def _get_key_column(table):
+    return table.columns[table.columns.keys()[0]]
+
+
+def _registry_file_name(config_name, table_name):
+    return f"{os.path.splitext(os.path.basename(config_name))[0]}.{table_name.lower()}.keys"
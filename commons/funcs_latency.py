@@ -0,0 +1,334 @@
+from datetime import datetime
+
+import json
+import os
+import threading
+import time
+
+
+_report_dir = "reports"
+_latency_file_name = lambda prog, now: f"{prog}_latency_{now:%Y-%m-%d_%H%M%S}.json"
+
+GENERATE = "generate"
+BIND = "bind"
+EXECUTE = "execute"
+COMMIT = "commit"
+
+# 단계별 수행시간을 집계할 단계 (데이터 생성, Statement 생성, Statement 수행, Commit/Rollback)
+PHASES = [GENERATE, BIND, EXECUTE, COMMIT]
+
+# 출력할 백분위수
+_PERCENTILES = [50, 90, 99]
+
+
+class LatencyHistogram:
+    """
+    HDR Histogram과 같이 값의 크기에 따라 bucket 폭이 2배씩 넓어지는 (log-linear) 구조로 소요시간 분포를 기록.
+    값의 크기와 무관하게 상대 오차가 2^-precision_bits 이내로 유지되며, 기록 수와 무관하게 메모리 사용량이 일정함
+    """
+
+    def __init__(self, precision_bits=7):
+        """
+        :param precision_bits: bucket 정밀도 (7일 경우 상대 오차 1% 미만)
+        """
+
+        self.precision_bits = precision_bits
+
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def record(self, seconds):
+        """
+        소요시간을 기록
+        :param seconds: 소요시간 (Sec.)
+        """
+
+        value = max(int(seconds * 1000000), 0)
+        bucket = self._get_bucket(value)
+
+        with self._lock:
+            self._buckets[bucket] = self._buckets.get(bucket, 0) + 1
+            self.count += 1
+            self.total += value
+            self.min = value if self.min is None or value < self.min else self.min
+            self.max = value if self.max is None or value > self.max else self.max
+
+    def merge(self, other):
+        """
+        다른 Histogram의 기록을 병합
+        :param other: LatencyHistogram instance
+        """
+
+        with other._lock:
+            buckets = dict(other._buckets)
+            count, total, min_value, max_value = other.count, other.total, other.min, other.max
+
+        if count == 0:
+            return
+
+        with self._lock:
+            for bucket, bucket_count in buckets.items():
+                self._buckets[bucket] = self._buckets.get(bucket, 0) + bucket_count
+            self.count += count
+            self.total += total
+            self.min = min_value if self.min is None or min_value < self.min else self.min
+            self.max = max_value if self.max is None or max_value > self.max else self.max
+
+    def get_percentile(self, percentile):
+        """
+        :param percentile: 백분위 (0 ~ 100)
+        :return: 해당 백분위의 소요시간 (Sec.). 기록이 없을 경우 None
+        """
+
+        with self._lock:
+
+            if self.count == 0:
+                return None
+
+            rank = max(int(self.count * percentile / 100 + 0.5), 1)
+            cumulative_count = 0
+
+            for bucket in sorted(self._buckets):
+                cumulative_count += self._buckets[bucket]
+                if cumulative_count >= rank:
+                    # bucket에 속한 값 중 가장 큰 값을 사용 (최대값을 넘지 않도록 보정)
+                    return min(self._get_bucket_end(bucket), self.max) / 1000000
+
+            return self.max / 1000000
+
+    def get_summary(self):
+        """
+        :return: {count, min, mean, p50, p90, p99, max} (소요시간 단위: ms)
+        """
+
+        summary = {"count": self.count}
+
+        if self.count == 0:
+            return summary
+
+        summary["min"] = self.min / 1000
+        summary["mean"] = self.total / self.count / 1000
+        for percentile in _PERCENTILES:
+            summary[f"p{percentile}"] = self.get_percentile(percentile) * 1000
+        summary["max"] = self.max / 1000
+
+        return summary
+
+    def get_cumulative_counts(self, bounds):
+        """
+        :param bounds: 상한값 List (Sec., 오름차순)
+        :return: (상한값별 누적 기록 수 List, 전체 기록 수, 전체 소요시간 (Sec.)).
+                 누적 기록 수는 bucket의 모든 값이 상한값 이하인 bucket만 포함하므로 실제보다 크지 않음
+        """
+
+        with self._lock:
+            buckets = sorted(self._buckets.items())
+            count, total = self.count, self.total
+
+        cumulative_counts = []
+        cumulative_count = 0
+        bucket_idx = 0
+
+        for bound in bounds:
+            bound_value = int(bound * 1000000)
+            while bucket_idx < len(buckets) and self._get_bucket_end(buckets[bucket_idx][0]) <= bound_value:
+                cumulative_count += buckets[bucket_idx][1]
+                bucket_idx += 1
+            cumulative_counts.append(cumulative_count)
+
+        return cumulative_counts, count, total / 1000000
+
+    def __getstate__(self):
+        # worker process 간 전달시 Lock은 제외
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _get_bucket(self, value):
+        shift = max(value.bit_length() - self.precision_bits, 0)
+        return (value >> shift) << shift
+
+    def _get_bucket_end(self, bucket):
+        shift = max(bucket.bit_length() - self.precision_bits, 0)
+        return bucket + (1 << shift) - 1
+
+
+class LatencyRecorder:
+    """
+    Statement 수행 (EXECUTE)과 Transaction 종료 (COMMIT) 소요시간 분포 및 처리 Record 수를 기록.
+    데이터 생성 (GENERATE), Statement 생성 (BIND)을 포함한 단계별 수행시간 합계도 함께 집계하며,
+    Commit 단위 (batch)마다 기록하므로 Record 수와 무관하게 부하가 일정함
+    """
+
+    def __init__(self):
+
+        self.histograms = {EXECUTE: LatencyHistogram(), COMMIT: LatencyHistogram()}
+        self.phase_times = dict.fromkeys(PHASES, 0.0)
+        self.rows = 0
+        # 수행 후 아직 Commit/Rollback 되지 않은 Record 수
+        self.in_flight_rows = 0
+
+        self._lock = threading.Lock()
+
+    def record(self, kind, seconds, rows=0):
+        """
+        :param kind: EXECUTE / COMMIT
+        :param seconds: 소요시간 (Sec.)
+        :param rows: 처리한 Record 수 (EXECUTE인 경우)
+        """
+
+        self.histograms[kind].record(seconds)
+
+        with self._lock:
+            self.phase_times[kind] += seconds
+            if kind == COMMIT:
+                self.in_flight_rows = 0
+            else:
+                self.rows += rows
+                self.in_flight_rows += rows
+
+    def add_phase_time(self, phase, seconds):
+        """
+        소요시간 분포 없이 단계별 수행시간 합계에만 누적 (GENERATE, BIND)
+        :param phase: GENERATE / BIND
+        :param seconds: 소요시간 (Sec.)
+        """
+
+        # 데이터 생성은 별도 Thread에서 수행될 수 있으므로 Lock 사용
+        with self._lock:
+            self.phase_times[phase] += seconds
+
+    def execute(self, func, *args, rows=None):
+        """
+        func를 수행하고 소요시간을 Statement 수행 시간으로 기록
+        :param func: Statement를 수행하는 함수
+        :param args: func 인자
+        :param rows: 처리한 Record 수 (None일 경우 수행 결과의 rowcount)
+        :return: func 수행 결과
+        """
+
+        start_time = time.perf_counter()
+        result = func(*args)
+        elapsed_time = time.perf_counter() - start_time
+
+        if rows is None:
+            rows = max(getattr(result, "rowcount", 0) or 0, 0)
+
+        self.record(EXECUTE, elapsed_time, rows)
+
+        return result
+
+    def merge(self, other):
+        """
+        다른 LatencyRecorder의 기록을 병합 (Session별 기록을 합칠 때 사용)
+        :param other: LatencyRecorder instance
+        """
+
+        for kind, histogram in other.histograms.items():
+            self.histograms[kind].merge(histogram)
+
+        with self._lock:
+            self.rows += other.rows
+            for phase, phase_time in other.phase_times.items():
+                self.phase_times[phase] += phase_time
+
+    def snapshot(self):
+        """
+        :return: 현재까지의 누적 처리량 {Record 수, Statement 수행 횟수, Commit 횟수, Commit되지 않은 Record 수}
+        """
+
+        with self._lock:
+            return {"rows": self.rows, "dml": self.histograms[EXECUTE].count,
+                    "commits": self.histograms[COMMIT].count, "in_flight_rows": self.in_flight_rows}
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def get_result(self, start_time, end_time):
+        """
+        :param start_time: 작업 시작시간
+        :param end_time: 작업 종료시간
+        :return: {수행시간, Record 수, Transaction 수, 초당 Record 수, 초당 Transaction 수, 종류별 소요시간 분포,
+                  단계별 수행시간 합계 (Sec.)}
+        """
+
+        elapsed_time = end_time - start_time
+        transactions = self.histograms[COMMIT].count
+
+        return {
+            "elapsed_time": elapsed_time,
+            "rows": self.rows,
+            "transactions": transactions,
+            "rows_per_sec": self.rows / elapsed_time if elapsed_time > 0 else 0,
+            "transactions_per_sec": transactions / elapsed_time if elapsed_time > 0 else 0,
+            EXECUTE: self.histograms[EXECUTE].get_summary(),
+            COMMIT: self.histograms[COMMIT].get_summary(),
+            "phase_time_sec": {phase: round(phase_time, 6) for phase, phase_time in self.phase_times.items()}
+        }
+
+
+def get_latency_msgs(latency_result, rollback):
+    """
+    처리 속도 및 소요시간 분포를 출력 형식으로 생성
+    :param latency_result: LatencyRecorder.get_result 결과
+    :param rollback: Rollback 여부
+    :return: 출력 메시지 List
+    """
+
+    def summary_format(name, summary):
+        if summary["count"] == 0:
+            return f"{name} Count: 0"
+        return f"{name} Count: {summary['count']} | {name} Latency (p50 / p90 / p99 / Max): " \
+               f"{summary['p50']:.2f} / {summary['p90']:.2f} / {summary['p99']:.2f} / {summary['max']:.2f} ms"
+
+    phase_times = latency_result["phase_time_sec"]
+
+    return [f"Rows/Sec: {latency_result['rows_per_sec']:.2f} | "
+            f"Transactions/Sec: {latency_result['transactions_per_sec']:.2f}",
+            summary_format("Execute", latency_result[EXECUTE]),
+            summary_format("Rollback" if rollback else "Commit", latency_result[COMMIT]),
+            f"Phase Time (Generate / Bind / Execute / {'Rollback' if rollback else 'Commit'}): "
+            f"{' / '.join(f'{phase_times[phase]:.3f}' for phase in PHASES)} sec."]
+
+
+def export_latency_result(latency_result, prog, now, extra_info=None):
+    """
+    처리 속도 및 소요시간 분포를 reports 디렉토리에 JSON 파일로 저장
+    :param latency_result: LatencyRecorder.get_result 결과
+    :param prog: 프로그램 이름 (cdcbench, ranbench)
+    :param now: 작업 시작시간 (datetime, 파일명에 사용)
+    :param extra_info: 함께 저장할 작업 정보 Dictionary
+    :return: 저장한 파일 경로
+    """
+
+    if not os.path.exists(_report_dir):
+        os.makedirs(_report_dir)
+
+    file_path = os.path.join(_report_dir, _latency_file_name(prog, now))
+
+    report = {"program": prog, "start_time": f"{now:%Y-%m-%d %H:%M:%S}",
+              "export_time": f"{datetime.now():%Y-%m-%d %H:%M:%S}"}
+    if extra_info is not None:
+        report.update(extra_info)
+    report["latency_unit"] = "ms"
+    report.update(latency_result)
+
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=4, default=str)
+
+    return file_path
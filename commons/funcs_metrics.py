@@ -0,0 +1,185 @@
+from commons.funcs_latency import EXECUTE, COMMIT
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import threading
+
+
+_content_type = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Latency Histogram의 bucket 상한값 (Sec.)
+_latency_bounds = [0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
+
+
+class MetricsRegistry:
+    """
+    metrics endpoint로 노출할 처리량 및 소요시간 분포를 수집.
+    측정 대상 (source)은 snapshot() 으로 누적 처리량을 반환하는 instance (LatencyRecorder 등)이며,
+    scrape 시점에 source의 누적값을 읽어 합산하므로 DML 수행 중에는 별도의 Lock을 사용하지 않음
+    """
+
+    def __init__(self, rollback=False):
+        """
+        :param rollback: Rollback 여부 (Transaction 종료 횟수를 rollbacks로 노출)
+        """
+
+        self.rollback = rollback
+
+        self._sources = []
+        self._rows = {}
+        self._errors = 0
+        self._lock = threading.Lock()
+
+    def add_source(self, source, table_name=None, dml=None):
+        """
+        측정 대상을 등록 (작업 수행 중에도 등록 가능)
+        :param source: snapshot() 메소드를 가진 instance. histograms 속성이 있을 경우 소요시간 분포도 노출
+        :param table_name: source의 Record 수를 Table별 Record 수로 노출할 경우 Table 이름
+        :param dml: source의 Record 수를 Table별 Record 수로 노출할 경우 DML 유형
+        """
+
+        with self._lock:
+            self._sources.append((source, table_name, dml))
+
+    def add_rows(self, table_name, dml, record_count):
+        """
+        DML 한 번의 처리 Record 수를 Table별 Record 수에 누적 (table_name 없이 등록한 source의 경우 사용)
+        :param table_name: Table 이름
+        :param dml: DML 유형
+        :param record_count: 처리된 Record 수
+        """
+
+        with self._lock:
+            key = (table_name.upper(), dml)
+            self._rows[key] = self._rows.get(key, 0) + record_count
+
+    def add_error(self):
+        with self._lock:
+            self._errors += 1
+
+    def render(self):
+        """
+        :return: OpenMetrics text 형식의 metrics
+        """
+
+        with self._lock:
+            sources = list(self._sources)
+            rows = dict(self._rows)
+            errors = self._errors
+
+        statements = 0
+        tx_count = 0
+        in_flight_rows = 0
+
+        for source, table_name, dml in sources:
+            snapshot = source.snapshot()
+            statements += snapshot["dml"]
+            tx_count += snapshot["commits"]
+            in_flight_rows += snapshot["in_flight_rows"]
+            if table_name is not None:
+                key = (table_name.upper(), dml)
+                rows[key] = rows.get(key, 0) + snapshot["rows"]
+
+        lines = ["# TYPE cdcbench_rows counter",
+                 "# HELP cdcbench_rows Records processed by DML type and table."]
+        for (table_name, dml), record_count in sorted(rows.items()):
+            lines.append(f"cdcbench_rows_total{{table=\"{table_name}\",dml=\"{dml}\"}} {record_count}")
+
+        lines += _counter("statements", "DML statements executed.", statements)
+        lines += _counter("commits", "Transactions committed.", 0 if self.rollback else tx_count)
+        lines += _counter("rollbacks", "Transactions rolled back.", tx_count if self.rollback else 0)
+        lines += _counter("errors", "Sessions terminated by errors.", errors)
+
+        lines += ["# TYPE cdcbench_in_flight_rows gauge",
+                  "# HELP cdcbench_in_flight_rows Records executed but not yet committed or rolled back.",
+                  f"cdcbench_in_flight_rows {in_flight_rows}"]
+
+        histograms = [source.histograms for source, _, _ in sources if hasattr(source, "histograms")]
+        lines += _histogram("statement_latency_seconds", "DML statement execution time.",
+                            [histogram[EXECUTE] for histogram in histograms])
+        lines += _histogram("commit_latency_seconds", "Commit or rollback time.",
+                            [histogram[COMMIT] for histogram in histograms])
+
+        lines.append("# EOF")
+
+        return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    """
+    MetricsRegistry의 metrics를 별도 Thread에서 HTTP (/metrics)로 제공
+    """
+
+    def __init__(self, registry, port, host=""):
+        """
+        :param registry: MetricsRegistry instance
+        :param port: Listen port
+        :param host: Listen address (Default. 모든 interface)
+        """
+
+        class _MetricsHandler(BaseHTTPRequestHandler):
+
+            def do_GET(self):
+                if self.path.split("?")[0] not in ["/", "/metrics"]:
+                    self.send_error(404)
+                    return
+
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", _content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                # 요청 로그가 Progress Bar 출력과 섞이지 않도록 출력하지 않음
+                pass
+
+        self.port = port
+        self._server = ThreadingHTTPServer((host, port), _MetricsHandler)
+        self._server.daemon_threads = True
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="MetricsServer", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+
+def _counter(name, help_msg, value):
+    return [f"# TYPE cdcbench_{name} counter",
+            f"# HELP cdcbench_{name} {help_msg}",
+            f"cdcbench_{name}_total {value}"]
+
+
+def _histogram(name, help_msg, histograms):
+    """
+    여러 LatencyHistogram을 합산하여 OpenMetrics histogram 형식으로 생성
+    """
+
+    cumulative_counts = [0] * len(_latency_bounds)
+    count = 0
+    total = 0
+
+    for histogram in histograms:
+        histogram_counts, histogram_count, histogram_total = histogram.get_cumulative_counts(_latency_bounds)
+        for idx, cumulative_count in enumerate(histogram_counts):
+            cumulative_counts[idx] += cumulative_count
+        count += histogram_count
+        total += histogram_total
+
+    lines = [f"# TYPE cdcbench_{name} histogram",
+             f"# HELP cdcbench_{name} {help_msg}"]
+    for bound, cumulative_count in zip(_latency_bounds, cumulative_counts):
+        lines.append(f"cdcbench_{name}_bucket{{le=\"{bound}\"}} {cumulative_count}")
+    lines.append(f"cdcbench_{name}_bucket{{le=\"+Inf\"}} {count}")
+    lines.append(f"cdcbench_{name}_count {count}")
+    lines.append(f"cdcbench_{name}_sum {total}")
+
+    return lines
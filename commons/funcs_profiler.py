@@ -0,0 +1,293 @@
+from collections import Counter
+from datetime import datetime
+
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+
+
+_log_dir = "logs"
+_profile_file_name = lambda prog, now, ext: f"{prog}_profile_{now:%Y-%m-%d_%H%M%S}.{ext}"
+
+CPROFILE = "cprofile"
+SAMPLE = "sample"
+profile_modes = [CPROFILE, SAMPLE]
+
+# 요약 파일에 출력할 함수 수
+_TOP_N = 30
+
+# 수행시간을 구분할 항목. (항목 이름, (file, line, function) 판별 함수)
+# 항목에 속하지 않는 함수에서 항목에 속한 함수를 호출한 시점부터 반환할 때까지를 해당 항목의 시간으로 계산함
+_time_categories = [
+    ("Data Generation", lambda file, name: file.endswith("funcs_datamaker.py")),
+    ("SQLAlchemy Compile", lambda file, name: "sqlalchemy" in file and file.endswith("compiler.py")),
+    ("DBAPI Execute", lambda file, name: (file.endswith(os.path.join("engine", "default.py"))
+                                          and name in ["do_execute", "do_executemany", "do_execute_no_params",
+                                                       "do_commit", "do_rollback"])
+                                         or (file.endswith("funcs_bulkload.py") and name == "_execute"))
+]
+
+_profiler = None
+
+
+class Profiler:
+    """
+    작업의 수행시간 측정 구간 (start_time ~ end_time)을 Profiling 하여 logs 디렉토리에 결과를 저장.
+    cprofile: cProfile로 모든 함수 호출을 기록 (.prof 파일, pstats로 조회 가능)
+    sample: 일정 간격으로 모든 Thread의 Call Stack을 수집 (.folded 파일, FlameGraph 형식)
+    두 방식 모두 측정 구간 중 생성된 Thread (Session, Data 생성 Thread 등)를 포함하며, fork된 process는 제외함
+    """
+
+    def __init__(self, prog, now, mode=CPROFILE, sample_interval=0.005):
+        """
+        :param prog: 프로그램 이름 (cdcbench, ranbench, initializer)
+        :param now: 작업 시작시간 (datetime, 파일명에 사용)
+        :param mode: Profiling 방식 (cprofile, sample)
+        :param sample_interval: sample 방식의 Call Stack 수집 간격 (Sec.)
+        """
+
+        self.prog = prog
+        self.now = now
+        self.mode = mode
+        self.sample_interval = sample_interval
+
+        self.elapsed_time = 0
+
+        self._pid = os.getpid()
+        self._start_time = None
+        self._lock = threading.Lock()
+
+        # cprofile
+        self._profiles = []
+        self._section_profile = None
+
+        # sample
+        self._samples = Counter()
+        self._sample_count = 0
+        self._stop_event = threading.Event()
+        self._sampler_thread = None
+
+    def start(self):
+        """
+        측정 구간 시작. 이미 시작된 경우나 fork된 process에서 호출한 경우 무시함
+        """
+
+        if self._start_time is not None or os.getpid() != self._pid:
+            return
+
+        self._start_time = time.perf_counter()
+
+        if self.mode == CPROFILE:
+            threading.setprofile(self._enable_thread_profile)
+            self._section_profile = self._enable_profile()
+        else:
+            self._stop_event.clear()
+            self._sampler_thread = threading.Thread(target=self._sample, name="ProfileSampler", daemon=True)
+            self._sampler_thread.start()
+
+    def stop(self):
+        """
+        측정 구간 종료. 여러 번 start/stop 할 경우 각 구간의 결과를 누적함
+        """
+
+        if self._start_time is None or os.getpid() != self._pid:
+            return
+
+        if self.mode == CPROFILE:
+            threading.setprofile(None)
+            # 다른 Thread의 profile은 Thread 종료시 함께 중지되며, 결과 저장시 수집됨
+            self._section_profile.disable()
+            self._section_profile = None
+        else:
+            self._stop_event.set()
+            self._sampler_thread.join()
+            self._sampler_thread = None
+
+        self.elapsed_time += time.perf_counter() - self._start_time
+        self._start_time = None
+
+    def save(self):
+        """
+        Profiling 결과 (.prof 또는 .folded)와 요약 (.txt)을 logs 디렉토리에 저장
+        :return: (결과 파일 경로, 요약 파일 경로)
+        """
+
+        self.stop()
+
+        if not os.path.exists(_log_dir):
+            os.makedirs(_log_dir)
+
+        summary_path = os.path.join(_log_dir, _profile_file_name(self.prog, self.now, "txt"))
+
+        if self.mode == CPROFILE:
+            profile_path = os.path.join(_log_dir, _profile_file_name(self.prog, self.now, "prof"))
+            stats = self._get_stats()
+            stats.dump_stats(profile_path)
+            category_times = _get_category_times(stats)
+            top_functions = _get_top_functions(stats)
+        else:
+            profile_path = os.path.join(_log_dir, _profile_file_name(self.prog, self.now, "folded"))
+            self._dump_folded(profile_path)
+            category_times = self._get_category_times()
+            top_functions = self._get_top_functions()
+
+        with open(summary_path, "w", encoding="utf-8") as f:
+            f.write(f"{self.prog} profile ({self.mode}) - {self.now:%Y-%m-%d %H:%M:%S} / "
+                    f"saved at {datetime.now():%Y-%m-%d %H:%M:%S}\n")
+            f.write(f"Profiled section: {self.elapsed_time:.3f} sec.")
+            if self.mode == SAMPLE:
+                f.write(f" ({self._sample_count} samples, interval {self.sample_interval * 1000:g} ms)")
+            f.write("\n\n")
+
+            # 여러 Thread의 시간을 합산하므로 100%를 넘을 수 있음
+            f.write("::: Time split (summed over threads)\n")
+            for category_name, category_time in category_times:
+                ratio = category_time / self.elapsed_time * 100 if self.elapsed_time > 0 else 0
+                f.write(f"  {category_name:<20}: {category_time:10.3f} sec. ({ratio:6.2f} %)\n")
+            f.write("\n")
+
+            f.write(f"::: Top {_TOP_N} functions\n")
+            f.write(top_functions)
+
+        return profile_path, summary_path
+
+    def _enable_profile(self):
+        profile = cProfile.Profile()
+        with self._lock:
+            self._profiles.append(profile)
+        profile.enable()
+        return profile
+
+    def _enable_thread_profile(self, frame, event, arg):
+        # 측정 구간 중 시작된 Thread의 첫 호출 시점에 해당 Thread의 profile을 시작
+        sys.setprofile(None)
+        self._enable_profile()
+
+    def _get_stats(self):
+        stats = pstats.Stats()
+        for profile in self._profiles:
+            profile.create_stats()
+            stats.add(profile)
+        return stats
+
+    def _sample(self):
+
+        sampler_thread_id = threading.get_ident()
+
+        while not self._stop_event.wait(self.sample_interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == sampler_thread_id:
+                    continue
+
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+                    frame = frame.f_back
+
+                # 바깥쪽 호출부터 안쪽 호출 순서로 저장
+                self._samples[tuple(reversed(stack))] += 1
+
+            self._sample_count += 1
+
+    def _dump_folded(self, file_path):
+        with open(file_path, "w", encoding="utf-8") as f:
+            for stack, count in self._samples.most_common():
+                f.write(";".join(f"{name} ({os.path.basename(file)}:{line})" for file, line, name in stack))
+                f.write(f" {count}\n")
+
+    def _get_category_times(self):
+        category_samples = Counter()
+
+        for stack, count in self._samples.items():
+            # Call Stack에서 가장 안쪽의 항목으로 구분
+            for file, line, name in reversed(stack):
+                category_name = _get_category(file, name)
+                if category_name is not None:
+                    category_samples[category_name] += count
+                    break
+
+        return [(category_name, category_samples[category_name] * self.sample_interval)
+                for category_name, _ in _time_categories]
+
+    def _get_top_functions(self):
+        own_samples = Counter()
+        total_samples = Counter()
+
+        for stack, count in self._samples.items():
+            own_samples[stack[-1]] += count
+            for function in set(stack):
+                total_samples[function] += count
+
+        lines = [f"  {'own':>8} {'total':>8}  function"]
+        for function, count in own_samples.most_common(_TOP_N):
+            file, line, name = function
+            lines.append(f"  {count:8d} {total_samples[function]:8d}  {name} ({file}:{line})")
+
+        return "\n".join(lines) + "\n"
+
+
+def _get_category(file, name):
+    for category_name, is_category in _time_categories:
+        if is_category(file, name):
+            return category_name
+    return None
+
+
+def _get_category_times(stats):
+    """
+    각 항목의 함수를 항목 밖에서 호출한 경우의 누적 시간 (cumulative time)을 합산
+    :param stats: pstats.Stats instance
+    :return: [(항목 이름, 시간 (Sec.))]
+    """
+
+    category_times = Counter()
+
+    for (file, line, name), (_, _, _, _, callers) in stats.stats.items():
+        category_name = _get_category(file, name)
+        if category_name is None:
+            continue
+        for (caller_file, _, caller_name), caller_stats in callers.items():
+            if _get_category(caller_file, caller_name) != category_name:
+                category_times[category_name] += caller_stats[3]
+
+    return [(category_name, category_times[category_name]) for category_name, _ in _time_categories]
+
+
+def _get_top_functions(stats):
+    stream = io.StringIO()
+    stats.stream = stream
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(_TOP_N)
+    return stream.getvalue()
+
+
+def set_profiler(profiler):
+    """
+    start_profile/stop_profile 에서 사용할 Profiler를 지정
+    :param profiler: Profiler instance (None일 경우 Profiling 하지 않음)
+    """
+
+    global _profiler
+    _profiler = profiler
+
+
+def start_profile():
+    """
+    지정된 Profiler가 있을 경우 측정 구간을 시작 (작업의 start_time 시점에 호출)
+    """
+
+    if _profiler is not None:
+        _profiler.start()
+
+
+def stop_profile():
+    """
+    지정된 Profiler가 있을 경우 측정 구간을 종료 (작업의 end_time 시점에 호출)
+    """
+
+    if _profiler is not None:
+        _profiler.stop()
@@ -1,357 +1,546 @@
 from commons.constants import *
 from commons.funcs_common import get_start_time_msg, get_elapsed_time_msg, exec_database_error, print_error_msg
+from commons.funcs_keysampler import KeySampler
+from commons.funcs_latency import LatencyRecorder, GENERATE, BIND, COMMIT, get_latency_msgs
+from commons.funcs_profiler import start_profile, stop_profile
+from commons.funcs_stmtcache import StatementCache
 from commons.mgr_logger import LoggerManager
 
+from concurrent.futures import ThreadPoolExecutor
 from sqlalchemy.exc import DatabaseError
-from sqlalchemy.sql.expression import func, bindparam, text
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.sql.expression import func
 from tqdm import tqdm
 
 import os
 import random
 import texttable
+import threading
 import time
 
 
 _report_dir = "reports"
 _report_file_name = lambda now: f"ranbench_{now:%Y-%m-%d}.rep"
 
+_RUN_RECORD = "record"
+_RUN_DML_COUNT = "dml_count"
+_RUN_TIME = "time"
+
+
+class RateLimiter:
+    """
+    목표 발생 속도(초당 DML 수 / 초당 Record 수)에 맞춰 DML 발생 시점을 예약하는 Token Bucket.
+    DML 발생 시점을 시작 시각 기준으로 계산(open-loop)하므로 DML 수행 시간만큼 대기 시간이 자동으로 보정되며,
+    DB 지연으로 뒤처진 경우 max_burst 초 만큼의 DML만 연속으로 발생시켜 따라잡음
+    """
+
+    def __init__(self, tps=None, rows_per_sec=None, max_burst=1.0):
+
+        self.tps = tps
+        self.rows_per_sec = rows_per_sec
+        self.max_burst = max_burst
+
+        self._next_dml_time = None
+        self._next_record_time = None
+
+        # 여러 Session이 하나의 RateLimiter를 공유할 경우 발생 시점 예약을 직렬화
+        self._lock = threading.Lock()
+
+    def wait(self, record_count):
+        """
+        record_count 건의 DML을 발생시킬 수 있는 시점까지 대기
+        :param record_count: 발생시킬 DML의 Record 수
+        :return: None
+        """
+
+        with self._lock:
+
+            current_time = time.perf_counter()
+
+            if self._next_dml_time is None:
+                self._next_dml_time = current_time
+                self._next_record_time = current_time
+
+            scheduled_time = max(self._next_dml_time, self._next_record_time, current_time - self.max_burst)
+
+            if self.tps:
+                self._next_dml_time = scheduled_time + 1 / self.tps
+            if self.rows_per_sec:
+                self._next_record_time = scheduled_time + record_count / self.rows_per_sec
+
+        if scheduled_time > current_time:
+            time.sleep(scheduled_time - current_time)
+
+
+class _SessionContext:
+    """
+    ranbench Session 간 공유하는 Report, Progress Bar, Key Index, 처리량 측정 및 중지 요청 상태
+    """
+
+    def __init__(self, run_type, run_value, detail_tab, progress_bar, with_session, key_sampler, sampler=None,
+                 metrics=None):
+
+        self.run_type = run_type
+        self.run_value = run_value
+        self.detail_tab = detail_tab
+        self.progress_bar = progress_bar
+        self.stop_event = threading.Event()
+        self.key_sampler = key_sampler
+        self.sampler = sampler
+        self.metrics = metrics
+
+        self._start_time = None
+        self._run_end_time = None
+        self._with_session = with_session
+        self._dml_seq = 0
+        self._lock = threading.Lock()
+
+    def start(self, start_time):
+        """
+        수행 시작 시각을 지정 (Key 조회 등 사전 작업 이후에 호출하여 수행 시간과 Progress Bar에 포함되지 않도록 함)
+        :param start_time: 수행 시작 시각 (time.time)
+        """
+
+        self._start_time = start_time
+        self._run_end_time = start_time + self.run_value if self.run_type == _RUN_TIME else None
+        self.progress_bar.reset(total=self.progress_bar.total)
+
+    def add_dml(self, session_no, table, dml, random_record):
+        """
+        수행한 DML을 Report에 추가하고 Progress Bar를 갱신
+        :param session_no: DML을 수행한 Session 번호
+        :param table: DML을 수행한 Table
+        :param dml: DML 유형
+        :param random_record: DML의 Record 수
+        :return: None
+        """
+
+        with self._lock:
+
+            self._dml_seq += 1
+            if self._with_session:
+                self.detail_tab.add_row([self._dml_seq, session_no, table, dml, random_record])
+            else:
+                self.detail_tab.add_row([self._dml_seq, table, dml, random_record])
+
+            if self.run_type == _RUN_RECORD:
+                self.progress_bar.update(random_record)
+            elif self.run_type == _RUN_DML_COUNT:
+                self.progress_bar.update(1)
+            else:
+                # 수행 시간 기준일 경우 경과 시간으로 Progress Bar를 갱신
+                elapsed_time = min(time.time() - self._start_time, self.progress_bar.total)
+                self.progress_bar.update(elapsed_time - self.progress_bar.n)
+
+    def is_time_over(self):
+        return time.time() >= self._run_end_time
+
+
+class CommitPolicy:
+    """
+    ranbench 수행 중 Transaction을 Commit할 조건.
+    지정한 조건 중 하나라도 만족하면 Commit 시점으로 판단
+    """
+
+    def __init__(self, every_dml=None, every_rows=None, interval=None):
+
+        self.every_dml = every_dml
+        self.every_rows = every_rows
+        self.interval = interval
+
+    def is_due(self, tx_dml_count, tx_record_count, tx_start_time):
+        """
+        현재 Transaction을 Commit할 시점인지 판단
+        :param tx_dml_count: 현재 Transaction에서 수행한 DML 수
+        :param tx_record_count: 현재 Transaction에서 변경한 Record 수
+        :param tx_start_time: 현재 Transaction 시작시간 (time.perf_counter)
+        :return: True or False
+        """
+
+        if tx_dml_count == 0:
+            return False
+
+        if self.every_dml is not None and tx_dml_count >= self.every_dml:
+            return True
+        elif self.every_rows is not None and tx_record_count >= self.every_rows:
+            return True
+        elif self.interval is not None and time.perf_counter() - tx_start_time >= self.interval:
+            return True
+        else:
+            return False
+
 
 class FuncRanBench:
 
-    def __init__(self, conn):
+    def __init__(self, conn, config_name=None, refresh_keys=False, statement_cache=None):
+        """
+        :param conn: ConnectionManager instance
+        :param config_name: Key Registry를 구분할 Config 파일명 (None일 경우 Key Registry를 사용하지 않음)
+        :param refresh_keys: Key Registry를 무시하고 Table에서 Key를 다시 조회할지 여부
+        :param statement_cache: Session 간 공유할 StatementCache instance (None일 경우 새로 생성)
+        """
 
         self.logger = LoggerManager.get_logger(__name__)
         self.log_level = LoggerManager.get_log_level()
 
+        self.conn = conn
         self.engine = conn.engine
-        self.connection = conn.engine.connect()
+        # (Table, Column 구성, DML 유형)별 Statement를 한 번만 생성/컴파일하여 모든 Session에서 재사용
+        self.statement_cache = statement_cache if statement_cache is not None else StatementCache()
+        self.connection = self.statement_cache.connect(conn.engine)
         self.db_session = conn.db_session
         self.dbms_type = conn.dbms_type
 
+        self.config_name = config_name
+        self.refresh_keys = refresh_keys
+
         if not os.path.exists(_report_dir):
             os.makedirs(_report_dir)
 
-    def run_record_random(self, total_record, record_range, sleep, tables, dml, data_makers, rollback, now, verbose):
+    def run_record_random(self, total_record, record_range, sleep, tables, dml, data_makers, rollback, now, verbose,
+                          rate_limiter=None, sessions=1, commit_policy=None, sampler=None, metrics=None):
         """
         총 record 수 기준으로 random dml을 발생
-        :param total_record: 총 Record Count
+        :param total_record: 총 Record Count (Session별로 나누어 수행)
         :param record_range: DML당 발생할 Record Range
         :param sleep: DML간의 sleep time
         :param tables: 발생시킬 Table List
-        :param dml: 발생시킬 DML 유형
+        :param dml: 발생시킬 DML 유형 List
         :param data_makers: DataMaker instance
         :param rollback: Rollback 여부
         :param now: 작업 고유 ID (Time)
         :param verbose: 작업 진행도(Progress Bar)를 표시할지 여부
+        :param rate_limiter: DML 발생 속도를 제어할 RateLimiter instance
+        :param sessions: 동시에 DML을 발생시킬 Session 수
+        :param commit_policy: Transaction을 중간에 Commit할 조건 (CommitPolicy instance, 미사용시 전체를 하나의 Transaction으로 수행)
+        :param sampler: Session별 처리량을 측정할 ThroughputSampler instance
+        :param metrics: Session별 처리량을 노출할 MetricsRegistry instance
         :return: 작업 처리 결과 (result_dict)
         """
 
-        result_dict = {"dml_count": 0, "total_record": 0, "elapsed_time": None, "detail": {}}
-
-        try:
-
-            # TextTable 생성
-            detail_tab = _make_report()
-            progress_bar = tqdm(total=total_record, disable=verbose, ncols=tqdm_ncols, bar_format=tqdm_bar_format,
-                                postfix=tqdm_bench_postfix(rollback))
-
-            start_time = time.time()
-
-            with self.connection.begin() as tx:
-
-                while True:
-                    random_record = random.randrange(record_range[0], record_range[1] + 1)
-                    # random_record가 남은 record보다 클 경우 남은 record로 수행
-                    if random_record > total_record:
-                        random_record = total_record
-
-                    random_table = tables[random.randrange(len(tables))]
-                    if random_table.name not in result_dict["detail"]:
-                        result_dict["detail"][random_table.name] = {"INSERT": 0, "UPDATE": 0, "DELETE": 0}
-
-                    random_dml = dml[random.randrange(len(dml))]
-
-                    performed_columns = [column for column in random_table.columns if column.default is None]
-
-                    table_alias = random_table.name.split("_")[0].upper()
-                    data_maker = data_makers[table_alias]
-
-                    random_data = _get_random_data(random_record, data_maker, random_table, performed_columns,
-                                                   self.dbms_type)
-
-                    if random_dml == "INSERT":
-                        dml_result = self.connection.execute(random_table.insert(), random_data)
-                        
-                        # SQL Server의 경우 pyodbc 제약으로 실제 수행된 record count를 반환하지 않아, random_record 값으로 계산
-                        if self.dbms_type == SQLSERVER:
-                            _sum_record_count(result_dict, random_table.name, "INSERT", random_record)
-                            total_record -= random_record
-                        else:
-                            _sum_record_count(result_dict, random_table.name, "INSERT", dml_result.rowcount)
-                            total_record -= dml_result.rowcount
-
-                    elif random_dml == "UPDATE":
-                        dml_result = self._run_update(random_table, random_record, performed_columns, random_data)
-                        if dml_result is None:
-                            continue
-
-                        if self.dbms_type == SQLSERVER:
-                            _sum_record_count(result_dict, random_table.name, "UPDATE", random_record)
-                            total_record -= random_record
-                        else:
-                            _sum_record_count(result_dict, random_table.name, "UPDATE", dml_result.rowcount)
-                            total_record -= dml_result.rowcount
-
-                    elif random_dml == "DELETE":
-                        dml_result = self._run_delete(random_table, random_record)
-                        if dml_result is None:
-                            continue
-
-                        if self.dbms_type == SQLSERVER:
-                            _sum_record_count(result_dict, random_table.name, "DELETE", random_record)
-                            total_record -= random_record
-                        else:
-                            _sum_record_count(result_dict, random_table.name, "DELETE", dml_result.rowcount)
-                            total_record -= dml_result.rowcount
-
-                    result_dict["dml_count"] += 1
-                    detail_tab.add_row([result_dict["dml_count"], random_table, random_dml, random_record])
-                    progress_bar.update(random_record)
-
-                    time.sleep(sleep)
-                    
-                    # 종료 조건
-                    if total_record <= 0:
-                        break
-
-                # Transaction 종료
-                _complete_tx(tx, rollback)
-
-                end_time = time.time()
-
-                # Report 출력
-                with open(os.path.join(_report_dir, _report_file_name(now)), "a", encoding="utf-8") as f:
-                    _draw_report(f, detail_tab, now, rollback)
-
-                progress_bar.close()
+        progress_bar = tqdm(total=total_record, disable=verbose, ncols=tqdm_ncols, bar_format=tqdm_bar_format,
+                            postfix=tqdm_bench_postfix(rollback))
 
-            result_dict["elapsed_time"] = get_elapsed_time_msg(end_time, start_time)
-
-            return result_dict
+        return self._run_random(_RUN_RECORD, total_record, record_range, sleep, tables, dml, data_makers, rollback,
+                                now, progress_bar, rate_limiter, sessions, commit_policy, sampler, metrics)
 
-        except DatabaseError as dberr:
-            f.write("  ::: Transaction Rollback. ::: \n")
-            exec_database_error(self.logger, self.log_level, dberr)
-
-    def run_dml_count_random(self, dml_count, record_range, sleep, tables, dml, data_makers, rollback, now, verbose):
+    def run_dml_count_random(self, dml_count, record_range, sleep, tables, dml, data_makers, rollback, now, verbose,
+                             rate_limiter=None, sessions=1, commit_policy=None, sampler=None, metrics=None):
         """
         DML 횟수를 기준으로 Random DML 발생
-        :param dml_count: 총 DML Count
+        :param dml_count: 총 DML Count (Session별로 나누어 수행)
         :param record_range: DML당 발생할 Record Range
         :param sleep: DML간의 sleep time
         :param tables: 발생시킬 Table List
-        :param dml: 발생시킬 DML 유형
+        :param dml: 발생시킬 DML 유형 List
         :param data_makers: DataMaker instance
         :param rollback: Rollback 여부
         :param now: 작업 고유 ID (Time)
         :param verbose: 작업 진행도(Progress Bar)를 표시할지 여부
+        :param rate_limiter: DML 발생 속도를 제어할 RateLimiter instance
+        :param sessions: 동시에 DML을 발생시킬 Session 수
+        :param commit_policy: Transaction을 중간에 Commit할 조건 (CommitPolicy instance, 미사용시 전체를 하나의 Transaction으로 수행)
+        :param sampler: Session별 처리량을 측정할 ThroughputSampler instance
+        :param metrics: Session별 처리량을 노출할 MetricsRegistry instance
         :return: 작업 처리 결과 (result_dict)
         """
 
-        result_dict = {"dml_count": 0, "total_record": 0, "elapsed_time": None, "detail": {}}
+        progress_bar = tqdm(total=dml_count, disable=verbose, ncols=tqdm_ncols, bar_format=tqdm_bar_format,
+                            postfix=tqdm_bench_postfix(rollback))
 
-        try:
+        return self._run_random(_RUN_DML_COUNT, dml_count, record_range, sleep, tables, dml, data_makers, rollback,
+                                now, progress_bar, rate_limiter, sessions, commit_policy, sampler, metrics)
 
-            # Report 파일 및 TextTable 생성
-            detail_tab = _make_report()
-            progress_bar = tqdm(total=dml_count, disable=verbose, ncols=tqdm_ncols, bar_format=tqdm_bar_format,
-                                postfix=tqdm_bench_postfix(rollback))
-
-            start_time = time.time()
+    def run_time_random(self, running_time, record_range, sleep, tables, dml, data_makers, rollback, now, verbose,
+                        rate_limiter=None, sessions=1, commit_policy=None, sampler=None, metrics=None):
+        """
+        수행시간을 기준으로 Random DML 발생
+        :param running_time: 총 수행 시간 (모든 Session이 동일한 시간 동안 수행)
+        :param record_range: DML당 발생할 Record Range
+        :param sleep: DML간의 sleep time
+        :param tables: 발생시킬 Table List
+        :param dml: 발생시킬 DML 유형 List
+        :param data_makers: DataMaker instance
+        :param rollback: Rollback 여부
+        :param now: 작업 고유 ID (Time)
+        :param verbose: 작업 진행도(Progress Bar)를 표시할지 여부
+        :param rate_limiter: DML 발생 속도를 제어할 RateLimiter instance
+        :param sessions: 동시에 DML을 발생시킬 Session 수
+        :param commit_policy: Transaction을 중간에 Commit할 조건 (CommitPolicy instance, 미사용시 전체를 하나의 Transaction으로 수행)
+        :param sampler: Session별 처리량을 측정할 ThroughputSampler instance
+        :param metrics: Session별 처리량을 노출할 MetricsRegistry instance
+        :return: 작업 처리 결과 (result_dict)
+        """
 
-            with self.connection.begin() as tx:
+        progress_bar = tqdm(total=running_time, disable=verbose, ncols=tqdm_ncols, bar_format=tqdm_time_bar_format,
+                            postfix=tqdm_bench_postfix(rollback))
 
-                while True:
-                    random_record = random.randrange(record_range[0], record_range[1] + 1)
+        return self._run_random(_RUN_TIME, running_time, record_range, sleep, tables, dml, data_makers, rollback,
+                                now, progress_bar, rate_limiter, sessions, commit_policy, sampler, metrics)
 
-                    random_table = tables[random.randrange(len(tables))]
-                    if random_table.name not in result_dict["detail"]:
-                        result_dict["detail"][random_table.name] = {"INSERT": 0, "UPDATE": 0, "DELETE": 0}
+    def _run_random(self, run_type, run_value, record_range, sleep, tables, dml, data_makers, rollback, now,
+                    progress_bar, rate_limiter, sessions, commit_policy, sampler=None, metrics=None):
+        """
+        Session 수만큼 Random DML을 동시에 발생시키고, Session별 처리 결과를 result_dict로 병합
+        :param run_type: 수행 기준 (_RUN_RECORD, _RUN_DML_COUNT, _RUN_TIME)
+        :param run_value: 수행 기준 값 (총 Record Count, 총 DML Count, 총 수행 시간)
+        :param progress_bar: 모든 Session이 공유하는 Progress Bar
+        :param sampler: Session별 처리량을 측정할 ThroughputSampler instance
+        :param metrics: Session별 처리량을 노출할 MetricsRegistry instance
+        :return: 작업 처리 결과 (result_dict)
+        """
 
-                    random_dml = dml[random.randrange(len(dml))]
+        result_dict = {"dml_count": 0, "total_record": 0, "elapsed_time": None, "detail": {}, "sessions": [],
+                       "latency": LatencyRecorder()}
 
-                    performed_columns = [column for column in random_table.columns if column.default is None]
+        # Connection Pool 크기를 넘는 Session은 Connection을 얻지 못하므로 사전에 차단
+        if sessions > 1 and isinstance(self.engine.pool, QueuePool) \
+           and sessions > self.engine.pool.size() + self.conn.max_overflow:
+            print_error_msg(f"The number of sessions exceeds the connection pool size "
+                            f"({self.engine.pool.size() + self.conn.max_overflow}). \n"
+                            f"  * Note. Please check POOL_SIZE and MAX_OVERFLOW in the configuration file.")
 
-                    table_alias = random_table.name.split("_")[0].upper()
-                    data_maker = data_makers[table_alias]
+        detail_tab = _make_report(sessions > 1)
+        context = _SessionContext(run_type, run_value, detail_tab, progress_bar, sessions > 1,
+                                  KeySampler(self.config_name, self.refresh_keys, sessions), sampler, metrics)
 
-                    random_data = _get_random_data(random_record, data_maker, random_table, performed_columns,
-                                                   self.dbms_type)
+        # 수행 기준 값을 Session별로 분배 (수행 시간은 모든 Session에 동일하게 적용)
+        if run_type == _RUN_TIME:
+            session_values = [run_value] * sessions
+        else:
+            session_values = [run_value // sessions + (1 if session_idx < run_value % sessions else 0)
+                              for session_idx in range(sessions)]
 
-                    if random_dml == "INSERT":
-                        dml_result = self.connection.execute(random_table.insert(), random_data)
+        try:
 
-                        if self.dbms_type == SQLSERVER:
-                            _sum_record_count(result_dict, random_table.name, "INSERT", random_record)
-                        else:
-                            _sum_record_count(result_dict, random_table.name, "INSERT", dml_result.rowcount)
+            # Session별 Key Index를 Table별 한 번의 Key 조회로 초기화 (Session마다 전체 Key를 조회하지 않도록 함)
+            if "UPDATE" in dml or "DELETE" in dml:
+                context.key_sampler.load(self.connection, tables)
 
-                    elif random_dml == "UPDATE":
-                        dml_result = self._run_update(random_table, random_record, performed_columns, random_data)
-                        if dml_result is None:
-                            continue
+            start_time = time.time()
+            context.start(start_time)
+            start_profile()
 
-                        if self.dbms_type == SQLSERVER:
-                            _sum_record_count(result_dict, random_table.name, "UPDATE", random_record)
-                        else:
-                            _sum_record_count(result_dict, random_table.name, "UPDATE", dml_result.rowcount)
+            if sessions == 1:
+                session_results = [self._run_session(1, run_type, run_value, record_range, sleep, tables, dml,
+                                                     data_makers, rollback, rate_limiter, commit_policy, context)]
 
-                    elif random_dml == "DELETE":
-                        dml_result = self._run_delete(random_table, random_record)
-                        if dml_result is None:
-                            continue
+            else:
+                try:
+                    with ThreadPoolExecutor(max_workers=sessions) as executor:
+                        futures = [executor.submit(self._run_new_session, session_no, run_type, session_value,
+                                                   record_range, sleep, tables, dml, data_makers, rollback,
+                                                   rate_limiter, commit_policy, context)
+                                   for session_no, session_value in enumerate(session_values, start=1)
+                                   if session_value > 0]
+                except BaseException:
+                    # 사용자 취소 등으로 중단될 경우 수행 중인 Session을 중지
+                    context.stop_event.set()
+                    raise
 
-                        if self.dbms_type == SQLSERVER:
-                            _sum_record_count(result_dict, random_table.name, "DELETE", random_record)
-                        else:
-                            _sum_record_count(result_dict, random_table.name, "DELETE", dml_result.rowcount)
+                session_results = [future.result() for future in futures]
 
-                    result_dict["dml_count"] += 1
-                    detail_tab.add_row([result_dict["dml_count"], random_table, random_dml, random_record])
-                    progress_bar.update(1)
+            stop_profile()
+            end_time = time.time()
 
-                    time.sleep(sleep)
-                    
-                    # 종료 조건
-                    if result_dict["dml_count"] == dml_count:
-                        break
+            progress_bar.close()
 
-                # Transaction 종료
-                _complete_tx(tx, rollback)
+            for session_result in session_results:
+                _merge_result(result_dict, session_result)
 
-                end_time = time.time()
+            # 변경된 Key 목록을 다음 수행에서 사용할 수 있도록 저장
+            if not rollback:
+                context.key_sampler.save(self.connection)
 
-                # Report 출력
-                with open(os.path.join(_report_dir, _report_file_name(now)), "a", encoding="utf-8") as f:
-                    _draw_report(f, detail_tab, now, rollback)
+            result_dict["rate"] = _get_rate_result(result_dict, rate_limiter, start_time, end_time)
+            result_dict["latency_result"] = result_dict["latency"].get_result(start_time, end_time)
 
-                progress_bar.close()
+            # Report 출력
+            with open(os.path.join(_report_dir, _report_file_name(now)), "a", encoding="utf-8") as f:
+                _draw_report(f, detail_tab, now, rollback, result_dict["rate"] if rate_limiter else None,
+                             result_dict["latency_result"])
 
             result_dict["elapsed_time"] = get_elapsed_time_msg(end_time, start_time)
 
             return result_dict
 
         except DatabaseError as dberr:
-            f.write("  ::: Transaction Rollback. ::: \n")
+            progress_bar.close()
+            with open(os.path.join(_report_dir, _report_file_name(now)), "a", encoding="utf-8") as f:
+                f.write("  ::: Transaction Rollback ::: \n")
             exec_database_error(self.logger, self.log_level, dberr)
 
-    def run_time_random(self, running_time, record_range, sleep, tables, dml, data_makers, rollback, now, verbose):
+    def _run_new_session(self, *session_args):
         """
-        수행시간을 기준으로 Random DML 발생
-        :param running_time: 총 수행 시간
-        :param record_range: DML당 발생할 Record Range
-        :param sleep: DML간의 sleep time
-        :param tables: 발생시킬 Table List
-        :param dml: 발생시킬 DML 유형 List
-        :param data_makers: DataMaker instance
-        :param rollback: Rollback 여부
-        :param now: 작업 고유 ID (Time)
-        :param verbose: 작업 진행도(Progress Bar)를 표시할지 여부
-        :return: 작업 처리 결과 (result_dict)
+        별도의 Connection을 생성하여 Session을 수행 (Session을 수행할 Thread에서 호출)
+        :param session_args: _run_session 인자
+        :return: Session 처리 결과
         """
 
-        result_dict = {"dml_count": 0, "total_record": 0, "elapsed_time": None, "detail": {}}
+        worker = FuncRanBench(self.conn, statement_cache=self.statement_cache)
 
         try:
+            return worker._run_session(*session_args)
+        finally:
+            worker.connection.close()
 
-            # Report 파일 및 TextTable 생성
-            detail_tab = _make_report()
-            progress_bar = tqdm(total=running_time, disable=verbose, ncols=tqdm_ncols, bar_format=tqdm_time_bar_format,
-                                postfix=tqdm_bench_postfix(rollback))
-            run_end_time = time.time() + running_time
+    def _run_session(self, session_no, run_type, run_value, record_range, sleep, tables, dml, data_makers,
+                     rollback, rate_limiter, commit_policy, context):
+        """
+        하나의 Session(Connection)에서 Random DML을 발생.
+        commit_policy가 없으면 전체를 하나의 Transaction으로, 있으면 조건을 만족할 때마다 Transaction을 종료하고 새로 시작
+        :param session_no: Session 번호
+        :param run_type: 수행 기준 (_RUN_RECORD, _RUN_DML_COUNT, _RUN_TIME)
+        :param run_value: 해당 Session의 수행 기준 값
+        :param commit_policy: CommitPolicy instance
+        :param context: Session 간 공유하는 _SessionContext instance
+        :return: Session 처리 결과 (dml_count, total_record, detail, latency)
+        """
 
-            start_time = time.time()
+        result_dict = {"session": session_no, "dml_count": 0, "total_record": 0, "detail": {},
+                       "latency": LatencyRecorder()}
 
-            with self.connection.begin() as tx:
+        if context.sampler is not None:
+            context.sampler.add_source(result_dict["latency"])
+        if context.metrics is not None:
+            context.metrics.add_source(result_dict["latency"])
+        remaining_record = run_value if run_type == _RUN_RECORD else None
 
-                while True:
-                    
-                    progress_start_time = time.time()
+        tx = None
 
-                    random_record = random.randrange(record_range[0], record_range[1] + 1)
+        try:
 
-                    random_table = tables[random.randrange(len(tables))]
-                    if random_table.name not in result_dict["detail"]:
-                        result_dict["detail"][random_table.name] = {"INSERT": 0, "UPDATE": 0, "DELETE": 0}
+            tx = self.connection.begin()
+            tx_dml_count = 0
+            tx_record_count = 0
+            tx_start_time = time.perf_counter()
 
-                    random_dml = dml[random.randrange(len(dml))]
+            while not context.stop_event.is_set():
 
-                    performed_columns = [column for column in random_table.columns if column.default is None]
+                # random_record가 남은 record보다 클 경우 남은 record로 수행
+                dml_info = self._run_random_dml(record_range, tables, dml, data_makers, result_dict,
+                                                context.key_sampler, rate_limiter, remaining_record, session_no - 1)
 
-                    table_alias = random_table.name.split("_")[0].upper()
-                    data_maker = data_makers[table_alias]
+                if dml_info is not None:
+                    random_table, random_dml, random_record, record_count = dml_info
+                    result_dict["dml_count"] += 1
+                    context.add_dml(session_no, random_table, random_dml, random_record)
+                    if context.metrics is not None:
+                        context.metrics.add_rows(random_table.name, random_dml, record_count)
 
-                    random_data = _get_random_data(random_record, data_maker, random_table, performed_columns,
-                                                   self.dbms_type)
+                    tx_dml_count += 1
+                    tx_record_count += record_count
 
-                    if random_dml == "INSERT":
-                        dml_result = self.connection.execute(random_table.insert(), random_data)
-                        if self.dbms_type == SQLSERVER:
-                            _sum_record_count(result_dict, random_table.name, "INSERT", random_record)
-                        else:
-                            _sum_record_count(result_dict, random_table.name, "INSERT", dml_result.rowcount)
+                    time.sleep(sleep)
 
-                    elif random_dml == "UPDATE":
-                        dml_result = self._run_update(random_table, random_record, performed_columns, random_data)
-                        if dml_result is None:
-                            continue
+                    if run_type == _RUN_RECORD:
+                        remaining_record -= record_count
+
+                # 종료 조건
+                if run_type == _RUN_RECORD and remaining_record <= 0:
+                    break
+                elif run_type == _RUN_DML_COUNT and result_dict["dml_count"] == run_value:
+                    break
+                elif run_type == _RUN_TIME and context.is_time_over():
+                    break
+
+                # Commit 조건을 만족할 경우 Transaction을 종료하고 새로운 Transaction 시작
+                if commit_policy is not None and commit_policy.is_due(tx_dml_count, tx_record_count, tx_start_time):
+                    result_dict["latency"].record(COMMIT, _complete_tx(tx, rollback))
+                    context.key_sampler.end_transaction(session_no - 1, not rollback)
+                    tx = self.connection.begin()
+                    tx_dml_count = 0
+                    tx_record_count = 0
+                    tx_start_time = time.perf_counter()
+
+            # Transaction 종료
+            result_dict["latency"].record(COMMIT, _complete_tx(tx, rollback))
+            context.key_sampler.end_transaction(session_no - 1, not rollback)
 
-                        if self.dbms_type == SQLSERVER:
-                            _sum_record_count(result_dict, random_table.name, "UPDATE", random_record)
-                        else:
-                            _sum_record_count(result_dict, random_table.name, "UPDATE", dml_result.rowcount)
+            return result_dict
 
-                    elif random_dml == "DELETE":
-                        dml_result = self._run_delete(random_table, random_record)
-                        if dml_result is None:
-                            continue
+        except BaseException as err:
+            if context.metrics is not None and not isinstance(err, KeyboardInterrupt):
+                context.metrics.add_error()
+            # 진행 중인 Transaction을 Rollback 하고 다른 Session도 중지시킴
+            if tx is not None and tx.is_active:
+                tx.rollback()
+            context.key_sampler.end_transaction(session_no - 1, False)
+            context.stop_event.set()
+            raise
+
+    def _run_random_dml(self, record_range, tables, dml, data_makers, result_dict, key_sampler, rate_limiter=None,
+                        remaining_record=None, partition_no=0):
+        """
+        임의의 Table에 임의의 DML을 한 번 수행하고 result_dict에 처리 건수를 누적
+        :param record_range: DML당 발생할 Record Range
+        :param tables: 발생시킬 Table List
+        :param dml: 발생시킬 DML 유형 List
+        :param data_makers: DataMaker instance
+        :param result_dict: 작업 처리 결과
+        :param key_sampler: UPDATE/DELETE 대상 Key를 추출할 KeySampler instance
+        :param rate_limiter: DML 발생 속도를 제어할 RateLimiter instance
+        :param remaining_record: 남은 record 수 (random_record가 이 값보다 클 경우 남은 record로 수행)
+        :param partition_no: UPDATE/DELETE 대상 Key를 추출할 Session의 partition 번호
+        :return: (Table, DML 유형, random_record, 처리된 Record Count). 대상 Record가 부족하여 Skip된 경우 None
+        """
 
-                        if self.dbms_type == SQLSERVER:
-                            _sum_record_count(result_dict, random_table.name, "DELETE", random_record)
-                        else:
-                            _sum_record_count(result_dict, random_table.name, "DELETE", dml_result.rowcount)
+        random_record = random.randrange(record_range[0], record_range[1] + 1)
+        if remaining_record is not None and random_record > remaining_record:
+            random_record = remaining_record
 
-                    result_dict["dml_count"] += 1
-                    detail_tab.add_row([result_dict["dml_count"], random_table, random_dml, random_record])
+        random_table = tables[random.randrange(len(tables))]
+        if random_table.name not in result_dict["detail"]:
+            result_dict["detail"][random_table.name] = {"INSERT": 0, "UPDATE": 0, "DELETE": 0}
 
-                    time.sleep(sleep)
+        random_dml = dml[random.randrange(len(dml))]
 
-                    progress_end_time = time.time()
-                    
-                    # 종료 조건
-                    if time.time() >= run_end_time:
-                        break
+        performed_columns = self.statement_cache.get_columns(random_table)
 
-                    # Progress Bar 갱신을 위해 DML 당 소요시간을 계산
-                    progress_bar.update(float(progress_end_time) - float(progress_start_time))
+        table_alias = random_table.name.split("_")[0].upper()
+        data_maker = data_makers[table_alias]
 
-                progress_bar.close()
-                # Transaction 종료
-                _complete_tx(tx, rollback)
+        generate_start_time = time.perf_counter()
+        random_data = _get_random_data(random_record, data_maker, random_table, performed_columns, self.dbms_type)
+        result_dict["latency"].add_phase_time(GENERATE, time.perf_counter() - generate_start_time)
 
-                end_time = time.time()
+        key_index = key_sampler.get_index(random_table, partition_no)
 
-                # Report 출력
-                with open(os.path.join(_report_dir, _report_file_name(now)), "a", encoding="utf-8") as f:
-                    _draw_report(f, detail_tab, now, rollback)
+        # 아래 처리된 Record Count와 동일한 기준으로 LatencyRecorder에 Record 수를 기록
+        latency_rows = random_record if self.dbms_type == SQLSERVER else None
 
-            result_dict["elapsed_time"] = get_elapsed_time_msg(end_time, start_time)
+        if random_dml == "INSERT":
+            bind_start_time = time.perf_counter()
+            insert_stmt = self.statement_cache.get_insert(random_table)
+            result_dict["latency"].add_phase_time(BIND, time.perf_counter() - bind_start_time)
 
-            return result_dict
+            # 목표 발생 속도에 맞춰 DML 수행 시점까지 대기
+            if rate_limiter is not None:
+                rate_limiter.wait(random_record)
 
-        except DatabaseError as dberr:
-            f.write("  ::: Transaction Rollback ::: \n")
-            exec_database_error(self.logger, self.log_level, dberr)
+            # 다른 Session이 Insert된 Key를 누락하지 않도록 Insert 수행 전에 알림
+            key_index.notify_insert()
+            dml_result = result_dict["latency"].execute(self.connection.execute, insert_stmt, random_data,
+                                                        rows=latency_rows)
+        elif random_dml == "UPDATE":
+            dml_result = self._run_update(random_table, random_record, performed_columns, random_data, key_index,
+                                          result_dict["latency"], latency_rows, rate_limiter)
+        else:
+            dml_result = self._run_delete(random_table, random_record, key_index, result_dict["latency"],
+                                          latency_rows, rate_limiter)
+
+        if dml_result is None:
+            return None
+
+        # SQL Server의 경우 pyodbc 제약으로 실제 수행된 record count를 반환하지 않아, random_record 값으로 계산
+        if self.dbms_type == SQLSERVER:
+            record_count = random_record
+        else:
+            record_count = dml_result.rowcount
+
+        _sum_record_count(result_dict, random_table.name, random_dml, record_count)
+
+        return random_table, random_dml, random_record, record_count
 
     def run_select_count(self, where_column):
         """
@@ -363,80 +552,77 @@ class FuncRanBench:
                                          .with_only_columns([func.count(where_column).label("ID_COUNT")])
         return self.connection.execute(row_count_query).scalar()
 
-    def _run_update(self, random_table, random_record, performed_columns, random_data):
+    def _run_update(self, random_table, random_record, performed_columns, random_data, key_index, latency,
+                    latency_rows=None, rate_limiter=None):
         """
         임의의 Record에 대해 Update 수행
         :param random_table: UPDATE 대상 Table
         :param random_record: UPDATE를 수행할 Record 수
         :param performed_columns: UPDATE를 수행할 Column List
         :param random_data: UPDATE할 Data
+        :param key_index: UPDATE 대상 Key를 추출할 LiveKeyIndex instance
+        :param latency: 수행 시간을 기록할 LatencyRecorder instance
+        :param latency_rows: LatencyRecorder에 기록할 Record 수 (None일 경우 수행 결과의 rowcount)
+        :param rate_limiter: DML 발생 속도를 제어할 RateLimiter instance
         :return: Update된 Record Count
         """
 
         where_column = random_table.columns[random_table.columns.keys()[0]]
 
-        # Update 실행 여부를 결정하기 위해 Count 조회
-        update_row_count = self.run_select_count(where_column)
-
         # Table의 총 레코드 수가 random_record 보다 작을 경우 Skip 함
-        if update_row_count < random_record:
+        update_keys = key_index.sample(self.connection, random_record)
+        if update_keys is None:
             return
 
-        update_stmt = random_table.update() \
-                                  .values(dict((column.name, bindparam(column.name))
-                                               for column in performed_columns)) \
-                                  .where(where_column == bindparam(f"b_{where_column.name}"))
+        bind_start_time = time.perf_counter()
 
-        # DBMS 별로 랜덤함수 분리
-        order_by_clause = _get_dbms_rand_function(self.dbms_type)
+        update_stmt = self.statement_cache.get_update(random_table, performed_columns, where_column)
 
-        update_rows_query = self.db_session.query(where_column).statement \
-                                           .with_only_columns([where_column]) \
-                                           .order_by(order_by_clause) \
-                                           .limit(random_record)
+        for row_data, update_key in zip(random_data, update_keys):
+            row_data[f"b_{where_column.name}"] = update_key
 
-        update_rows = self.connection.execute(update_rows_query).fetchall()
+        latency.add_phase_time(BIND, time.perf_counter() - bind_start_time)
 
-        for row_data, update_row in zip(random_data, update_rows):
-            row_data[f"b_{where_column.name}"] = update_row[0]
+        # 대상 Key를 추출한 후 대기하여, 대상 Record가 부족하여 Skip된 DML은 발생 속도에 포함하지 않음
+        if rate_limiter is not None:
+            rate_limiter.wait(random_record)
 
-        return self.connection.execute(update_stmt, random_data)
+        return latency.execute(self.connection.execute, update_stmt, random_data, rows=latency_rows)
 
-    def _run_delete(self, random_table, random_record):
+    def _run_delete(self, random_table, random_record, key_index, latency, latency_rows=None, rate_limiter=None):
         """
         임의의 Record에 대해 Delete 수행
         :param random_table: Delete를 수행할 Table
         :param random_record: Delete를 수행할 Record 수
+        :param key_index: DELETE 대상 Key를 추출할 LiveKeyIndex instance
+        :param latency: 수행 시간을 기록할 LatencyRecorder instance
+        :param latency_rows: LatencyRecorder에 기록할 Record 수 (None일 경우 수행 결과의 rowcount)
+        :param rate_limiter: DML 발생 속도를 제어할 RateLimiter instance
         :return: Delete된 Record Count
         """
 
         where_column = random_table.columns[random_table.columns.keys()[0]]
 
-        # Delete 실행 여부를 결정하기 위해 Count 조회
-        delete_row_count = self.run_select_count(where_column)
-
         # Table의 총 레코드 수가 random_record 보다 작을 경우 Skip 함
-        if delete_row_count < random_record:
+        delete_keys = key_index.sample(self.connection, random_record, remove=True)
+        if delete_keys is None:
             return
 
-        delete_stmt = random_table.delete() \
-                                  .where(where_column == bindparam(f"b_{where_column.name}"))
+        bind_start_time = time.perf_counter()
 
-        # DBMS 별로 랜덤함수 분리
-        order_by_clause = _get_dbms_rand_function(self.dbms_type)
+        delete_stmt = self.statement_cache.get_delete(random_table, where_column)
 
-        delete_rows_query = self.db_session.query(where_column).statement \
-                                           .with_only_columns([where_column]) \
-                                           .order_by(order_by_clause) \
-                                           .limit(random_record)
+        key_data = []
+        for key in delete_keys:
+            key_data.append({f"b_{where_column.name}": key})
 
-        delete_rows = self.connection.execute(delete_rows_query).fetchall()
+        latency.add_phase_time(BIND, time.perf_counter() - bind_start_time)
 
-        key_data = []
-        for key in delete_rows:
-            key_data.append({f"b_{where_column.name}": key[0]})
+        # 대상 Key를 추출한 후 대기하여, 대상 Record가 부족하여 Skip된 DML은 발생 속도에 포함하지 않음
+        if rate_limiter is not None:
+            rate_limiter.wait(random_record)
 
-        return self.connection.execute(delete_stmt, key_data)
+        return latency.execute(self.connection.execute, delete_stmt, key_data, rows=latency_rows)
 
 
 def _sum_record_count(result_dict, table_name, dml, record_count):
@@ -444,52 +630,110 @@ def _sum_record_count(result_dict, table_name, dml, record_count):
     result_dict["detail"][table_name][dml] += record_count
 
 
-def _get_random_data(num_of_record, data_maker, table, column_names, dbms_type):
+def _merge_result(result_dict, session_result):
+    """
+    Session별 처리 결과를 전체 처리 결과에 병합
+    :param result_dict: 전체 작업 처리 결과
+    :param session_result: Session 처리 결과
+    :return: None
+    """
 
-    list_of_row_data = []
-    for i in range(num_of_record):
-        list_of_row_data.append(
-            data_maker.get_sample_table_data(table.name.upper(), column_names, dbms_type=dbms_type)
-        )
+    result_dict["dml_count"] += session_result["dml_count"]
+    result_dict["total_record"] += session_result["total_record"]
+    result_dict["latency"].merge(session_result["latency"])
 
-    return list_of_row_data
+    for table_name, table_result in session_result["detail"].items():
+        if table_name not in result_dict["detail"]:
+            result_dict["detail"][table_name] = {"INSERT": 0, "UPDATE": 0, "DELETE": 0}
+        for dml, record_count in table_result.items():
+            result_dict["detail"][table_name][dml] += record_count
 
+    result_dict["sessions"].append({"session": session_result["session"],
+                                    "dml_count": session_result["dml_count"],
+                                    "total_record": session_result["total_record"],
+                                    "tx_count": session_result["latency"].histograms[COMMIT].count})
 
-def _get_dbms_rand_function(dbms_type):
+
+def _get_rate_result(result_dict, rate_limiter, start_time, end_time):
     """
-    :param dbms_type: DBMS Type 
-    :return: DBMS별 Random 함수
+    목표 발생 속도와 실제 발생 속도를 계산
+    :param result_dict: 작업 처리 결과
+    :param rate_limiter: RateLimiter instance (미사용시 None)
+    :param start_time: 작업 시작시간
+    :param end_time: 작업 종료시간
+    :return: {목표 TPS, 실제 TPS, 목표 초당 Record 수, 실제 초당 Record 수}
     """
-    if dbms_type == ORACLE:
-        return text("dbms_random.value")
-    elif dbms_type == MYSQL:
-        return func.rand()
-    elif dbms_type == SQLSERVER:
-        return func.newid()
-    else:
-        return func.random()
+
+    elapsed_time = end_time - start_time
+
+    return {
+        "target_tps": rate_limiter.tps if rate_limiter is not None else None,
+        "achieved_tps": result_dict["dml_count"] / elapsed_time if elapsed_time > 0 else 0,
+        "target_rows_per_sec": rate_limiter.rows_per_sec if rate_limiter is not None else None,
+        "achieved_rows_per_sec": result_dict["total_record"] / elapsed_time if elapsed_time > 0 else 0
+    }
+
+
+def get_rate_msg(rate_result):
+    """
+    목표/실제 발생 속도를 출력 형식으로 생성
+    :param rate_result: _get_rate_result 결과
+    :return: 출력 메시지
+    """
+
+    def rate_format(rate):
+        return "-" if rate is None else f"{rate:.2f}"
+
+    return f"TPS: {rate_format(rate_result['target_tps'])} / {rate_format(rate_result['achieved_tps'])} | " \
+           f"Rows/Sec: {rate_format(rate_result['target_rows_per_sec'])} / " \
+           f"{rate_format(rate_result['achieved_rows_per_sec'])} (Target / Achieved)"
+
+
+def _get_random_data(num_of_record, data_maker, table, column_names, dbms_type):
+
+    return data_maker.generate_batch(table, column_names, num_of_record, dbms_type=dbms_type)
 
 
 def _complete_tx(tx, rollback):
+    """
+    Transaction을 Commit 또는 Rollback
+    :param tx: Transaction Object
+    :param rollback: Rollback 여부
+    :return: Commit (Rollback) 소요시간 (Sec.)
+    """
+
+    complete_start_time = time.perf_counter()
+
     if rollback is True:
         tx.rollback()
     else:
         tx.commit()
 
+    return time.perf_counter() - complete_start_time
 
-def _make_report():
+
+def _make_report(with_session=False):
 
     detail_tab = texttable.Texttable()
     detail_tab.set_deco(texttable.Texttable.HEADER | texttable.Texttable.VLINES)
 
-    detail_tab.set_cols_align(["r", "l", "l", "l"])
-    detail_tab.header(["#", "Table", "DML", "Record"])
+    if with_session:
+        detail_tab.set_cols_align(["r", "r", "l", "l", "l"])
+        detail_tab.header(["#", "Session", "Table", "DML", "Record"])
+    else:
+        detail_tab.set_cols_align(["r", "l", "l", "l"])
+        detail_tab.header(["#", "Table", "DML", "Record"])
 
     return detail_tab
 
 
-def _draw_report(file, tt, now, rollback):
+def _draw_report(file, tt, now, rollback, rate_result=None, latency_result=None):
 
     file.write(f"{get_start_time_msg(now)}\n")
     file.write(f"\n{tt.draw()}\n\n")
+    if rate_result is not None:
+        file.write(f"  ::: {get_rate_msg(rate_result)} ::: \n")
+    if latency_result is not None:
+        for latency_msg in get_latency_msgs(latency_result, rollback):
+            file.write(f"  ::: {latency_msg} ::: \n")
     file.write(f"  ::: Transaction {'Rollback' if rollback else 'Commit'} ::: \n")
@@ -0,0 +1,162 @@
+from datetime import datetime
+
+import csv
+import json
+import os
+import threading
+import time
+
+
+_report_dir = "reports"
+_sample_file_name = lambda prog, now, file_format: f"{prog}_timeseries_{now:%Y-%m-%d_%H%M%S}.{file_format}"
+
+CSV = "csv"
+JSONL = "jsonl"
+sample_file_formats = [CSV, JSONL]
+
+DEFAULT_SAMPLE_INTERVAL = 1.0
+
+_sample_fields = ["timestamp", "elapsed_sec", "rows_per_sec", "dml_per_sec", "commits_per_sec", "in_flight_rows",
+                  "total_rows", "total_dml", "total_commits"]
+
+
+class ThroughputSampler:
+    """
+    작업 수행 중 일정 간격으로 처리량 (초당 Record 수, 초당 DML 수, 초당 Commit 수, Commit되지 않은 Record 수)을
+    별도 Thread에서 측정하여 reports 디렉토리에 CSV 또는 JSON Lines 형식으로 기록.
+    측정 대상 (source)은 snapshot() 으로 누적 처리량 {rows, dml, commits, in_flight_rows}을 반환하는 instance
+    (LatencyRecorder 등)이며, 여러 source를 등록할 경우 합계를 기록함
+    """
+
+    def __init__(self, prog, now, interval=DEFAULT_SAMPLE_INTERVAL, file_format=CSV):
+        """
+        :param prog: 프로그램 이름 (cdcbench, ranbench)
+        :param now: 작업 시작시간 (datetime, 파일명에 사용)
+        :param interval: 측정 간격 (Sec.)
+        :param file_format: 파일 형식 (csv, jsonl)
+        """
+
+        self.interval = interval
+        self.file_format = file_format
+
+        if not os.path.exists(_report_dir):
+            os.makedirs(_report_dir)
+
+        self.file_path = os.path.join(_report_dir, _sample_file_name(prog, now, file_format))
+
+        self._sources = []
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._file = None
+        self._writer = None
+
+        self._start_time = None
+        self._last_time = None
+        self._last_snapshot = None
+
+    def add_source(self, source):
+        """
+        측정 대상을 등록 (작업 수행 중에도 등록 가능)
+        :param source: snapshot() 메소드를 가진 instance
+        """
+
+        with self._lock:
+            self._sources.append(source)
+
+    def start(self):
+        """
+        측정 Thread를 시작
+        """
+
+        self._file = open(self.file_path, "w", encoding="utf-8", newline="")
+
+        if self.file_format == CSV:
+            self._writer = csv.DictWriter(self._file, fieldnames=_sample_fields)
+            self._writer.writeheader()
+            self._file.flush()
+
+        self._start_time = self._last_time = time.perf_counter()
+        self._last_snapshot = self._get_snapshot()
+
+        self._thread = threading.Thread(target=self._run, name="ThroughputSampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        측정 Thread를 중지하고 마지막 측정 이후의 처리량을 기록
+        """
+
+        if self._thread is None:
+            return
+
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+        try:
+            self._sample()
+        finally:
+            self._file.close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def _run(self):
+
+        # wait의 timeout을 간격으로 사용하므로 stop 호출시 즉시 종료됨
+        while not self._stop_event.wait(self.interval):
+            self._sample()
+
+    def _get_snapshot(self):
+
+        with self._lock:
+            sources = list(self._sources)
+
+        total_snapshot = {"rows": 0, "dml": 0, "commits": 0, "in_flight_rows": 0}
+
+        for source in sources:
+            for key, value in source.snapshot().items():
+                total_snapshot[key] += value
+
+        return total_snapshot
+
+    def _sample(self):
+        """
+        이전 측정 이후의 처리량을 계산하여 파일에 기록
+        """
+
+        current_time = time.perf_counter()
+        snapshot = self._get_snapshot()
+
+        elapsed_time = current_time - self._last_time
+
+        def per_sec(key):
+            return round((snapshot[key] - self._last_snapshot[key]) / elapsed_time, 2) if elapsed_time > 0 else 0
+
+        sample = {
+            "timestamp": f"{datetime.now():%Y-%m-%d %H:%M:%S.%f}"[:-3],
+            "elapsed_sec": round(current_time - self._start_time, 3),
+            "rows_per_sec": per_sec("rows"),
+            "dml_per_sec": per_sec("dml"),
+            "commits_per_sec": per_sec("commits"),
+            "in_flight_rows": snapshot["in_flight_rows"],
+            "total_rows": snapshot["rows"],
+            "total_dml": snapshot["dml"],
+            "total_commits": snapshot["commits"]
+        }
+
+        if self.file_format == CSV:
+            self._writer.writerow(sample)
+        else:
+            self._file.write(json.dumps(sample) + "\n")
+
+        # 작업 수행 중에도 다른 도구에서 읽을 수 있도록 매 측정마다 flush
+        self._file.flush()
+
+        self._last_time = current_time
+        self._last_snapshot = snapshot
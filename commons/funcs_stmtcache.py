@@ -0,0 +1,114 @@
+from sqlalchemy.sql.expression import bindparam
+from sqlalchemy.util import LRUCache
+
+import threading
+
+
+# compiled_cache에 보관할 최대 컴파일 결과 수 (매번 새로 생성되는 조회 SQL 등으로 무한히 증가하지 않도록 제한)
+_COMPILED_CACHE_SIZE = 500
+
+
+class StatementCache:
+    """
+    (Table, Column 구성, DML 유형)별로 Statement를 한 번만 생성하여 작업 수행 중 재사용.
+    connect()로 생성한 Connection은 SQLAlchemy의 compiled_cache를 사용하므로, 재사용되는 Statement는
+    Parameter 구성별로 한 번만 컴파일됨. 여러 Session (Thread)이 하나의 instance를 공유할 수 있음
+    """
+
+    def __init__(self):
+
+        self.compiled_cache = LRUCache(_COMPILED_CACHE_SIZE)
+
+        self._statements = {}
+        self._lock = threading.Lock()
+
+    def connect(self, engine):
+        """
+        compiled_cache를 사용하는 Connection 생성
+        :param engine: engine Object
+        :return: Connection
+        """
+
+        return engine.execution_options(compiled_cache=self.compiled_cache).connect()
+
+    def get(self, key, build):
+        """
+        key에 해당하는 Statement를 반환하며, 없을 경우 build로 생성하여 저장
+        :param key: Statement 구분 값 (Table, DML 유형 등으로 구성된 tuple)
+        :param build: Statement를 생성하는 함수
+        :return: Statement
+        """
+
+        statement = self._statements.get(key)
+
+        if statement is None:
+            with self._lock:
+                statement = self._statements.get(key)
+                if statement is None:
+                    statement = self._statements[key] = build()
+
+        return statement
+
+    def get_columns(self, table):
+        """
+        :param table: Table Object
+        :return: DML 대상 Column (Default 값이 없는 Column) List
+        """
+
+        return self.get((table, "COLUMNS"), lambda: [column for column in table.columns if column.default is None])
+
+    def get_insert(self, table):
+        """
+        :param table: Table Object
+        :return: Insert 문
+        """
+
+        return self.get((table, "INSERT"), table.insert)
+
+    def get_update(self, table, columns, key_column, key_range=False):
+        """
+        :param table: Table Object
+        :param columns: Update할 Column List (각 Column 이름의 bindparam으로 값을 지정)
+        :param key_column: Update 기준 Key Column
+        :param key_range: True일 경우 Key 범위 (b_start_key ~ b_end_key), False일 경우 Key 값 (b_<Key Column>) 조건
+        :return: Update 문
+        """
+
+        def build():
+            return table.update() \
+                        .values(dict((column.name, bindparam(column.name)) for column in columns)) \
+                        .where(_get_key_clause(key_column, key_range))
+
+        return self.get((table, "UPDATE", tuple(column.name for column in columns), key_column.name, key_range),
+                        build)
+
+    def get_delete(self, table, key_column, key_range=False):
+        """
+        :param table: Table Object
+        :param key_column: Delete 기준 Key Column
+        :param key_range: True일 경우 Key 범위 (b_start_key ~ b_end_key), False일 경우 Key 값 (b_<Key Column>) 조건
+        :return: Delete 문
+        """
+
+        return self.get((table, "DELETE", key_column.name, key_range),
+                        lambda: table.delete().where(_get_key_clause(key_column, key_range)))
+
+    def get_compiled(self, statement, dialect, column_keys):
+        """
+        DBAPI Cursor로 직접 수행할 Statement의 컴파일 결과 (executemany 형식)
+        :param statement: get_insert 등으로 생성한 Statement
+        :param dialect: Dialect
+        :param column_keys: Parameter로 지정할 Column 이름 List
+        :return: Compiled Object
+        """
+
+        return self.get((statement, dialect, tuple(column_keys), "COMPILED"),
+                        lambda: statement.compile(dialect=dialect, column_keys=column_keys, inline=True))
+
+
+def _get_key_clause(key_column, key_range):
+
+    if key_range:
+        return key_column.between(bindparam("b_start_key"), bindparam("b_end_key"))
+    else:
+        return key_column == bindparam(f"b_{key_column.name}")
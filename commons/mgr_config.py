@@ -39,6 +39,13 @@ class ConfigManager:
             self.sql_log_level = logging.WARNING
             self.sql_logging = self.config.get("SETTING", "SQL_LOGGING")
             self.nls_lang = self.config.get("SETTING", "NLS_LANG")
+            self.lob_cache_size = self.config.get("SETTING", "LOB_CACHE_SIZE", fallback="")
+            self.lob_cache_mmap = self.config.get("SETTING", "LOB_CACHE_MMAP", fallback="")
+            self.pool_size = self.config.get("SETTING", "POOL_SIZE", fallback="")
+            self.max_overflow = self.config.get("SETTING", "MAX_OVERFLOW", fallback="")
+            self.pool_pre_ping = self.config.get("SETTING", "POOL_PRE_PING", fallback="")
+            self.pool_recycle = self.config.get("SETTING", "POOL_RECYCLE", fallback="")
+            self.pool_warmup = self.config.get("SETTING", "POOL_WARMUP", fallback="")
 
             self.source_dbms_type = self.config.get("SOURCE_DATABASE", "DBMS_TYPE")
             self.source_host_name = self.config.get("SOURCE_DATABASE", "HOST_NAME")
@@ -145,6 +152,112 @@ class ConfigManager:
             self._nls_lang = DEFAULT_NLS_LANG
         os.putenv("NLS_LANG", self.nls_lang)
 
+    @property
+    def lob_cache_size(self):
+        return self._lob_cache_size
+
+    # lob_cache_size 유효성 검사
+    @lob_cache_size.setter
+    def lob_cache_size(self, lob_cache_size):
+        if lob_cache_size != "":
+            if lob_cache_size.isdecimal():
+                self._lob_cache_size = int(lob_cache_size)
+            else:
+                print_error_msg(get_value_invalid_msg("lob_cache_size", lob_cache_size))
+        else:
+            self._lob_cache_size = DEFAULT_LOB_CACHE_SIZE
+
+    @property
+    def lob_cache_mmap(self):
+        return self._lob_cache_mmap
+
+    # lob_cache_mmap 유효성 검사
+    @lob_cache_mmap.setter
+    def lob_cache_mmap(self, lob_cache_mmap):
+        if lob_cache_mmap != "":
+            if lob_cache_mmap.upper() in ["Y", "N"]:
+                self._lob_cache_mmap = lob_cache_mmap.upper() == "Y"
+            else:
+                print_error_msg(get_value_invalid_msg("lob_cache_mmap", lob_cache_mmap))
+        else:
+            self._lob_cache_mmap = False
+
+    @property
+    def pool_size(self):
+        return self._pool_size
+
+    # pool_size 유효성 검사
+    @pool_size.setter
+    def pool_size(self, pool_size):
+        if pool_size != "":
+            if pool_size.isdecimal() and int(pool_size) >= 1:
+                self._pool_size = int(pool_size)
+            else:
+                print_error_msg(get_value_invalid_msg("pool_size", pool_size))
+        else:
+            self._pool_size = DEFAULT_POOL_SIZE
+
+    @property
+    def max_overflow(self):
+        return self._max_overflow
+
+    # max_overflow 유효성 검사
+    @max_overflow.setter
+    def max_overflow(self, max_overflow):
+        if max_overflow != "":
+            if max_overflow.isdecimal():
+                self._max_overflow = int(max_overflow)
+            else:
+                print_error_msg(get_value_invalid_msg("max_overflow", max_overflow))
+        else:
+            self._max_overflow = DEFAULT_MAX_OVERFLOW
+
+    @property
+    def pool_pre_ping(self):
+        return self._pool_pre_ping
+
+    # pool_pre_ping 유효성 검사
+    @pool_pre_ping.setter
+    def pool_pre_ping(self, pool_pre_ping):
+        if pool_pre_ping != "":
+            if pool_pre_ping.upper() in ["Y", "N"]:
+                self._pool_pre_ping = pool_pre_ping.upper() == "Y"
+            else:
+                print_error_msg(get_value_invalid_msg("pool_pre_ping", pool_pre_ping))
+        else:
+            self._pool_pre_ping = False
+
+    @property
+    def pool_recycle(self):
+        return self._pool_recycle
+
+    # pool_recycle 유효성 검사
+    @pool_recycle.setter
+    def pool_recycle(self, pool_recycle):
+        if pool_recycle != "":
+            if pool_recycle.isdecimal() and int(pool_recycle) >= 1:
+                self._pool_recycle = int(pool_recycle)
+            else:
+                print_error_msg(get_value_invalid_msg("pool_recycle", pool_recycle))
+        else:
+            self._pool_recycle = DEFAULT_POOL_RECYCLE
+
+    @property
+    def pool_warmup(self):
+        return self._pool_warmup
+
+    # pool_warmup 유효성 검사 (Pool에 유지되는 Connection 수인 pool_size를 넘을 수 없음)
+    @pool_warmup.setter
+    def pool_warmup(self, pool_warmup):
+        if pool_warmup != "":
+            if pool_warmup.isdecimal() and int(pool_warmup) <= self.pool_size:
+                self._pool_warmup = int(pool_warmup)
+            else:
+                print_error_msg(get_value_invalid_msg("pool_warmup", pool_warmup) +
+                                f"\n  * Note. POOL_WARMUP must be between 0 and POOL_SIZE ({self.pool_size}).")
+        else:
+            self._pool_warmup = 0
+
     @property
     def source_dbms_type(self):
         return self._source_dbms_type
@@ -297,7 +410,8 @@ class ConfigManager:
             "db_name": self.source_db_name,
             "schema_name": self.source_schema_name,
             "user_name": self.source_user_name,
-            "user_password": self.source_user_password
+            "user_password": self.source_user_password,
+            **self.get_pool_info()
         }
 
     def get_trg_conn_info(self):
@@ -308,7 +422,17 @@ class ConfigManager:
             "db_name": self.target_db_name,
             "schema_name": self.target_schema_name,
             "user_name": self.target_user_name,
-            "user_password": self.target_user_password
+            "user_password": self.target_user_password,
+            **self.get_pool_info()
+        }
+
+    def get_pool_info(self):
+        return {
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_pre_ping": self.pool_pre_ping,
+            "pool_recycle": self.pool_recycle,
+            "pool_warmup": self.pool_warmup
         }
 
     def get_init_data_info(self):
@@ -325,7 +449,14 @@ class ConfigManager:
             "setting": {
                 "log_level": logging.getLevelName(self.log_level),
                 "sql_logging": self.sql_logging,
-                "nls_lang": self.nls_lang
+                "nls_lang": self.nls_lang,
+                "lob_cache_size": f"{self.lob_cache_size} MB",
+                "lob_cache_mmap": "Y" if self.lob_cache_mmap else "N",
+                "pool_size": self.pool_size,
+                "max_overflow": self.max_overflow,
+                "pool_pre_ping": "Y" if self.pool_pre_ping else "N",
+                "pool_recycle": f"{self.pool_recycle} sec." if self.pool_recycle != DEFAULT_POOL_RECYCLE else "-",
+                "pool_warmup": self.pool_warmup
             },
             "source_database": {
                 "dbms_type": _get_dbms_alias(self.source_dbms_type),
@@ -1,11 +1,14 @@
-from commons.constants import ORACLE, MYSQL, SQLSERVER, POSTGRESQL, CUBRID, TIBERO, sa_unsupported_dbms
-from commons.funcs_common import print_error_msg
+from commons.constants import ORACLE, MYSQL, SQLSERVER, POSTGRESQL, CUBRID, TIBERO, sa_unsupported_dbms, \
+                              DEFAULT_POOL_SIZE, DEFAULT_MAX_OVERFLOW, DEFAULT_POOL_RECYCLE
+from commons.funcs_common import print_error_msg, exec_database_error
+from commons.mgr_jdbc import JdbcSessionManager
 from commons.mgr_logger import LoggerManager
 
 from sqlalchemy import create_engine
+from sqlalchemy.exc import DatabaseError
 from sqlalchemy.orm import scoped_session, sessionmaker
 
-import os
+import time
 
 
 class ConnectionManager:
@@ -31,6 +34,7 @@ class ConnectionManager:
             TIBERO: "com.tmax.tibero.jdbc.TbDriver"
         }
 
+        self.conn_info = conn_info
         self.dbms_type = conn_info["dbms_type"]
         self.driver = dialect_driver[conn_info["dbms_type"]]
         self.host_name = conn_info["host_name"]
@@ -40,10 +44,25 @@ class ConnectionManager:
         self.user_password = conn_info["user_password"]
         self.schema_name = conn_info["schema_name"]
 
+        # Connection Pool 설정 (Config 파일의 [SETTING] 값. 지정되지 않은 경우 SQLAlchemy 기본값)
+        self.pool_size = conn_info.get("pool_size", DEFAULT_POOL_SIZE)
+        self.max_overflow = conn_info.get("max_overflow", DEFAULT_MAX_OVERFLOW)
+        self.pool_pre_ping = conn_info.get("pool_pre_ping", False)
+        self.pool_recycle = conn_info.get("pool_recycle", DEFAULT_POOL_RECYCLE)
+        self.pool_warmup = conn_info.get("pool_warmup", 0)
+
         if conn_info["dbms_type"] in sa_unsupported_dbms:
             self.engine = None
             self.db_session = None
 
+            urls = {
+                CUBRID: f"jdbc:CUBRID:{self.host_name}:{self.port}:{self.db_name}:public::?charSet=utf-8",
+                TIBERO: f"jdbc:tibero:thin:@{self.host_name}:{self.port}:{self.db_name}"
+            }
+
+            self.jdbc_session = JdbcSessionManager(self.driver, urls[self.dbms_type], self.user_name,
+                                                   self.user_password)
+
         else:
             if conn_info["dbms_type"] == ORACLE:
                 import cx_Oracle
@@ -62,48 +81,52 @@ class ConnectionManager:
             self.logger.debug(f"Connection String: {conn_string}")
 
             self.logger.info("Create Engine")
-            self.engine = create_engine(conn_string, convert_unicode=True, max_identifier_length=128)
+            self.logger.debug(f"Connection Pool: pool_size={self.pool_size}, max_overflow={self.max_overflow}, "
+                              f"pool_pre_ping={self.pool_pre_ping}, pool_recycle={self.pool_recycle}")
+            self.engine = create_engine(conn_string, convert_unicode=True, max_identifier_length=128,
+                                        pool_size=self.pool_size, max_overflow=self.max_overflow,
+                                        pool_pre_ping=self.pool_pre_ping, pool_recycle=self.pool_recycle)
 
             self.logger.info("Create DB Session")
             self.db_session = scoped_session(sessionmaker(autocommit=False, bind=self.engine))
 
         self.logger.debug("END Call ConnectionManager Class")
 
-    def sa_unsupported_get_connection(self):
+    def warm_up(self, count=None):
         """
-        SQLAlchemy 미지원 DBMS에서 connection을 맺을 때 사용
-        :return: dbms별 connection
+        Connection Pool에 Connection을 미리 생성하여, 작업 수행시간에 최초 Connection 생성 시간이 포함되지 않도록 함
+        (작업 수행시간 측정 전에 호출하며, SQLAlchemy 미지원 DBMS의 경우 수행하지 않음)
+        :param count: 미리 생성할 Connection 수 (None일 경우 Config 파일의 POOL_WARMUP 값)
         """
 
-        import jaydebeapi
-        import jpype
+        if count is None:
+            count = self.pool_warmup
 
-        jar_file_name = {
-            CUBRID: "JDBC-10.2-latest-cubrid.jar",
-            TIBERO: "tibero6-jdbc.jar"
-        }
+        if self.engine is None or count <= 0:
+            return
 
-        urls = {
-            CUBRID: f"jdbc:CUBRID:{self.host_name}:{self.port}:{self.db_name}:public::?charSet=utf-8",
-            TIBERO: f"jdbc:tibero:thin:@{self.host_name}:{self.port}:{self.db_name}"
-        }
+        start_time = time.perf_counter()
+        connections = []
 
         try:
-            self.logger.debug(
-                f"driver={self.driver},"
-                f"url={urls[self.dbms_type]}, "
-                f"user={[self.user_name, self.user_password]}, "
-                f"jar={os.path.join('commons', 'driver', self.dbms_type.lower(), jar_file_name[self.dbms_type])}"
-            )
-
-            return jaydebeapi.connect(
-                self.driver,
-                urls[self.dbms_type],
-                [self.user_name, self.user_password],
-                os.path.join("commons", "driver", self.dbms_type.lower(), jar_file_name[self.dbms_type])
-            )
-
-        except jpype.JVMNotFoundException as jvm_nfe:
-            print_error_msg(jvm_nfe.args[1])
-        except jpype.JException as java_err:
-            print_error_msg(java_err.args[0])
+            # 동시에 Checkout 하여 서로 다른 Connection을 생성한 후 반환 (pool_size 이내의 Connection은 Pool에 유지됨)
+            for _ in range(count):
+                connections.append(self.engine.connect())
+
+        except DatabaseError as dberr:
+            exec_database_error(self.logger, self.log_level, dberr, fail_print=False)
+
+        finally:
+            for connection in connections:
+                connection.close()
+
+        self.logger.info(f"Warm up connection pool: {count} connections ({time.perf_counter() - start_time:.3f} sec.)")
+
+    def sa_unsupported_get_connection(self):
+        """
+        SQLAlchemy 미지원 DBMS에서 connection을 맺을 때 사용.
+        최초 호출시 Connection을 맺고 (JVM 시작 포함), 이후 호출에서는 같은 Connection을 재사용함
+        :return: dbms별 connection
+        """
+
+        return self.jdbc_session.get_connection()
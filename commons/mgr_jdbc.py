@@ -0,0 +1,95 @@
+from commons.constants import CUBRID, TIBERO
+from commons.funcs_common import print_error_msg
+from commons.mgr_logger import LoggerManager
+
+import atexit
+import os
+import threading
+
+
+_driver_dir = os.path.join("commons", "driver")
+
+_jar_file_name = {
+    CUBRID: "JDBC-10.2-latest-cubrid.jar",
+    TIBERO: "tibero6-jdbc.jar"
+}
+
+
+class JdbcSessionManager:
+    """
+    SQLAlchemy 미지원 DBMS (CUBRID, Tibero)의 JDBC Connection을 관리.
+    JVM은 process에서 처음 Connection을 맺을 때 모든 JDBC Driver를 Classpath에 포함하여 한 번만 시작되며,
+    Connection은 한 번 맺은 후 close 할 때까지 재사용함 (process 종료시 자동으로 close)
+    """
+
+    # JVM 시작 (최초 Connection) 을 직렬화
+    _jvm_lock = threading.Lock()
+
+    def __init__(self, driver, url, user_name, user_password):
+        """
+        :param driver: JDBC Driver Class 이름
+        :param url: JDBC URL
+        :param user_name: 접속 User
+        :param user_password: 접속 User Password
+        """
+
+        self.logger = LoggerManager.get_logger(__name__)
+
+        self.driver = driver
+        self.url = url
+        self.user_name = user_name
+        self.user_password = user_password
+
+        self._connection = None
+
+    def get_connection(self):
+        """
+        :return: 재사용 가능한 JDBC Connection (최초 호출시 생성)
+        """
+
+        if self._connection is None:
+            self._connection = self._connect()
+            atexit.register(self.close)
+
+        return self._connection
+
+    def close(self):
+        """
+        Connection을 종료 (이후 get_connection 호출시 새로 생성)
+        """
+
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            atexit.unregister(self.close)
+            connection.close()
+            self.logger.debug(f"Close JDBC connection ({self.url})")
+
+    def _connect(self):
+
+        import jaydebeapi
+        import jpype
+
+        # JVM은 시작된 후 Classpath를 변경할 수 없으므로 CUBRID, Tibero Driver를 모두 포함
+        jars = [os.path.join(_driver_dir, dbms_type.lower(), jar_file_name)
+                for dbms_type, jar_file_name in _jar_file_name.items()]
+
+        try:
+            self.logger.debug(
+                f"driver={self.driver},"
+                f"url={self.url}, "
+                f"user={[self.user_name, self.user_password]}, "
+                f"jar={jars}"
+            )
+
+            with self._jvm_lock:
+                jvm_started = jpype.isJVMStarted()
+                connection = jaydebeapi.connect(self.driver, self.url, [self.user_name, self.user_password], jars)
+
+            self.logger.info(f"Open JDBC connection ({self.url}){'' if jvm_started else ' with JVM startup'}")
+
+            return connection
+
+        except jpype.JVMNotFoundException as jvm_nfe:
+            print_error_msg(jvm_nfe.args[1])
+        except jpype.JException as java_err:
+            print_error_msg(java_err.args[0])
@@ -9,6 +9,10 @@ class LoggerManager:
     _sql_log_level = None
     _pool_log_level = None
 
+    @classmethod
+    def set_logs_dir(cls, logs_dir):
+        cls._logs_dir = logs_dir
+
     @classmethod
     def set_log_level(cls, log_level):
         cls._log_level = log_level
@@ -39,7 +43,7 @@ class LoggerManager:
         _log_file_name = "cdcbench.log"
 
         if not os.path.isdir(cls._logs_dir):
-            os.mkdir(cls._logs_dir)
+            os.makedirs(cls._logs_dir)
 
         formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
 
@@ -0,0 +1,143 @@
+import logging
+import os
+import sys
+import tempfile
+import unittest
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+
+from commons.funcs_bulkload import BulkLoader, PostgresqlBulkLoader, _DbapiBulkLoader, _get_copy_csv_value
+from commons.mgr_logger import LoggerManager
+
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from sqlalchemy import create_engine, Column, Integer, LargeBinary, MetaData, String, Table
+from sqlalchemy.types import TypeDecorator
+
+
+class _UpperString(TypeDecorator):
+    """
+    Bind Processor 적용 여부를 확인하기 위해 값을 대문자로 변환하여 저장
+    """
+
+    impl = String
+
+    def process_bind_param(self, value, dialect):
+        return value.upper() if value is not None else None
+
+
+class CopyCsvValueTest(unittest.TestCase):
+    """
+    PostgreSQL COPY (FORMAT csv) 입력 값 변환 확인
+    """
+
+    def test_null_and_empty_string(self):
+        # NULL은 따옴표 없는 빈 값, 빈 문자열은 따옴표로 감싼 빈 값
+        self.assertEqual(_get_copy_csv_value(None), "")
+        self.assertEqual(_get_copy_csv_value(""), "\"\"")
+
+    def test_string(self):
+        self.assertEqual(_get_copy_csv_value("a,\"b\"\nc"), "\"a,\"\"b\"\"\nc\"")
+
+    def test_bytea_hex(self):
+        self.assertEqual(_get_copy_csv_value(b"\x00\xff"), "\"\\x00ff\"")
+        self.assertEqual(_get_copy_csv_value(memoryview(b"\x01\x02")), "\"\\x0102\"")
+        self.assertEqual(_get_copy_csv_value(b""), "\"\\x\"")
+
+    def test_timedelta(self):
+        self.assertEqual(_get_copy_csv_value(timedelta(days=1, seconds=3661, microseconds=5)),
+                         "\"1 days 3661 seconds 5 microseconds\"")
+        self.assertEqual(_get_copy_csv_value(timedelta(hours=-1)), "\"-1 days 82800 seconds 0 microseconds\"")
+
+    def test_float(self):
+        self.assertEqual(_get_copy_csv_value(1.5), "1.5")
+        self.assertEqual(_get_copy_csv_value(float("nan")), "NaN")
+        self.assertEqual(_get_copy_csv_value(float("inf")), "Infinity")
+        self.assertEqual(_get_copy_csv_value(float("-inf")), "-Infinity")
+
+    def test_other_types(self):
+        self.assertEqual(_get_copy_csv_value(True), "t")
+        self.assertEqual(_get_copy_csv_value(Decimal("1.10")), "\"1.10\"")
+        self.assertEqual(_get_copy_csv_value(date(2020, 1, 2)), "\"2020-01-02\"")
+        self.assertEqual(_get_copy_csv_value(datetime(2020, 1, 2, 3, 4, 5)), "\"2020-01-02T03:04:05\"")
+
+
+class _CopyCursor:
+    """
+    copy_expert로 전달된 COPY 입력을 보관
+    """
+
+    def __init__(self):
+        self.statement = None
+        self.copy_input = None
+
+    def copy_expert(self, statement, copy_buffer):
+        self.statement = statement
+        self.copy_input = copy_buffer.read()
+
+
+class DbapiBulkLoaderTest(unittest.TestCase):
+    """
+    SQLite in-memory DB로 DBAPI Cursor를 직접 사용하는 Bulk Loader의 Insert 결과를 확인
+    """
+
+    def setUp(self):
+
+        # Log 파일은 작업 위치 기준의 logs 디렉토리에 생성되므로 임시 디렉토리에서 수행
+        self._cwd = os.getcwd()
+        self._temp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self._temp_dir.name)
+
+        LoggerManager.set_log_level(logging.ERROR)
+        LoggerManager.set_sql_log_level(logging.ERROR)
+
+        self.engine = create_engine("sqlite://")
+        self.table = Table("bulk_test", MetaData(),
+                           Column("t_id", Integer, primary_key=True),
+                           Column("col_name", _UpperString(50)),
+                           Column("col_binary", LargeBinary))
+        self.table.create(self.engine)
+        self.connection = self.engine.connect()
+
+        self.rows = [{"t_id": 1, "col_name": "a", "col_binary": b"\x00"},
+                     {"t_id": 2, "col_name": None, "col_binary": None}]
+
+    def tearDown(self):
+
+        self.connection.close()
+        self.engine.dispose()
+        os.chdir(self._cwd)
+        self._temp_dir.cleanup()
+
+    def _select_all(self):
+        return [tuple(row) for row in self.connection.execute(self.table.select().order_by(self.table.c.t_id))]
+
+    def test_load(self):
+
+        # Bind Processor를 적용하여 SQLAlchemy executemany와 동일한 결과로 Insert
+        _DbapiBulkLoader().load(self.connection, self.table, self.rows)
+        dbapi_result = self._select_all()
+
+        self.connection.execute(self.table.delete())
+        BulkLoader().load(self.connection, self.table, self.rows)
+
+        self.assertEqual(dbapi_result, [(1, "A", b"\x00"), (2, None, None)])
+        self.assertEqual(dbapi_result, self._select_all())
+
+    def test_load_empty(self):
+        _DbapiBulkLoader().load(self.connection, self.table, [])
+        self.assertEqual(self._select_all(), [])
+
+    def test_copy_input(self):
+
+        cursor = _CopyCursor()
+        loader = PostgresqlBulkLoader()
+        statement, params = loader._prepare(self.connection, self.table, list(self.rows[0].keys()), self.rows)
+        loader._execute(cursor, statement, params, self.table, None, self.connection.dialect)
+
+        self.assertEqual(cursor.statement,
+                         "COPY bulk_test (t_id, col_name, col_binary) FROM STDIN WITH (FORMAT csv)")
+        self.assertEqual(cursor.copy_input, "\"1\",\"A\",\"\\x00\"\n\"2\",,\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+import sys
+import tempfile
+import unittest
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+
+from commons.funcs_datamaker import LobFileCache
+
+
+class LobFileCacheTest(unittest.TestCase):
+    """
+    LOB File Cache의 크기 제한과 mmap 사용 방식을 확인
+    """
+
+    def setUp(self):
+
+        self._temp_dir = tempfile.TemporaryDirectory()
+
+        self.small_text = self._write("small.txt", "a" * 10)
+        self.large_text = self._write("large.txt", "b" * 100)
+        self.large_binary = self._write("large.bin", b"\x00\x01" * 50)
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def _write(self, file_name, content):
+
+        file_path = os.path.join(self._temp_dir.name, file_name)
+
+        with open(file_path, "wb") as f:
+            f.write(content.encode("utf-8") if isinstance(content, str) else content)
+
+        return file_path
+
+    def test_cache_size_limit(self):
+
+        lob_cache = LobFileCache(50, use_mmap=True)
+
+        self.assertEqual(lob_cache.get(self.small_text, True), "a" * 10)
+        self.assertEqual(lob_cache._total_bytes, 10)
+
+        # Cache 크기를 초과하는 text File은 mmap 사용시에도 보관하지 않음
+        self.assertEqual(lob_cache.get(self.large_text, True), "b" * 100)
+        self.assertEqual(lob_cache._total_bytes, 10)
+        self.assertNotIn(self.large_text, lob_cache._mapped_contents)
+
+        lob_cache.clear()
+
+    def test_mapped_binary(self):
+
+        lob_cache = LobFileCache(50, use_mmap=True)
+
+        # memoryview를 bind 할 수 없는 DBMS에는 bytes로 반환
+        content = lob_cache.get(self.large_binary, False)
+        self.assertIsInstance(content, bytes)
+        self.assertEqual(content, b"\x00\x01" * 50)
+
+        content = lob_cache.get(self.large_binary, False, share_buffer=True)
+        self.assertIsInstance(content, memoryview)
+        self.assertEqual(content.tobytes(), b"\x00\x01" * 50)
+
+        lob_cache.clear()
+
+
+if __name__ == "__main__":
+    unittest.main()
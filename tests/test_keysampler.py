@@ -0,0 +1,202 @@
+import os
+import sys
+import tempfile
+import unittest
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+
+from commons.funcs_keysampler import KeyRegistry, KeySampler, LiveKeyIndex
+
+from sqlalchemy import create_engine, Column, Integer, MetaData, Table
+
+
+class LiveKeyIndexTest(unittest.TestCase):
+    """
+    SQLite in-memory DB로 LiveKeyIndex와 Key Registry의 동기화를 확인
+    """
+
+    def setUp(self):
+
+        # Key Registry는 작업 위치 기준의 cache/keys 디렉토리에 저장되므로 임시 디렉토리에서 수행
+        self._cwd = os.getcwd()
+        self._temp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self._temp_dir.name)
+
+        self.engine = create_engine("sqlite://")
+        self.table = Table("key_test", MetaData(), Column("t_id", Integer, primary_key=True))
+        self.table.create(self.engine)
+        self.connection = self.engine.connect()
+
+    def tearDown(self):
+
+        self.connection.close()
+        self.engine.dispose()
+        os.chdir(self._cwd)
+        self._temp_dir.cleanup()
+
+    def _insert(self, start, end):
+        self.connection.execute(self.table.insert(), [{"t_id": key} for key in range(start, end + 1)])
+
+    def _new_index(self):
+        return LiveKeyIndex(self.table.c.t_id, KeyRegistry("test.conf", self.table.name))
+
+    def test_insert_after_registry_save(self):
+
+        self._insert(1, 10)
+
+        key_index = self._new_index()
+        self.assertEqual(key_index.get_range_keys(self.connection, 1, 100), list(range(1, 11)))
+
+        # 저장 이후 Insert된 Key는 저장된 Key 목록을 불러올 때 함께 조회되어야 함
+        self._insert(11, 15)
+
+        key_index = self._new_index()
+        self.assertEqual(key_index.get_range_keys(self.connection, 1, 100), list(range(1, 16)))
+        self.assertEqual(key_index.get_range_keys(self.connection, 9, 12), [9, 10, 11, 12])
+
+    def test_save_inserted_keys(self):
+
+        self._insert(1, 10)
+
+        key_index = self._new_index()
+        key_index.get_range_keys(self.connection, 1, 100)
+
+        # Insert 이후 저장된 최대 Key보다 큰 Key만 Key Registry에 추가
+        self._insert(11, 15)
+        self._new_index().save_inserted_keys(self.connection)
+
+        key_registry = KeyRegistry("test.conf", self.table.name)
+        self.assertEqual(key_registry.get_max_key(), 15)
+        self.assertEqual(key_registry.load(), list(range(1, 16)))
+
+    def test_save_inserted_keys_without_registry(self):
+
+        self._insert(1, 10)
+
+        # 저장된 Key 목록이 없으면 Table의 전체 Key로 Key Registry를 생성
+        self._new_index().save_inserted_keys(self.connection)
+        self.assertEqual(KeyRegistry("test.conf", self.table.name).load(), list(range(1, 11)))
+
+    def test_range_keys_from_registry(self):
+
+        self._insert(1, 10)
+        self._insert(20, 30)
+
+        # Key Registry를 사용할 경우 Index에 전체 Key를 불러오지 않고 저장된 파일에서 범위만 조회
+        key_index = self._new_index()
+        self.assertEqual(key_index.get_range_keys(self.connection, 8, 22), [8, 9, 10, 20, 21, 22])
+        self.assertEqual(key_index.get_range_keys(self.connection, 11, 19), [])
+        self.assertEqual(key_index.get_range_keys(self.connection, 28, 100), [28, 29, 30])
+        self.assertFalse(key_index.loaded)
+
+    def test_remove_range_keys(self):
+
+        self._insert(1, 10)
+
+        key_index = self._new_index()
+        key_index.save_registry(self.connection)
+
+        # 삭제한 범위의 Key만 Key Registry에서 제거
+        key_index.remove_range_keys(3, 5)
+        self.assertEqual(KeyRegistry("test.conf", self.table.name).load(), [1, 2, 6, 7, 8, 9, 10])
+        key_index.remove_range_keys(9, 100)
+        self.assertEqual(KeyRegistry("test.conf", self.table.name).load(), [1, 2, 6, 7, 8])
+
+    def test_registry_ignored_when_table_recreated(self):
+
+        self._insert(1, 10)
+
+        key_index = self._new_index()
+        key_index.get_range_keys(self.connection, 1, 100)
+
+        # Table의 최대 Key가 저장된 최대 Key보다 작으면 저장된 Key 목록을 사용하지 않음
+        self.connection.execute(self.table.delete())
+        self._insert(1, 5)
+
+        key_index = self._new_index()
+        self.assertEqual(key_index.get_range_keys(self.connection, 1, 100), list(range(1, 6)))
+
+    def test_partition_keys(self):
+
+        self._insert(1, 20)
+
+        # Session별 Index는 Key를 Session 수로 나눈 나머지가 partition 번호와 같은 Key만 추출
+        key_sampler = KeySampler("test.conf", partitions=3)
+        key_sampler.load(self.connection, [self.table])
+
+        partition_keys = [sorted(key_sampler.get_index(self.table, partition_no).sample(self.connection, count))
+                          for partition_no, count in enumerate([6, 7, 7])]
+        self.assertEqual(partition_keys, [[key for key in range(1, 21) if key % 3 == partition_no]
+                                          for partition_no in range(3)])
+
+        key_sampler.save(self.connection)
+        self.assertEqual(KeyRegistry("test.conf", self.table.name).load(), list(range(1, 21)))
+
+    def test_committed_insert_of_other_session(self):
+
+        self._insert(1, 10)
+
+        key_sampler = KeySampler(partitions=2)
+        key_sampler.load(self.connection, [self.table])
+        first_index = key_sampler.get_index(self.table, 0)
+        second_index = key_sampler.get_index(self.table, 1)
+
+        # 첫 번째 Session이 Insert를 시작한 후 (Commit 전), 두 번째 Session이 더 큰 Key를 Insert 하고 조회
+        first_index.notify_insert()
+        second_index.notify_insert()
+        self._insert(13, 14)
+        self.assertEqual(second_index.get_range_keys(self.connection, 1, 100), [1, 3, 5, 7, 9, 13])
+        key_sampler.end_transaction(1, True)
+
+        # 첫 번째 Session의 Insert가 Commit된 이후에는 이미 조회한 최대 Key보다 작은 Key도 조회되어야 함
+        self._insert(11, 12)
+        key_sampler.end_transaction(0, True)
+        self.assertEqual(second_index.get_range_keys(self.connection, 1, 100), [1, 3, 5, 7, 9, 11, 13])
+        self.assertEqual(first_index.get_range_keys(self.connection, 1, 100), [2, 4, 6, 8, 10, 12, 14])
+
+    def test_rollback_transaction(self):
+
+        self._insert(1, 10)
+
+        key_sampler = KeySampler()
+        key_sampler.load(self.connection, [self.table])
+        key_index = key_sampler.get_index(self.table)
+
+        # Transaction에서 Insert, Delete 한 후 Rollback
+        transaction = self.connection.begin()
+        key_index.notify_insert()
+        self.connection.execute(self.table.insert(), [{"t_id": key} for key in range(11, 16)])
+        delete_keys = key_index.sample(self.connection, 3, remove=True)
+        self.connection.execute(self.table.delete().where(self.table.c.t_id.in_(delete_keys)))
+        transaction.rollback()
+        key_sampler.end_transaction(0, False)
+
+        # Rollback된 Insert Key는 제거되고 Delete된 Key는 다시 추가되어야 함
+        self.assertEqual(key_index.get_range_keys(self.connection, 1, 100), list(range(1, 11)))
+
+        # 이후 Commit한 Insert Key는 정상적으로 조회
+        transaction = self.connection.begin()
+        key_index.notify_insert()
+        self._insert(16, 17)
+        transaction.commit()
+        key_sampler.end_transaction(0, True)
+        self.assertEqual(key_index.get_range_keys(self.connection, 1, 100), list(range(1, 11)) + [16, 17])
+
+    def test_save_inserted_keys_of_other_partition(self):
+
+        self._insert(1, 10)
+
+        key_sampler = KeySampler("test.conf", partitions=2)
+        key_sampler.load(self.connection, [self.table])
+
+        # 각 Session이 Insert 후 Commit 했으나, 마지막 추출 이후 Insert된 Key도 저장되어야 함
+        key_sampler.get_index(self.table, 0).notify_insert()
+        self._insert(11, 14)
+        key_sampler.end_transaction(0, True)
+        key_sampler.get_index(self.table, 1).sample(self.connection, 1)
+
+        key_sampler.save(self.connection)
+        self.assertEqual(KeyRegistry("test.conf", self.table.name).load(), list(range(1, 15)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import os
+import sys
+import unittest
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+
+from commons.funcs_latency import LatencyHistogram
+
+
+class LatencyHistogramTest(unittest.TestCase):
+    """
+    Latency Histogram의 백분위수, 상한값별 누적 기록 수 확인
+    """
+
+    def test_cumulative_counts(self):
+
+        histogram = LatencyHistogram()
+
+        # precision_bits=7 기준 999us는 [992, 999], 1004us는 [1000, 1007] bucket에 기록
+        for seconds in [0.0004, 0.000999, 0.001004, 0.002]:
+            histogram.record(seconds)
+
+        # 상한값 (1000us)을 넘는 값이 포함된 bucket은 해당 상한값에 포함하지 않음
+        cumulative_counts, count, total = histogram.get_cumulative_counts([0.0005, 0.001, 0.0025])
+
+        self.assertEqual(cumulative_counts, [1, 2, 4])
+        self.assertEqual(count, 4)
+        self.assertAlmostEqual(total, 0.004403, places=5)
+
+    def test_cumulative_counts_bucket_end(self):
+
+        histogram = LatencyHistogram()
+        histogram.record(0.001007)
+
+        # bucket의 마지막 값이 상한값과 같으면 포함
+        self.assertEqual(histogram.get_cumulative_counts([0.001, 0.001007])[0], [0, 1])
+
+    def test_percentile(self):
+
+        histogram = LatencyHistogram()
+
+        for value in range(1, 101):
+            histogram.record(value / 1000)
+
+        self.assertAlmostEqual(histogram.get_percentile(50), 0.05, delta=0.05 / 128)
+        self.assertAlmostEqual(histogram.get_percentile(99), 0.099, delta=0.099 / 128)
+        self.assertEqual(histogram.get_percentile(100), 0.1)
+        self.assertIsNone(LatencyHistogram().get_percentile(50))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import os
+import sys
+import unittest
+from unittest import mock
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+
+from commons import funcs_ranbench
+from commons.funcs_ranbench import CommitPolicy, RateLimiter
+
+
+class _Clock:
+    """
+    time.perf_counter, time.sleep 대용. sleep 호출시 실제로 대기하지 않고 시각만 증가시킴
+    """
+
+    def __init__(self):
+        self.now = 100.0
+
+    def perf_counter(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class RateLimiterTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.clock = _Clock()
+
+        patcher = mock.patch.object(funcs_ranbench, "time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _wait_times(self, rate_limiter, record_counts):
+
+        wait_times = []
+        for record_count in record_counts:
+            rate_limiter.wait(record_count)
+            wait_times.append(round(self.clock.now - 100.0, 6))
+
+        return wait_times
+
+    def test_tps(self):
+        self.assertEqual(self._wait_times(RateLimiter(tps=10), [1] * 5), [0.0, 0.1, 0.2, 0.3, 0.4])
+
+    def test_rows_per_sec(self):
+        self.assertEqual(self._wait_times(RateLimiter(rows_per_sec=100), [50, 10, 10]), [0.0, 0.5, 0.6])
+
+    def test_tps_and_rows_per_sec(self):
+        # 두 속도 중 늦은 시점에 발생
+        self.assertEqual(self._wait_times(RateLimiter(tps=10, rows_per_sec=100), [50, 1, 1]), [0.0, 0.5, 0.6])
+
+    def test_max_burst(self):
+
+        rate_limiter = RateLimiter(tps=10, max_burst=0.2)
+        rate_limiter.wait(1)
+
+        # DB 지연으로 1초 뒤처진 경우 max_burst 만큼만 대기 없이 연속으로 발생
+        self.clock.now += 1.0
+        self.assertEqual(self._wait_times(rate_limiter, [1] * 5), [1.0, 1.0, 1.0, 1.1, 1.2])
+
+
+class CommitPolicyTest(unittest.TestCase):
+
+    def test_every_dml(self):
+
+        commit_policy = CommitPolicy(every_dml=3)
+
+        self.assertFalse(commit_policy.is_due(2, 100, 0))
+        self.assertTrue(commit_policy.is_due(3, 1, 0))
+
+    def test_every_rows(self):
+
+        commit_policy = CommitPolicy(every_rows=100)
+
+        self.assertFalse(commit_policy.is_due(5, 99, 0))
+        self.assertTrue(commit_policy.is_due(1, 100, 0))
+
+    def test_interval(self):
+
+        clock = _Clock()
+        commit_policy = CommitPolicy(interval=1.5)
+
+        with mock.patch.object(funcs_ranbench, "time", clock):
+            tx_start_time = clock.perf_counter()
+            clock.sleep(1.0)
+            self.assertFalse(commit_policy.is_due(1, 1, tx_start_time))
+            clock.sleep(0.5)
+            self.assertTrue(commit_policy.is_due(1, 1, tx_start_time))
+
+    def test_empty_transaction(self):
+        # DML을 수행하지 않은 Transaction은 Commit 하지 않음
+        self.assertFalse(CommitPolicy(every_dml=1, every_rows=1, interval=0).is_due(0, 0, 0))
+
+    def test_any_condition(self):
+
+        commit_policy = CommitPolicy(every_dml=10, every_rows=100)
+
+        self.assertTrue(commit_policy.is_due(10, 1, 0))
+        self.assertTrue(commit_policy.is_due(1, 100, 0))
+        self.assertFalse(commit_policy.is_due(9, 99, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()